@@ -26,6 +26,7 @@ import pyqtgraph as pg
 
 from .database_mongo import get_db
 from .config import GEMINI_MODELS, OPENROUTER_MODELS
+from .ui_utils import get_font, get_title_font
 
 
 # Build a lookup dict from model_id -> display_name
@@ -117,7 +118,7 @@ class AnalysisWidget(QWidget):
         # Header with refresh and export buttons
         header = QHBoxLayout()
         title = QLabel("Performance Analytics")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title.setFont(get_title_font())
         header.addWidget(title)
         header.addStretch()
 
@@ -244,12 +245,12 @@ class AnalysisWidget(QWidget):
 
             # Icon
             icon_label = QLabel(icon)
-            icon_label.setFont(QFont("Sans", 20))
+            icon_label.setFont(get_font("Sans", 20))
             icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             stat_vbox.addWidget(icon_label)
 
             value_label = QLabel("--")
-            value_label.setFont(QFont("Sans", 16, QFont.Weight.Bold))
+            value_label.setFont(get_font("Sans", 16, QFont.Weight.Bold))
             value_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
             stat_vbox.addWidget(value_label)
 
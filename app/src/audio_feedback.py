@@ -8,6 +8,13 @@ import struct
 import threading
 from typing import Optional
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
 # Try to use simpleaudio for playback (non-blocking)
 try:
     import simpleaudio as sa
@@ -22,6 +29,9 @@ try:
 except ImportError:
     HAS_PYAUDIO = False
 
+# 16-bit little-endian PCM sample
+_PCM16 = struct.Struct('<h')
+
 
 def generate_beep(frequency: int = 880, duration_ms: int = 100, volume: float = 0.3, sample_rate: int = 44100) -> bytes:
     """Generate a simple sine wave beep.
@@ -36,15 +46,30 @@ def generate_beep(frequency: int = 880, duration_ms: int = 100, volume: float =
         Raw audio data as bytes (16-bit mono PCM)
     """
     num_samples = int(sample_rate * duration_ms / 1000)
-    samples = []
-
+    # Simple envelope to avoid clicks (10ms fade in/out)
+    fade_samples = int(sample_rate * 0.01)
+
+    if NUMPY_AVAILABLE:
+        # Whole tone in one vectorized pass instead of a per-sample loop
+        i = np.arange(num_samples)
+        value = np.sin(2 * math.pi * frequency * (i / sample_rate))
+        envelope = np.ones(num_samples)
+        fade_in = i < fade_samples
+        envelope[fade_in] = i[fade_in] / fade_samples
+        fade_out = (i > num_samples - fade_samples) & ~fade_in
+        envelope[fade_out] = (num_samples - i[fade_out]) / fade_samples
+        # Scale to 16-bit and apply volume (astype truncates like int())
+        return (value * envelope * volume * 32767).astype('<i2').tobytes()
+
+    # Pack into one preallocated buffer rather than a bytes object per sample
+    samples = bytearray(num_samples * 2)
+    pack_into = _PCM16.pack_into
     for i in range(num_samples):
         # Generate sine wave
         t = i / sample_rate
         value = math.sin(2 * math.pi * frequency * t)
 
-        # Apply simple envelope to avoid clicks (fade in/out)
-        fade_samples = int(sample_rate * 0.01)  # 10ms fade
+        # Apply envelope
         if i < fade_samples:
             value *= i / fade_samples
         elif i > num_samples - fade_samples:
@@ -52,9 +77,9 @@ def generate_beep(frequency: int = 880, duration_ms: int = 100, volume: float =
 
         # Scale to 16-bit and apply volume
         sample = int(value * volume * 32767)
-        samples.append(struct.pack('<h', sample))
+        pack_into(samples, i * 2, sample)
 
-    return b''.join(samples)
+    return bytes(samples)
 
 
 def generate_double_beep(freq1: int = 880, freq2: int = 1100, duration_ms: int = 80, gap_ms: int = 50, volume: float = 0.3) -> bytes:
@@ -1,7 +1,17 @@
 """Audio processing utilities for compressing audio before API submission."""
 
 import io
+import struct
 import wave
+from typing import Optional
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None  # type: ignore
+    NUMPY_AVAILABLE = False
+
 from pydub import AudioSegment
 
 
@@ -67,6 +77,99 @@ def apply_agc(audio: AudioSegment) -> tuple[AudioSegment, dict]:
     return audio, stats
 
 
+def _make_wav_header(num_samples: int) -> bytes:
+    """44-byte RIFF header for 16kHz mono 16-bit PCM with num_samples samples."""
+    data_size = num_samples * 2
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, TARGET_CHANNELS, TARGET_SAMPLE_RATE,
+        TARGET_SAMPLE_RATE * TARGET_CHANNELS * 2, TARGET_CHANNELS * 2, 16,
+        b"data", data_size,
+    )
+
+
+def _print_agc_stats(agc_stats: dict):
+    """Log the gain applied by AGC, if any."""
+    if agc_stats["agc_applied"]:
+        print(f"AGC: Applied {agc_stats['gain_applied_db']}dB gain "
+              f"(peak: {agc_stats['original_peak_dbfs']:.1f}dB → {agc_stats['final_peak_dbfs']:.1f}dB)")
+
+
+def _peak_dbfs(peak: float) -> float:
+    """Peak level of 16-bit samples in dBFS (-inf for silence), as pydub reports it."""
+    if peak <= 0:
+        return float("-inf")
+    return 20 * np.log10(peak / 32768.0)
+
+
+def _compress_pcm16(
+    audio_data: bytes, frames: bytes, channels: int, sample_rate: int,
+    apply_gain_control: bool
+) -> bytes:
+    """NumPy version of compress_audio_for_api for 16-bit PCM frames.
+
+    Downmixes, resamples and applies AGC gain in one float pass, then rounds
+    back to int16 once. Resampling is linear interpolation, like the
+    audioop.ratecv conversion pydub uses. Audio that is already 16kHz mono
+    and needs no gain is returned as is.
+    """
+    samples = np.frombuffer(frames, dtype=np.int16).reshape(-1, channels)
+
+    gain_db = 0.0
+    if apply_gain_control:
+        # Same decisions as apply_agc, measured on the original samples
+        original_peak = _peak_dbfs(float(np.abs(samples, dtype=np.int32).max(initial=0)))
+        agc_stats = {
+            "original_peak_dbfs": original_peak,
+            "gain_applied_db": 0.0,
+            "agc_applied": False,
+        }
+        gain_needed = AGC_TARGET_PEAK_DBFS - original_peak
+        if original_peak >= AGC_MIN_PEAK_DBFS and gain_needed > 0:
+            gain_db = min(gain_needed, AGC_MAX_GAIN_DB)
+
+    if not gain_db and channels == TARGET_CHANNELS and sample_rate == TARGET_SAMPLE_RATE:
+        return audio_data
+
+    needs_resample = sample_rate != TARGET_SAMPLE_RATE and len(samples) > 1
+
+    # Convert to mono if stereo, summing channels in int32 so the mix can't
+    # overflow int16
+    if channels > 1:
+        mixed = samples.sum(axis=1, dtype=np.int32)
+        if not needs_resample and not gain_db:
+            # Downmix only: stay in integers all the way
+            out_samples = (mixed // channels).astype(np.int16)
+            return _make_wav_header(out_samples.size) + out_samples.tobytes()
+        mono = mixed.astype(np.float32)
+        mono /= np.float32(channels)
+    else:
+        mono = samples[:, 0].astype(np.float32)
+
+    # Resample to 16kHz if needed
+    if needs_resample:
+        n_out = max(1, int(round(len(mono) * TARGET_SAMPLE_RATE / sample_rate)))
+        positions = np.arange(n_out, dtype=np.float64) * (sample_rate / TARGET_SAMPLE_RATE)
+        mono = np.interp(positions, np.arange(len(mono)), mono).astype(np.float32)
+
+    if gain_db:
+        mono *= np.float32(10 ** (gain_db / 20))
+
+    out_samples = np.clip(np.rint(mono), -32768, 32767).astype(np.int16)
+
+    if apply_gain_control:
+        if gain_db:
+            agc_stats["gain_applied_db"] = round(gain_db, 1)
+            agc_stats["final_peak_dbfs"] = _peak_dbfs(
+                float(np.abs(out_samples, dtype=np.int32).max(initial=0))
+            )
+            agc_stats["agc_applied"] = True
+        _print_agc_stats(agc_stats)
+
+    return _make_wav_header(out_samples.size) + out_samples.tobytes()
+
+
 def compress_audio_for_api(audio_data: bytes, apply_gain_control: bool = True) -> bytes:
     """
     Compress audio to optimal format for API submission.
@@ -83,15 +186,34 @@ def compress_audio_for_api(audio_data: bytes, apply_gain_control: bool = True) -
     Returns:
         Compressed WAV audio bytes at 16kHz mono with normalized levels
     """
+    # Inspect the header first: 16kHz mono 16-bit audio that doesn't need
+    # AGC is already in the target format. Other 16-bit PCM (what the
+    # recorder produces) is processed directly with NumPy; anything else
+    # goes through pydub.
+    frames = None
+    try:
+        with wave.open(io.BytesIO(audio_data), 'rb') as wf:
+            channels = wf.getnchannels()
+            sample_rate = wf.getframerate()
+            sample_width = wf.getsampwidth()
+            if sample_width == 2:
+                if (not apply_gain_control and channels == TARGET_CHANNELS
+                        and sample_rate == TARGET_SAMPLE_RATE):
+                    return audio_data
+                if NUMPY_AVAILABLE:
+                    frames = wf.readframes(wf.getnframes())
+    except (wave.Error, EOFError):
+        pass
+    if frames is not None:
+        return _compress_pcm16(audio_data, frames, channels, sample_rate, apply_gain_control)
+
     # Load the audio from bytes
     audio = AudioSegment.from_wav(io.BytesIO(audio_data))
 
     # Apply AGC first (before any format conversion)
     if apply_gain_control:
         audio, agc_stats = apply_agc(audio)
-        if agc_stats["agc_applied"]:
-            print(f"AGC: Applied {agc_stats['gain_applied_db']}dB gain "
-                  f"(peak: {agc_stats['original_peak_dbfs']:.1f}dB → {agc_stats['final_peak_dbfs']:.1f}dB)")
+        _print_agc_stats(agc_stats)
 
     # Convert to mono if stereo
     if audio.channels > 1:
@@ -109,6 +231,54 @@ def compress_audio_for_api(audio_data: bytes, apply_gain_control: bool = True) -
     return compressed_data
 
 
+# Compressed upload codecs: pydub/ffmpeg export settings and the MIME type
+# sent to the provider. Both are tuned for speech, not music.
+UPLOAD_CODECS = {
+    "opus": {
+        "mime_type": "audio/ogg",
+        "bitrate": "24k",
+        "parameters": ["-application", "voip"],
+    },
+    "mp3": {
+        "mime_type": "audio/mpeg",
+        "bitrate": "32k",
+        "parameters": [],
+    },
+}
+
+
+def encode_audio_for_api(audio_data: bytes, codec: str) -> Optional[bytes]:
+    """
+    Encode compressed WAV audio with a lossy speech codec for upload.
+
+    Opus uses the same settings as archive_audio (~24kbps, voip mode) and
+    MP3 runs at 32kbps; either is roughly a tenth of the size of 16kHz
+    mono PCM, which shrinks both the base64 step and the request body.
+
+    Args:
+        audio_data: WAV bytes from compress_audio_for_api
+        codec: Key into UPLOAD_CODECS ("opus" or "mp3")
+
+    Returns:
+        Encoded bytes, or None if encoding failed (e.g. ffmpeg without the
+        encoder) so the caller can upload the WAV instead
+    """
+    settings = UPLOAD_CODECS[codec]
+    try:
+        audio = AudioSegment.from_wav(io.BytesIO(audio_data))
+        buffer = io.BytesIO()
+        audio.export(
+            buffer,
+            format=codec,
+            bitrate=settings["bitrate"],
+            parameters=settings["parameters"]
+        )
+        return buffer.getvalue()
+    except Exception as e:
+        print(f"{codec} encoding failed, uploading WAV: {e}")
+        return None
+
+
 def get_audio_info(audio_data: bytes) -> dict:
     """
     Get information about audio data.
@@ -119,6 +289,27 @@ def get_audio_info(audio_data: bytes) -> dict:
     Returns:
         Dictionary with audio properties
     """
+    # Canonical 44-byte PCM header (what the recorder and our own encoders
+    # write): read the fields straight out of it
+    if len(audio_data) >= 44:
+        (riff, _, wave_id, fmt_id, fmt_size, audio_format, channels, sample_rate,
+         _, block_align, bits, data_id, data_size) = struct.unpack_from(
+            "<4sI4s4sIHHIIHH4sI", audio_data
+        )
+        if (riff == b"RIFF" and wave_id == b"WAVE" and fmt_id == b"fmt "
+                and fmt_size == 16 and audio_format == 1 and data_id == b"data"
+                and block_align):
+            frames = data_size // block_align
+            return {
+                "channels": channels,
+                "sample_rate": sample_rate,
+                "sample_width": (bits + 7) // 8,
+                "frames": frames,
+                "duration_seconds": frames / sample_rate,
+                "size_bytes": len(audio_data),
+            }
+
+    # Anything else (extra chunks, extensible format): let wave find the chunks
     with wave.open(io.BytesIO(audio_data), 'rb') as wf:
         return {
             "channels": wf.getnchannels(),
@@ -1,9 +1,9 @@
 """Audio recording functionality using PyAudio."""
 
-import io
 import logging
-import wave
+import struct
 import threading
+import time
 from typing import Optional, Callable
 import pyaudio
 
@@ -18,6 +18,8 @@ class AudioRecorder:
     CHANNELS = 1
     # Common sample rates to try, in order of preference
     SAMPLE_RATES = [48000, 44100, 22050, 16000]
+    # Seconds an input device enumeration stays valid
+    DEVICE_CACHE_TTL = 5.0
 
     def __init__(self, sample_rate: int = 48000):
         self.sample_rate = sample_rate
@@ -33,15 +35,35 @@ class AudioRecorder:
         # Callback for error notifications (mic disconnect, etc.)
         self.on_error: Optional[Callable[[str], None]] = None
         self._error_occurred = False
+        # Cached input device list and when it was enumerated
+        self._devices_cache: Optional[list[tuple[int, str]]] = None
+        self._devices_cached_at = 0.0
+
+    def get_input_devices(self, refresh: bool = False) -> list[tuple[int, str]]:
+        """Get list of available input devices.
+
+        Enumeration goes through the audio driver, so the result is cached
+        for DEVICE_CACHE_TTL seconds.
+
+        Args:
+            refresh: Rescan even if the cached list is still fresh
+        """
+        now = time.monotonic()
+        if (
+            not refresh
+            and self._devices_cache is not None
+            and now - self._devices_cached_at < self.DEVICE_CACHE_TTL
+        ):
+            return list(self._devices_cache)
 
-    def get_input_devices(self) -> list[tuple[int, str]]:
-        """Get list of available input devices."""
         devices = []
         for i in range(self.audio.get_device_count()):
             info = self.audio.get_device_info_by_index(i)
             if info["maxInputChannels"] > 0:
                 devices.append((i, info["name"]))
-        return devices
+        self._devices_cache = devices
+        self._devices_cached_at = now
+        return list(devices)
 
     def set_device(self, device_index: Optional[int]) -> None:
         """Set the input device to use."""
@@ -49,7 +71,12 @@ class AudioRecorder:
 
     def _get_supported_sample_rate(self, device_index: Optional[int]) -> int:
         """Find a supported sample rate for the device."""
-        # Try to get device's default sample rate first
+        # Capture at the requested rate when the device (or the sound server
+        # in front of it) accepts it, so nothing needs resampling later
+        if self._test_sample_rate(device_index, self.sample_rate):
+            return self.sample_rate
+
+        # Otherwise try the device's default sample rate
         if device_index is not None:
             try:
                 info = self.audio.get_device_info_by_index(device_index)
@@ -189,14 +216,27 @@ class AudioRecorder:
         return self._frames_to_wav()
 
     def _frames_to_wav(self) -> bytes:
-        """Convert recorded frames to WAV format."""
-        buffer = io.BytesIO()
-        with wave.open(buffer, "wb") as wf:
-            wf.setnchannels(self.CHANNELS)
-            wf.setsampwidth(self.audio.get_sample_size(self.FORMAT))
-            wf.setframerate(self.actual_sample_rate)
-            wf.writeframes(b"".join(self.frames))
-        return buffer.getvalue()
+        """Convert recorded frames to WAV format.
+
+        The header is packed up front and joined with the frames in a single
+        allocation, rather than joining the PCM and then copying it again
+        through a wave writer and BytesIO.
+        """
+        with self._lock:
+            frames = list(self.frames)
+
+        sample_width = self.audio.get_sample_size(self.FORMAT)
+        data_size = sum(len(frame) for frame in frames)
+        block_align = self.CHANNELS * sample_width
+        header = struct.pack(
+            "<4sI4s4sIHHIIHH4sI",
+            b"RIFF", 36 + data_size, b"WAVE",
+            b"fmt ", 16, 1, self.CHANNELS, self.actual_sample_rate,
+            self.actual_sample_rate * block_align, block_align, sample_width * 8,
+            b"data", data_size,
+        )
+        frames.insert(0, header)
+        return b"".join(frames)
 
     def clear(self) -> None:
         """Clear recorded audio."""
@@ -4,13 +4,21 @@ Provides Wayland-compatible clipboard operations with Qt fallback.
 """
 
 import logging
+import shutil
 import subprocess
+from functools import lru_cache
 
 from PyQt6.QtWidgets import QApplication
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _has_command(name: str) -> bool:
+    """Whether a command is on PATH, looked up once per session."""
+    return shutil.which(name) is not None
+
+
 def copy_to_clipboard(text: str) -> bool:
     """Copy text to clipboard using wl-copy (Wayland-native) with Qt fallback.
 
@@ -21,6 +29,8 @@ def copy_to_clipboard(text: str) -> bool:
         True if copy was successful, False otherwise
     """
     # Try wl-copy first for reliable Wayland clipboard
+    if not _has_command("wl-copy"):
+        return _qt_copy(text)
     try:
         process = subprocess.Popen(
             ["wl-copy"],
@@ -35,6 +45,11 @@ def copy_to_clipboard(text: str) -> bool:
         logger.debug(f"wl-copy failed: {e}, falling back to Qt clipboard")
 
     # Fallback to Qt clipboard
+    return _qt_copy(text)
+
+
+def _qt_copy(text: str) -> bool:
+    """Copy text using the Qt clipboard."""
     try:
         clipboard = QApplication.clipboard()
         clipboard.setText(text)
@@ -51,6 +66,8 @@ def get_clipboard_text() -> str:
         Clipboard text content, or empty string if clipboard is empty or error
     """
     # Try wl-paste first for reliable Wayland clipboard
+    if not _has_command("wl-paste"):
+        return _qt_paste()
     try:
         result = subprocess.run(
             ["wl-paste", "--no-newline"],
@@ -68,6 +85,11 @@ def get_clipboard_text() -> str:
         logger.debug(f"wl-paste failed: {e}, falling back to Qt clipboard")
 
     # Fallback to Qt clipboard
+    return _qt_paste()
+
+
+def _qt_paste() -> str:
+    """Read text from the Qt clipboard."""
     try:
         clipboard = QApplication.clipboard()
         return clipboard.text() or ""
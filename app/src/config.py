@@ -1,9 +1,11 @@
 """Configuration management for Voice Notepad V3."""
 
+import copy
 import json
 import os
+import threading
 from pathlib import Path
-from dataclasses import dataclass, asdict, field
+from dataclasses import dataclass, field, fields
 from typing import Optional
 
 
@@ -15,6 +17,19 @@ CONFIG_DIR = Path.home() / ".config" / "voice-notepad-v3"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 
 
+def write_json_atomic(path: Path, data) -> None:
+    """Write data as JSON, replacing the file in one atomic rename.
+
+    The JSON is serialized up front and written to a temp file next to the
+    target, so a crash mid-write can't leave a truncated file behind.
+    """
+    payload = json.dumps(data, indent=2).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(payload)
+    os.replace(tmp_path, path)
+
+
 # Available models per provider (model_id, display_name)
 # Gemini Direct (recommended) - uses Google's dynamic "latest" endpoint
 GEMINI_MODELS = [
@@ -35,6 +50,10 @@ OPENROUTER_MODELS = [
     ("google/gemini-3-flash-preview", "Gemini 3 Flash (Preview)"),
 ]
 
+# Comma-separated display names, for model lists shown in the UI
+GEMINI_MODEL_NAMES_TEXT = ", ".join(name for _, name in GEMINI_MODELS)
+OPENROUTER_MODEL_NAMES_TEXT = ", ".join(name for _, name in OPENROUTER_MODELS)
+
 # Standard and Budget model tiers per provider
 # These define which models the quick-toggle buttons select
 MODEL_TIERS = {
@@ -136,6 +155,9 @@ class Config:
     fallback_mic_name: str = ""        # Fallback device name
     fallback_mic_nickname: str = ""    # Fallback nickname
 
+    # Output device for TTS announcements, by name ("" = system default)
+    audio_output_device: str = ""
+
     # UI settings
     window_width: int = 850
     window_height: int = 800
@@ -299,6 +321,25 @@ class Config:
     prompt_stack_collapsed: bool = True  # Whether the prompt stack is collapsed (default: collapsed)
 
 
+# Config field names, and the subset holding lists (the only mutable values)
+_CONFIG_FIELDS = tuple(f.name for f in fields(Config))
+_CONFIG_FIELD_SET = frozenset(_CONFIG_FIELDS)
+_CONFIG_LIST_FIELDS = tuple(f.name for f in fields(Config) if f.default_factory is list)
+
+
+def _config_to_settings(config: Config) -> dict:
+    """Flat settings document for a Config.
+
+    Equivalent to dataclasses.asdict for this flat dataclass, without its
+    recursive deep copy: only the list fields are copied, so the document
+    doesn't share mutable values with the live config.
+    """
+    settings = {name: getattr(config, name) for name in _CONFIG_FIELDS}
+    for name in _CONFIG_LIST_FIELDS:
+        settings[name] = list(settings[name])
+    return settings
+
+
 def _apply_migrations(config: Config) -> Config:
     """Apply any necessary field migrations to a Config object."""
     # Migration: copy selected_microphone to preferred_mic_name if not set
@@ -426,8 +467,7 @@ def _load_from_json() -> Optional[Config]:
         with open(CONFIG_FILE, "r") as f:
             data = json.load(f)
         # Filter to only known fields to handle schema changes gracefully
-        known_fields = {f.name for f in Config.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _CONFIG_FIELD_SET}
         return Config(**filtered_data)
     except (json.JSONDecodeError, TypeError) as e:
         print(f"Warning: Could not load JSON config: {e}")
@@ -453,7 +493,7 @@ def _migrate_json_to_db() -> Optional[Config]:
         from database_mongo import get_db
 
     db = get_db()
-    if db.save_settings(asdict(config)):
+    if db.save_settings(_config_to_settings(config)):
         # Successfully migrated - rename old JSON file as backup
         backup_file = CONFIG_FILE.with_suffix('.json.migrated')
         try:
@@ -475,8 +515,15 @@ def load_config() -> Config:
     3. If neither exists, return default config
 
     All settings are now stored in the Mongita database for better
-    reliability and consistency with transcript storage.
+    reliability and consistency with transcript storage. Once this process
+    has loaded or saved the settings it knows what is stored, so later
+    calls build the config from that instead of querying the database.
     """
+    with _save_lock:
+        stored = copy.deepcopy(_last_saved_settings)
+    if stored is not None:
+        return _apply_migrations(Config(**{k: v for k, v in stored.items() if k in _CONFIG_FIELD_SET}))
+
     CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
     try:
@@ -490,9 +537,9 @@ def load_config() -> Config:
     if db.settings_exist():
         data = db.get_settings()
         # Filter to only known fields to handle schema changes gracefully
-        known_fields = {f.name for f in Config.__dataclass_fields__.values()}
-        filtered_data = {k: v for k, v in data.items() if k in known_fields}
+        filtered_data = {k: v for k, v in data.items() if k in _CONFIG_FIELD_SET}
         config = Config(**filtered_data)
+        _remember_saved_settings(filtered_data)
         return _apply_migrations(config)
 
     # Check for legacy JSON config and migrate
@@ -507,17 +554,54 @@ def load_config() -> Config:
     return config
 
 
+# Settings as last stored in the database, so saves only write changed fields
+_last_saved_settings: Optional[dict] = None
+_save_lock = threading.Lock()
+
+
+def _remember_saved_settings(settings: dict) -> None:
+    """Record the settings document currently stored in the database."""
+    global _last_saved_settings
+    with _save_lock:
+        _last_saved_settings = dict(settings)
+
+
 def save_config(config: Config) -> None:
-    """Save configuration to Mongita database."""
-    CONFIG_DIR.mkdir(parents=True, exist_ok=True)
+    """Save configuration to Mongita database.
 
-    try:
-        from .database_mongo import get_db
-    except ImportError:
-        from database_mongo import get_db
+    The first save writes the full settings document; later saves only
+    update the fields that differ from what was last stored, and skip the
+    write entirely when nothing changed.
+    """
+    settings = _config_to_settings(config)
+
+    global _last_saved_settings
+    with _save_lock:
+        if _last_saved_settings is None:
+            changes = None
+        else:
+            changes = {
+                key: value
+                for key, value in settings.items()
+                if key not in _last_saved_settings or _last_saved_settings[key] != value
+            }
+            if not changes:
+                return
+
+        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 
-    db = get_db()
-    db.save_settings(asdict(config))
+        try:
+            from .database_mongo import get_db
+        except ImportError:
+            from database_mongo import get_db
+
+        db = get_db()
+        if changes is None:
+            saved = db.save_settings(settings)
+        else:
+            saved = db.update_settings(changes)
+        if saved:
+            _last_saved_settings = settings
 
 
 def load_env_keys(config: Config) -> Config:
@@ -0,0 +1,85 @@
+"""Background config writer.
+
+Settings edits update the in-memory Config immediately; persisting it is
+handed off to a single writer thread so database writes never block the
+GUI thread. Requests are coalesced: only the most recent snapshot is
+written, and a single thread keeps writes in order so an older snapshot
+can never overwrite a newer one.
+"""
+
+import copy
+import threading
+from typing import Optional
+
+from .config import Config, save_config
+
+
+class ConfigWriter:
+    """Writes config snapshots to the database from a background thread."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Optional[Config] = None
+        self._wake = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+
+        self._thread = threading.Thread(
+            target=self._run, name="config-writer", daemon=True
+        )
+        self._thread.start()
+
+    def request_save(self, config: Config):
+        """Queue a save of the given config and return immediately.
+
+        Args:
+            config: Config to persist. A snapshot is taken now, so later
+                edits on the GUI thread don't race with the write.
+        """
+        snapshot = copy.deepcopy(config)
+        with self._lock:
+            self._pending = snapshot
+            self._idle.clear()
+        self._wake.set()
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Block until all queued saves have been written.
+
+        Returns:
+            True if the writer became idle within the timeout
+        """
+        return self._idle.wait(timeout)
+
+    def _run(self):
+        """Writer thread loop."""
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+
+            with self._lock:
+                snapshot, self._pending = self._pending, None
+
+            if snapshot is not None:
+                try:
+                    save_config(snapshot)
+                except Exception as e:
+                    print(f"Failed to save config: {e}")
+
+            with self._lock:
+                if self._pending is None:
+                    self._idle.set()
+
+
+# Global instance with thread-safe initialization
+_writer: Optional[ConfigWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_config_writer() -> ConfigWriter:
+    """Get the global config writer instance (thread-safe)."""
+    global _writer
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                _writer = ConfigWriter()
+    return _writer
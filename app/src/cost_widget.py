@@ -24,6 +24,7 @@ from PyQt6.QtGui import QFont
 
 from .database_mongo import get_db
 from .config import load_config
+from .ui_utils import get_font, get_title_font
 
 
 class BigStatCard(QFrame):
@@ -51,7 +52,7 @@ class BigStatCard(QFrame):
 
         # Value
         self.value_label = QLabel("--")
-        self.value_label.setFont(QFont("Sans", 24, QFont.Weight.Bold))
+        self.value_label.setFont(get_font("Sans", 24, QFont.Weight.Bold))
         self.value_label.setStyleSheet("color: #212529;")
         layout.addWidget(self.value_label)
 
@@ -88,7 +89,7 @@ class CostWidget(QWidget):
         # Header
         header = QHBoxLayout()
         title = QLabel("API Cost Tracking (OpenRouter Only)")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title.setFont(get_title_font())
         header.addWidget(title)
         header.addStretch()
 
@@ -5,14 +5,23 @@ Provides identical API to the old database.py for easy migration.
 """
 
 import csv
+import json
 import threading
+from itertools import islice
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable
 
 from mongita import MongitaClientDisk
 
+# orjson is optional; it speeds up large JSON exports
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 
 # Database directory
 DB_DIR = Path.home() / ".config" / "voice-notepad-v3"
@@ -20,6 +29,9 @@ MONGO_DIR = DB_DIR / "mongita"
 AUDIO_ARCHIVE_DIR = DB_DIR / "audio-archive"
 CSV_EXPORT_FILE = DB_DIR / "transcription_history.csv"
 
+# Documents read per database-lock hold during a JSON export
+EXPORT_BATCH_SIZE = 500
+
 
 @dataclass
 class TranscriptionRecord:
@@ -295,7 +307,13 @@ class TranscriptionDB:
                 return False
 
     def delete_all(self) -> int:
-        """Delete all transcriptions. Returns count of deleted records."""
+        """Delete all transcriptions. Returns count of deleted records.
+
+        Also empties the file-transcription result cache, which holds
+        transcript text outside the database.
+        """
+        from .transcription_cache import clear_cache
+
         with self._lock:
             db = self._get_db()
 
@@ -304,7 +322,9 @@ class TranscriptionDB:
                 audio_file.unlink()
 
             result = db.transcriptions.delete_many({})
-            return result.deleted_count
+
+        clear_cache()
+        return result.deleted_count
 
     def get_storage_stats(self) -> dict:
         """Get storage statistics."""
@@ -671,6 +691,85 @@ class TranscriptionDB:
 
         return filepath, record_count
 
+    def export_to_json(
+        self,
+        filepath: Path,
+        pretty: bool = False,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        progress_interval: int = 100,
+    ) -> int:
+        """Export all transcriptions to a JSON array file.
+
+        Documents are read from the cursor in batches of EXPORT_BATCH_SIZE
+        and encoded and written outside the database lock, so the full
+        history is never held in memory and other callers only wait for
+        one batch read at a time. Uses orjson
+        when it is installed, otherwise the standard json module.
+
+        Args:
+            filepath: Destination file
+            pretty: Indent the output instead of writing compact JSON
+            progress_callback: Called with the number of records written so far
+            progress_interval: Records between progress callbacks
+
+        Returns:
+            Number of records written
+        """
+        record_sep = b',\n' if pretty else b','
+        if HAS_ORJSON:
+            option = orjson.OPT_NON_STR_KEYS
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+
+            def encode(doc):
+                return orjson.dumps(doc, default=str, option=option)
+        else:
+            # One encoder for the whole export; json.dumps() with custom
+            # arguments would construct a new one per document
+            if pretty:
+                encoder = json.JSONEncoder(default=str, ensure_ascii=False, indent=2)
+            else:
+                encoder = json.JSONEncoder(
+                    default=str, ensure_ascii=False, separators=(',', ':')
+                )
+
+            def encode(doc):
+                return encoder.encode(doc).encode('utf-8')
+
+        record_count = 0
+
+        def records(batch):
+            """Yield encoded documents with separators, reporting progress."""
+            nonlocal record_count
+            for doc in batch:
+                if '_id' in doc:
+                    doc['_id'] = str(doc['_id'])
+                if record_count:
+                    yield record_sep
+                yield encode(doc)
+                record_count += 1
+                if progress_callback and record_count % progress_interval == 0:
+                    progress_callback(record_count)
+
+        with self._lock:
+            cursor = self._get_db().transcriptions.find({})
+
+        with open(filepath, 'wb', buffering=65536) as f:
+            f.write(b'[')
+            while True:
+                # Hold the lock only while pulling a batch off the cursor;
+                # encoding and writing happen without it, so GUI-thread
+                # calls (saves, counts) aren't stalled for the whole export
+                with self._lock:
+                    batch = [doc for doc in islice(cursor, EXPORT_BATCH_SIZE) if doc]
+                if not batch:
+                    break
+                f.writelines(records(batch))
+            f.write(b']')
+        if progress_callback:
+            progress_callback(record_count)
+        return record_count
+
     def vacuum(self) -> bool:
         """Optimize database (Mongita equivalent of SQLite VACUUM).
 
@@ -1,6 +1,8 @@
 """File transcription tab widget for transcribing audio files from disk."""
 
 import io
+import mmap
+import struct
 from pathlib import Path
 from typing import Optional
 
@@ -30,7 +32,7 @@ from .transcription import get_client, TranscriptionResult
 from .markdown_widget import MarkdownTextWidget
 from .audio_feedback import get_feedback
 from .database_mongo import get_db, AUDIO_ARCHIVE_DIR
-from .ui_utils import get_provider_icon, get_model_icon
+from .ui_utils import get_provider_icon, get_model_icon, get_title_font
 from .clipboard import copy_to_clipboard as clipboard_copy
 
 
@@ -48,6 +50,82 @@ SUPPORTED_FORMATS = {
 }
 
 
+# fmt chunk format tags
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+
+def _parse_wav_header(buf) -> Optional[dict]:
+    """Walk a WAV file's RIFF chunks in place and describe its PCM data.
+
+    Handles extra chunks (LIST, fact, ...) before the data chunk and
+    WAVE_FORMAT_EXTENSIBLE headers with a PCM sub-format. Only the chunk
+    headers are touched, never the samples.
+
+    Args:
+        buf: Buffer holding the file (e.g. an mmap)
+
+    Returns:
+        Dict with channels, sample_rate, sample_width, frames and
+        duration_seconds, or None if this isn't PCM WAV
+    """
+    if buf[0:4] != b"RIFF" or buf[8:12] != b"WAVE":
+        return None
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(buf):
+        chunk_id = buf[offset:offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", buf, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            audio_format, channels, sample_rate, _, block_align, bits = (
+                struct.unpack_from("<HHIIHH", buf, body)
+            )
+            if audio_format == WAVE_FORMAT_EXTENSIBLE and chunk_size >= 40:
+                # Sub-format GUID starts with the real format tag
+                (audio_format,) = struct.unpack_from("<H", buf, body + 24)
+            if audio_format != WAVE_FORMAT_PCM:
+                return None
+            fmt = (channels, sample_rate, block_align, bits)
+        elif chunk_id == b"data" and fmt is not None:
+            channels, sample_rate, block_align, bits = fmt
+            frames = min(chunk_size, len(buf) - body) // block_align
+            return {
+                "channels": channels,
+                "sample_rate": sample_rate,
+                "sample_width": (bits + 7) // 8,
+                "frames": frames,
+                "duration_seconds": frames / sample_rate,
+            }
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    return None
+
+
+def _probe_wav(file_path: str) -> Optional[dict]:
+    """Read a WAV file's format and duration from its header.
+
+    The file is memory-mapped and its chunk headers parsed in place, so
+    only those pages are read in rather than decoding the whole file
+    through ffmpeg.
+
+    Returns:
+        _parse_wav_header() dict, or None if the file isn't a readable PCM
+        WAV (the caller falls back to pydub)
+    """
+    if Path(file_path).suffix.lower() != ".wav":
+        return None
+    try:
+        with open(file_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _parse_wav_header(mm)
+    except (OSError, ValueError, struct.error, ZeroDivisionError):
+        # Includes empty files (mmap of length 0) and zero rates/block sizes
+        return None
+
+
 class FileTranscriptionWorker(QThread):
     """Worker thread for file transcription."""
 
@@ -78,49 +156,36 @@ class FileTranscriptionWorker(QThread):
         self.vad_duration: Optional[float] = None
 
     def run(self):
-        import time
-
         try:
             # Step 1: Load audio file
             self.status.emit("Loading audio file...")
             self.progress.emit(10)
 
-            audio = AudioSegment.from_file(self.file_path)
-            self.original_duration = len(audio) / 1000.0  # ms to seconds
+            wav_info = _probe_wav(self.file_path)
+            if wav_info is not None:
+                # Already PCM WAV: feed the file to the pipeline as-is
+                self.original_duration = wav_info["duration_seconds"]
+                audio_data = Path(self.file_path).read_bytes()
+            else:
+                audio = AudioSegment.from_file(self.file_path)
+                self.original_duration = len(audio) / 1000.0  # ms to seconds
 
-            # Convert to WAV bytes for pipeline
-            wav_buffer = io.BytesIO()
-            audio.export(wav_buffer, format="wav")
-            audio_data = wav_buffer.getvalue()
+                # Convert to WAV bytes for pipeline
+                wav_buffer = io.BytesIO()
+                audio.export(wav_buffer, format="wav")
+                audio_data = wav_buffer.getvalue()
+                del audio, wav_buffer
 
             self.progress.emit(30)
 
-            # Step 2: Apply VAD if enabled
-            if self.vad_enabled and is_vad_available():
-                self.status.emit("Removing silence...")
-                try:
-                    audio_data, orig_dur, vad_dur = remove_silence(audio_data)
-                    self.vad_duration = vad_dur
-                    self.vad_complete.emit(orig_dur, vad_dur)
-                    if vad_dur < orig_dur:
-                        reduction = (1 - vad_dur / orig_dur) * 100
-                        print(f"VAD: Reduced audio from {orig_dur:.1f}s to {vad_dur:.1f}s ({reduction:.0f}% reduction)")
-                except Exception as e:
-                    print(f"VAD failed, using original audio: {e}")
-
-            self.progress.emit(50)
-
-            # Step 3: Compress audio
-            self.status.emit("Compressing audio...")
-            compressed_audio = compress_audio_for_api(audio_data)
-            self.progress.emit(70)
-
-            # Step 4: Transcribe
-            self.status.emit("Transcribing...")
-            start_time = time.time()
+            # Same file through the same prompt and model reuses the result
             client = get_client(self.provider, self.api_key, self.model)
-            result = client.transcribe(compressed_audio, self.prompt)
-            self.inference_time_ms = int((time.time() - start_time) * 1000)
+            result = client.transcribe_cached(
+                audio_data,
+                self.prompt,
+                lambda: self._process_and_transcribe(client, audio_data),
+                self.vad_enabled,
+            )
 
             self.progress.emit(100)
             self.finished.emit(result)
@@ -128,6 +193,37 @@ class FileTranscriptionWorker(QThread):
         except Exception as e:
             self.error.emit(str(e))
 
+    def _process_and_transcribe(self, client, audio_data: bytes) -> TranscriptionResult:
+        """Run VAD and compression, then call the provider (steps 2-4)."""
+        import time
+
+        # Step 2: Apply VAD if enabled
+        if self.vad_enabled and is_vad_available():
+            self.status.emit("Removing silence...")
+            try:
+                audio_data, orig_dur, vad_dur = remove_silence(audio_data)
+                self.vad_duration = vad_dur
+                self.vad_complete.emit(orig_dur, vad_dur)
+                if vad_dur < orig_dur:
+                    reduction = (1 - vad_dur / orig_dur) * 100
+                    print(f"VAD: Reduced audio from {orig_dur:.1f}s to {vad_dur:.1f}s ({reduction:.0f}% reduction)")
+            except Exception as e:
+                print(f"VAD failed, using original audio: {e}")
+
+        self.progress.emit(50)
+
+        # Step 3: Compress audio
+        self.status.emit("Compressing audio...")
+        compressed_audio = compress_audio_for_api(audio_data)
+        self.progress.emit(70)
+
+        # Step 4: Transcribe
+        self.status.emit("Transcribing...")
+        start_time = time.time()
+        result = client.transcribe(compressed_audio, self.prompt)
+        self.inference_time_ms = int((time.time() - start_time) * 1000)
+        return result
+
 
 class FileTranscriptionWidget(QWidget):
     """Widget for transcribing audio files from disk."""
@@ -155,7 +251,7 @@ class FileTranscriptionWidget(QWidget):
 
         # Title
         title = QLabel("File Transcription (Upload Audio)")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title.setFont(get_title_font())
         layout.addWidget(title)
 
         # Description
@@ -420,13 +516,20 @@ class FileTranscriptionWidget(QWidget):
 
         # Get and display audio info
         try:
-            audio = AudioSegment.from_file(file_path)
-            duration = len(audio) / 1000.0
+            wav_info = _probe_wav(file_path)
+            if wav_info is not None:
+                duration = wav_info["duration_seconds"]
+                num_channels = wav_info["channels"]
+                sample_rate = wav_info["sample_rate"]
+            else:
+                audio = AudioSegment.from_file(file_path)
+                duration = len(audio) / 1000.0
+                num_channels = audio.channels
+                sample_rate = audio.frame_rate
             self.selected_file_duration = duration  # Store for short audio optimization
             mins = int(duration // 60)
             secs = int(duration % 60)
-            channels = "stereo" if audio.channels == 2 else "mono"
-            sample_rate = audio.frame_rate
+            channels = "stereo" if num_channels == 2 else "mono"
 
             self.audio_info_label.setText(
                 f"Duration: {mins}:{secs:02d} | {sample_rate}Hz | {channels} | {SUPPORTED_FORMATS.get(ext, ext)}"
@@ -519,6 +622,23 @@ class FileTranscriptionWidget(QWidget):
         """Handle completed transcription."""
         self.text_output.setMarkdown(result.text)
 
+        # A cache hit repeats a call already in history; saving it again
+        # would add a zero-latency, zero-token entry to the analytics
+        if not result.cached:
+            self._save_to_history(result)
+
+        # Reset UI
+        self.progress_bar.setVisible(False)
+        self.transcribe_btn.setEnabled(True)
+        self.browse_btn.setEnabled(True)
+        self.status_label.setText("Complete!")
+        self.status_label.setStyleSheet("color: #28a745; font-weight: bold;")
+
+        # Auto-copy to clipboard
+        self.copy_to_clipboard()
+
+    def _save_to_history(self, result: TranscriptionResult):
+        """Record the transcription (and optionally its audio) in history."""
         # Get provider/model info from File tab's own selection
         provider = self._get_selected_provider()
         model = self._get_selected_model()
@@ -577,16 +697,6 @@ class FileTranscriptionWidget(QWidget):
             source_path=self.selected_file,
         )
 
-        # Reset UI
-        self.progress_bar.setVisible(False)
-        self.transcribe_btn.setEnabled(True)
-        self.browse_btn.setEnabled(True)
-        self.status_label.setText("Complete!")
-        self.status_label.setStyleSheet("color: #28a745; font-weight: bold;")
-
-        # Auto-copy to clipboard
-        self.copy_to_clipboard()
-
     def on_transcription_error(self, error: str):
         """Handle transcription error."""
         self.progress_bar.setVisible(False)
@@ -597,10 +707,9 @@ class FileTranscriptionWidget(QWidget):
 
     def update_word_count(self):
         """Update word count display."""
-        text = self.text_output.toPlainText()
-        if text:
-            words = len(text.split())
-            chars = len(text)
+        if not self.text_output.isEmpty():
+            words = self.text_output.wordCount()
+            chars = self.text_output.characterCount()
             self.word_count_label.setText(f"{words} words, {chars} characters")
         else:
             self.word_count_label.setText("")
@@ -13,11 +13,11 @@ from PyQt6.QtWidgets import (
     QApplication,
 )
 from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
 
 from .database_mongo import get_db, TranscriptionRecord
 from .audio_feedback import get_feedback
 from .config import Config
+from .ui_utils import get_title_font
 
 
 def format_relative_time(timestamp_str: str) -> str:
@@ -202,7 +202,7 @@ class HistoryWidget(QWidget):
         header = QHBoxLayout()
 
         title = QLabel("Transcriptions")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title.setFont(get_title_font())
         header.addWidget(title)
 
         header.addStretch()
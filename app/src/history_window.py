@@ -82,32 +82,35 @@ def get_preview_text(text: str, max_chars: int = 80) -> str:
 class DateDivider(QFrame):
     """A horizontal divider with a date label for separating days in history."""
 
+    # One sheet styles both rules and the label, instead of one per child
+    STYLE = """
+        QFrame#hline { background-color: #ccc; }
+        QLabel { color: #666; font-size: 10px; font-weight: bold; }
+    """
+
     def __init__(self, label_text: str, parent=None):
         super().__init__(parent)
         self.setup_ui(label_text)
 
     def setup_ui(self, label_text: str):
         self.setFixedHeight(28)
+        self.setStyleSheet(self.STYLE)
 
         layout = QHBoxLayout(self)
         layout.setContentsMargins(0, 6, 0, 4)
         layout.setSpacing(8)
 
-        left_line = QFrame()
-        left_line.setFrameShape(QFrame.Shape.HLine)
-        left_line.setStyleSheet("background-color: #ccc;")
-        left_line.setFixedHeight(1)
-        layout.addWidget(left_line, 1)
-
-        label = QLabel(label_text)
-        label.setStyleSheet("color: #666; font-size: 10px; font-weight: bold;")
-        layout.addWidget(label)
-
-        right_line = QFrame()
-        right_line.setFrameShape(QFrame.Shape.HLine)
-        right_line.setStyleSheet("background-color: #ccc;")
-        right_line.setFixedHeight(1)
-        layout.addWidget(right_line, 1)
+        layout.addWidget(self._hline(), 1)
+        layout.addWidget(QLabel(label_text))
+        layout.addWidget(self._hline(), 1)
+
+    def _hline(self) -> QFrame:
+        """Create a 1px horizontal rule styled via the divider's sheet."""
+        line = QFrame(self)
+        line.setObjectName("hline")
+        line.setFrameShape(QFrame.Shape.HLine)
+        line.setFixedHeight(1)
+        return line
 
 
 class SidebarItem(QFrame):
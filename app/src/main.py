@@ -3,19 +3,36 @@
 
 import sys
 import os
+import math
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 
-# Load .env file if present (check both src/ and project root)
-env_file = Path(__file__).parent / ".env"
-if not env_file.exists():
-    env_file = Path(__file__).parent.parent / ".env"
-if env_file.exists():
+
+def _load_dotenv():
+    """Load a .env file if present (check both src/ and project root).
+
+    Values never override variables that are already set, so keys exported
+    in the shell win over the file.
+    """
+    env_file = Path(__file__).parent / ".env"
+    if not env_file.exists():
+        env_file = Path(__file__).parent.parent / ".env"
+    if not env_file.exists():
+        return
+
+    setdefault = os.environ.setdefault
     with open(env_file) as f:
         for line in f:
             line = line.strip()
-            if line and not line.startswith("#") and "=" in line:
-                key, value = line.split("=", 1)
-                os.environ.setdefault(key.strip(), value.strip())
+            if not line or line.startswith("#"):
+                continue
+            key, sep, value = line.partition("=")
+            if sep:
+                setdefault(key.strip(), value.strip())
+
+
+_load_dotenv()
 
 from PyQt6.QtWidgets import (
     QApplication,
@@ -23,31 +40,23 @@ from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
-    QGridLayout,
     QPushButton,
-    QTextEdit,
     QComboBox,
     QLabel,
     QSystemTrayIcon,
     QMenu,
-    QMenuBar,
     QDialog,
-    QFormLayout,
     QLineEdit,
-    QSpinBox,
     QCheckBox,
     QMessageBox,
     QFrame,
     QFileDialog,
-    QRadioButton,
-    QButtonGroup,
-    QGroupBox,
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize, QPropertyAnimation, QEasingCurve, QEvent
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, pyqtSignal, QTimer, QPropertyAnimation, QEasingCurve, QEvent
 import time
-from PyQt6.QtGui import QIcon, QAction, QFont, QClipboard, QShortcut, QKeySequence, QActionGroup
+from PyQt6.QtGui import QIcon, QAction, QFont, QShortcut, QKeySequence, QActionGroup
 from PyQt6.QtWidgets import QGraphicsOpacityEffect
-from PyQt6.QtWidgets import QCompleter, QToolButton
+from PyQt6.QtWidgets import QToolButton
 
 from .config import (
     Config,
@@ -70,10 +79,14 @@ from .config import (
     get_fallback_provider_and_model,
     is_preset_configured,
 )
+from .config_writer import get_config_writer
 from .audio_recorder import AudioRecorder
-from .transcription import get_client, TranscriptionResult
+from .transcription import get_client, warm_client, TranscriptionResult
 from .audio_processor import (
+    TARGET_SAMPLE_RATE,
     compress_audio_for_api,
+    encode_audio_for_api,
+    UPLOAD_CODECS,
     archive_audio,
     get_audio_info,
     combine_wav_segments,
@@ -90,21 +103,96 @@ from .hotkeys import (
     HOTKEY_MODE_DESCRIPTIONS,
 )
 from .cost_tracker import get_tracker
-from .history_window import HistoryWindow
-from .file_transcription_window import FileTranscriptionWindow
-from .analytics_widget import AnalyticsDialog
-from .settings_widget import SettingsDialog
-from .about_widget import AboutDialog
 from .audio_feedback import get_feedback
 from .tts_announcer import get_announcer
 from .prompt_library import PromptLibrary, build_prompt_from_config
 from .stack_builder import StackBuilderWidget
-from .prompt_editor_window import PromptEditorWindow
-from .rewrite_dialog import RewriteDialog
 from .ui_utils import get_provider_icon, get_model_icon
 from .clipboard import copy_to_clipboard
 
 
+# =============================================================================
+# BUTTON STYLES
+# =============================================================================
+
+_RECORD_BTN_IDLE_QSS = """
+    QPushButton {
+        background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #e84c5a, stop:1 #dc3545);
+        color: white;
+        border: none;
+        border-bottom: 3px solid #a71d2a;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 20px;
+        padding: 0 8px;
+    }
+    QPushButton:hover {
+        background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #dc3545, stop:1 #c82333);
+    }
+"""
+
+_STOP_BTN_QSS = """
+    QPushButton {
+        background-color: #ffc107;
+        color: black;
+        border: none;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 16px;
+        padding: 0 8px;
+    }
+    QPushButton:hover {
+        background-color: #e0a800;
+    }
+    QPushButton:disabled {
+        background-color: #6c757d;
+        color: #aaa;
+    }
+"""
+
+
+def _record_btn_pulse_qss(pulse: float) -> str:
+    """Record button style at one point of the recording pulse (0.0 to 1.0)."""
+    # Interpolate between dim red and bright red
+    # Dim: #cc0000, Bright: #ff4444
+    r_dim, g_dim, b_dim = 0xCC, 0x00, 0x00
+    r_bright, g_bright, b_bright = 0xFF, 0x44, 0x44
+
+    r = int(r_dim + (r_bright - r_dim) * pulse)
+    g = int(g_dim + (g_bright - g_dim) * pulse)
+    b = int(b_dim + (b_bright - b_dim) * pulse)
+
+    # Border brightness also pulses
+    border_dim = 0x99
+    border_bright = 0xFF
+    border_val = int(border_dim + (border_bright - border_dim) * pulse)
+
+    return f"""
+    QPushButton {{
+        background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #{r:02x}{g:02x}{b:02x}, stop:1 #{max(r - 30, 0):02x}{max(g - 30, 0):02x}{max(b - 30, 0):02x});
+        color: white;
+        border: 3px solid #{border_val:02x}{border_val // 3:02x}{border_val // 3:02x};
+        border-bottom: 4px solid #{max(r - 60, 0):02x}0000;
+        border-radius: 6px;
+        font-weight: bold;
+        font-size: 20px;
+        padding: 0 8px;
+    }}
+"""
+
+
+# One pulse cycle (~2 seconds at the 50ms animation tick), built once so the
+# animation doesn't format a new stylesheet twenty times a second
+_RECORD_BTN_PULSE_STEPS = 40
+_RECORD_BTN_PULSE_QSS = tuple(
+    _record_btn_pulse_qss((math.sin(step / _RECORD_BTN_PULSE_STEPS * 2 * math.pi) + 1) / 2)
+    for step in range(_RECORD_BTN_PULSE_STEPS)
+)
+
+
 class HotkeyEdit(QLineEdit):
     """A QLineEdit that captures hotkey presses when focused."""
 
@@ -154,8 +242,8 @@ class HotkeyEdit(QLineEdit):
         # Don't call super - we handle key capture separately
 
 
-class TranscriptionWorker(QThread):
-    """Worker thread for transcription API calls."""
+class TranscriptionSignals(QObject):
+    """Signals emitted by a TranscriptionWorker."""
 
     finished = pyqtSignal(TranscriptionResult)
     error = pyqtSignal(str)
@@ -163,6 +251,16 @@ class TranscriptionWorker(QThread):
     # Signal for VAD results: (processed_audio, original_duration, vad_duration)
     vad_complete = pyqtSignal(float, float)
 
+
+class TranscriptionWorker(QRunnable):
+    """Transcription job run on the global thread pool.
+
+    Pool threads are reused between transcriptions, so starting a job
+    doesn't spawn a new thread. The signals live on a TranscriptionSignals
+    object (a QRunnable can't emit) and are exposed under the same names a
+    QThread worker would have.
+    """
+
     def __init__(
         self,
         audio_data: bytes,
@@ -173,6 +271,14 @@ class TranscriptionWorker(QThread):
         vad_enabled: bool = False,
     ):
         super().__init__()
+        self.signals = TranscriptionSignals()
+        self.finished = self.signals.finished
+        self.error = self.signals.error
+        self.status = self.signals.status
+        self.vad_complete = self.signals.vad_complete
+        self._done = threading.Event()
+        self._done.set()
+
         self.audio_data = audio_data
         self.provider = provider
         self.api_key = api_key
@@ -183,8 +289,32 @@ class TranscriptionWorker(QThread):
         self.original_duration: float | None = None
         self.vad_duration: float | None = None
 
+    def start(self):
+        """Queue the job on the global thread pool."""
+        self._done.clear()
+        QThreadPool.globalInstance().start(self)
+
+    def isRunning(self) -> bool:
+        """Whether the job has been started and hasn't finished yet."""
+        return not self._done.is_set()
+
+    def wait(self, timeout_ms: int) -> bool:
+        """Block until the job finishes.
+
+        Returns:
+            True if the job finished within the timeout
+        """
+        return self._done.wait(timeout_ms / 1000)
+
     def run(self):
         try:
+            self._run()
+        finally:
+            self._done.set()
+
+    def _run(self):
+        try:
+            client = get_client(self.provider, self.api_key, self.model)
             audio_data = self.audio_data
 
             # Apply VAD if enabled (now in background thread!)
@@ -207,10 +337,25 @@ class TranscriptionWorker(QThread):
             self.status.emit("Compressing audio...")
             compressed_audio = compress_audio_for_api(audio_data)
 
+            upload_audio, mime_type = compressed_audio, "audio/wav"
+            if client.upload_codec:
+                self.status.emit("Encoding audio...")
+                encoded_audio = encode_audio_for_api(
+                    compressed_audio, client.upload_codec
+                )
+                if encoded_audio:
+                    upload_audio = encoded_audio
+                    mime_type = UPLOAD_CODECS[client.upload_codec]["mime_type"]
+                del encoded_audio
+
+            # Only the upload buffer is needed from here. Drop the VAD and
+            # compression intermediates so they aren't alive alongside the
+            # base64/JSON copies the provider call makes
+            del audio_data, compressed_audio
+
             self.status.emit("Transcribing...")
             start_time = time.time()
-            client = get_client(self.provider, self.api_key, self.model)
-            result = client.transcribe(compressed_audio, self.prompt)
+            result = client.transcribe(upload_audio, self.prompt, mime_type)
             self.inference_time_ms = int((time.time() - start_time) * 1000)
             self.finished.emit(result)
         except Exception as e:
@@ -280,10 +425,25 @@ class MainWindow(QMainWindow):
     # Signal for handling mic errors from background thread
     mic_error = pyqtSignal(str)
 
+    # Duration display only shows whole minutes, so a 1s tick is plenty
+    DURATION_TICK_MS = 1000
+
+    # Hotkey config field -> (in-focus shortcut attribute, handler method name)
+    HOTKEY_ACTIONS = {
+        "hotkey_toggle": ("_shortcut_toggle", "_hotkey_toggle_recording"),
+        "hotkey_tap_toggle": ("_shortcut_tap_toggle", "_hotkey_tap_toggle"),
+        "hotkey_transcribe": ("_shortcut_transcribe", "_hotkey_transcribe_only"),
+        "hotkey_clear": ("_shortcut_clear", "_hotkey_delete"),
+        "hotkey_append": ("_shortcut_append", "_hotkey_append"),
+        "hotkey_pause": ("_shortcut_pause", "_hotkey_pause"),
+    }
+
     def __init__(self):
         super().__init__()
         self.config = load_env_keys(load_config())
-        self.recorder = AudioRecorder(self.config.sample_rate)
+        # Every provider is sent 16kHz mono, so record at that rate directly
+        # and let compress_audio_for_api pass the WAV through untouched
+        self.recorder = AudioRecorder(TARGET_SAMPLE_RATE)
         self.recorder.on_error = self._on_recorder_error
         self.worker: TranscriptionWorker | None = None
         self.rewrite_worker: RewriteWorker | None = None
@@ -346,7 +506,7 @@ class MainWindow(QMainWindow):
         self._stop_recording_visual_effects()
         # Reset UI but keep any recorded audio or failed audio
         self.record_btn.setText("●")
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)
+        self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)
         self.record_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         # Keep transcribe enabled if we have cached audio or failed audio
@@ -410,12 +570,18 @@ class MainWindow(QMainWindow):
 
         # Request thread to quit and wait for it
         if worker.isRunning():
-            worker.quit()
-            if not worker.wait(timeout_ms):
-                # Thread didn't finish in time, force terminate (last resort)
-                print(f"Warning: {worker_attr} thread did not finish in time, terminating")
-                worker.terminate()
-                worker.wait(1000)
+            if not isinstance(worker, QThread):
+                # Pooled jobs can't be interrupted; with its signals
+                # disconnected the job just finishes in the background
+                if not worker.wait(timeout_ms):
+                    print(f"Warning: {worker_attr} job did not finish in time, detaching")
+            else:
+                worker.quit()
+                if not worker.wait(timeout_ms):
+                    # Thread didn't finish in time, force terminate (last resort)
+                    print(f"Warning: {worker_attr} thread did not finish in time, terminating")
+                    worker.terminate()
+                    worker.wait(1000)
 
         # Clear the reference
         setattr(self, worker_attr, None)
@@ -474,6 +640,7 @@ class MainWindow(QMainWindow):
 
         # Recording controls container with subtle background
         recording_container = QFrame()
+        self.recording_container = recording_container
         recording_container.setObjectName("recordingContainer")
         recording_container.setStyleSheet("""
             QFrame#recordingContainer {
@@ -498,41 +665,7 @@ class MainWindow(QMainWindow):
         self.record_btn.setToolTip(
             "Record\nStart a new recording.\nClears any cached audio and begins fresh."
         )
-        self._record_btn_idle_style = """
-            QPushButton {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #e84c5a, stop:1 #dc3545);
-                color: white;
-                border: none;
-                border-bottom: 3px solid #a71d2a;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 20px;
-                padding: 0 8px;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #dc3545, stop:1 #c82333);
-            }
-        """
-        self._record_btn_recording_style = """
-            QPushButton {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff3333, stop:1 #ff0000);
-                color: white;
-                border: 3px solid #ff6666;
-                border-bottom: 4px solid #cc0000;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 20px;
-                padding: 0 8px;
-            }
-            QPushButton:hover {
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #ff0000, stop:1 #cc0000);
-            }
-        """
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)
+        self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)
         self.record_btn.clicked.connect(self.toggle_recording)
         control_bar.addWidget(self.record_btn)
 
@@ -603,24 +736,7 @@ class MainWindow(QMainWindow):
             "Stop recording and cache audio without transcribing.\n"
             "You can then Append more clips, Transcribe, or Delete."
         )
-        self.stop_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ffc107;
-                color: black;
-                border: none;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 16px;
-                padding: 0 8px;
-            }
-            QPushButton:hover {
-                background-color: #e0a800;
-            }
-            QPushButton:disabled {
-                background-color: #6c757d;
-                color: #aaa;
-            }
-        """)
+        self.stop_btn.setStyleSheet(_STOP_BTN_QSS)
         self.stop_btn.clicked.connect(self.handle_stop_button)
         control_bar.addWidget(self.stop_btn)
 
@@ -739,6 +855,7 @@ class MainWindow(QMainWindow):
 
         # Track last shown minute for fade animation
         self._last_shown_minute = 0
+        self._duration_visible = False
 
         recording_layout.addLayout(control_bar)
 
@@ -1244,59 +1361,32 @@ class MainWindow(QMainWindow):
 
     def setup_timer(self):
         """Set up timer for updating recording duration."""
+        # Hides transient status messages; restarting it on each new message
+        # keeps an older message's timeout from hiding a newer one
+        self._status_hide_timer = QTimer(self)
+        self._status_hide_timer.setSingleShot(True)
+        self._status_hide_timer.setInterval(2000)
+        self._status_hide_timer.timeout.connect(self.status_label.hide)
+
         self.timer = QTimer()
+        self.timer.setInterval(self.DURATION_TICK_MS)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.timer.timeout.connect(self.update_duration)
 
         # Pulsation timer for record button animation
         self._pulse_timer = QTimer()
         self._pulse_timer.timeout.connect(self._on_pulse_timer)
-        self._pulse_phase = 0.0  # 0.0 to 1.0, tracks animation phase
+        self._pulse_step = 0  # Index into _RECORD_BTN_PULSE_QSS
 
     def _on_pulse_timer(self):
         """Handle pulsation animation for record button."""
-        import math
-
-        # Increment phase (complete cycle every ~2 seconds at 50ms intervals)
-        self._pulse_phase += 0.025
-        if self._pulse_phase > 1.0:
-            self._pulse_phase = 0.0
-
-        # Use sine wave for smooth pulsation (0.0 to 1.0)
-        pulse = (math.sin(self._pulse_phase * 2 * math.pi) + 1) / 2
-
-        # Interpolate between dim red and bright red
-        # Dim: #cc0000, Bright: #ff4444
-        r_dim, g_dim, b_dim = 0xCC, 0x00, 0x00
-        r_bright, g_bright, b_bright = 0xFF, 0x44, 0x44
-
-        r = int(r_dim + (r_bright - r_dim) * pulse)
-        g = int(g_dim + (g_bright - g_dim) * pulse)
-        b = int(b_dim + (b_bright - b_dim) * pulse)
-
-        # Border brightness also pulses
-        border_dim = 0x99
-        border_bright = 0xFF
-        border_val = int(border_dim + (border_bright - border_dim) * pulse)
-
-        style = f"""
-            QPushButton {{
-                background-color: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #{r:02x}{g:02x}{b:02x}, stop:1 #{max(r - 30, 0):02x}{max(g - 30, 0):02x}{max(b - 30, 0):02x});
-                color: white;
-                border: 3px solid #{border_val:02x}{border_val // 3:02x}{border_val // 3:02x};
-                border-bottom: 4px solid #{max(r - 60, 0):02x}0000;
-                border-radius: 6px;
-                font-weight: bold;
-                font-size: 20px;
-                padding: 0 8px;
-            }}
-        """
-        self.record_btn.setStyleSheet(style)
+        self._pulse_step = (self._pulse_step + 1) % len(_RECORD_BTN_PULSE_QSS)
+        self.record_btn.setStyleSheet(_RECORD_BTN_PULSE_QSS[self._pulse_step])
 
     def _start_recording_visual_effects(self):
         """Start pulsating record button animation."""
         # Start pulsation animation (50ms interval = 20 fps)
-        self._pulse_phase = 0.0
+        self._pulse_step = 0
         self._pulse_timer.start(50)
 
     def _stop_recording_visual_effects(self):
@@ -1344,62 +1434,27 @@ class MainWindow(QMainWindow):
         in setup_global_hotkeys(). These in-focus shortcuts provide additional
         responsiveness when the window has focus.
         """
-        # Clean up old shortcuts if they exist
-        shortcut_attrs = [
-            "_shortcut_toggle",
-            "_shortcut_tap_toggle",
-            "_shortcut_transcribe",
-            "_shortcut_clear",
-            "_shortcut_append",
-            "_shortcut_pause",
-        ]
-        for attr in shortcut_attrs:
-            if hasattr(self, attr):
-                shortcut = getattr(self, attr)
-                shortcut.setEnabled(False)
-                shortcut.deleteLater()
-
-        # Toggle: start/stop and transcribe
-        if self.config.hotkey_toggle:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_toggle)
-            if seq:
-                self._shortcut_toggle = QShortcut(seq, self)
-                self._shortcut_toggle.activated.connect(self._hotkey_toggle_recording)
-
-        # Tap toggle: start/stop and cache
-        if self.config.hotkey_tap_toggle:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_tap_toggle)
+        for field_name in self.HOTKEY_ACTIONS:
+            self._setup_configurable_shortcut(field_name)
+
+    def _setup_configurable_shortcut(self, field_name: str):
+        """Create (or replace) the in-focus shortcut for one hotkey field."""
+        attr, handler_name = self.HOTKEY_ACTIONS[field_name]
+
+        # Clean up the old shortcut if it exists
+        old_shortcut = getattr(self, attr, None)
+        if old_shortcut is not None:
+            old_shortcut.setEnabled(False)
+            old_shortcut.deleteLater()
+            setattr(self, attr, None)
+
+        hotkey = getattr(self.config, field_name)
+        if hotkey:
+            seq = self._hotkey_to_qt_sequence(hotkey)
             if seq:
-                self._shortcut_tap_toggle = QShortcut(seq, self)
-                self._shortcut_tap_toggle.activated.connect(self._hotkey_tap_toggle)
-
-        # Transcribe: transcribe cached audio
-        if self.config.hotkey_transcribe:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_transcribe)
-            if seq:
-                self._shortcut_transcribe = QShortcut(seq, self)
-                self._shortcut_transcribe.activated.connect(self._hotkey_transcribe_only)
-
-        # Clear: delete recording and cache
-        if self.config.hotkey_clear:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_clear)
-            if seq:
-                self._shortcut_clear = QShortcut(seq, self)
-                self._shortcut_clear.activated.connect(self._hotkey_delete)
-
-        # Append: start recording to add to cache
-        if self.config.hotkey_append:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_append)
-            if seq:
-                self._shortcut_append = QShortcut(seq, self)
-                self._shortcut_append.activated.connect(self._hotkey_append)
-
-        # Pause: pause/resume recording
-        if self.config.hotkey_pause:
-            seq = self._hotkey_to_qt_sequence(self.config.hotkey_pause)
-            if seq:
-                self._shortcut_pause = QShortcut(seq, self)
-                self._shortcut_pause.activated.connect(self._hotkey_pause)
+                shortcut = QShortcut(seq, self)
+                shortcut.activated.connect(getattr(self, handler_name))
+                setattr(self, attr, shortcut)
 
     def _hotkey_to_qt_sequence(self, hotkey_str: str) -> QKeySequence | None:
         """Convert a hotkey string like 'f15' or 'ctrl+f15' to a QKeySequence."""
@@ -1454,63 +1509,20 @@ class MainWindow(QMainWindow):
 
         Each hotkey can be configured to any key from F13-F24, or disabled.
         """
-        # Unregister all existing hotkeys first
-        for name in [
-            "hotkey_toggle",
-            "hotkey_tap_toggle",
-            "hotkey_transcribe",
-            "hotkey_clear",
-            "hotkey_append",
-            "hotkey_pause",
-        ]:
-            self.hotkey_listener.unregister(name)
-
-        # Toggle: start/stop and transcribe
-        if self.config.hotkey_toggle:
-            self.hotkey_listener.register(
-                "hotkey_toggle",
-                self.config.hotkey_toggle,
-                lambda: QTimer.singleShot(0, self._hotkey_toggle_recording),
-            )
+        for field_name in self.HOTKEY_ACTIONS:
+            self._register_hotkey(field_name)
 
-        # Tap toggle: start/stop and cache (for append mode)
-        if self.config.hotkey_tap_toggle:
-            self.hotkey_listener.register(
-                "hotkey_tap_toggle",
-                self.config.hotkey_tap_toggle,
-                lambda: QTimer.singleShot(0, self._hotkey_tap_toggle),
-            )
-
-        # Transcribe: transcribe cached audio only
-        if self.config.hotkey_transcribe:
-            self.hotkey_listener.register(
-                "hotkey_transcribe",
-                self.config.hotkey_transcribe,
-                lambda: QTimer.singleShot(0, self._hotkey_transcribe_only),
-            )
-
-        # Clear: clear cache/delete recording
-        if self.config.hotkey_clear:
-            self.hotkey_listener.register(
-                "hotkey_clear",
-                self.config.hotkey_clear,
-                lambda: QTimer.singleShot(0, self._hotkey_delete),
-            )
-
-        # Append: start new recording to add to cache
-        if self.config.hotkey_append:
-            self.hotkey_listener.register(
-                "hotkey_append",
-                self.config.hotkey_append,
-                lambda: QTimer.singleShot(0, self._hotkey_append),
-            )
+    def _register_hotkey(self, field_name: str):
+        """(Re-)register the global hotkey for one config field."""
+        self.hotkey_listener.unregister(field_name)
 
-        # Pause: pause/resume current recording
-        if self.config.hotkey_pause:
+        hotkey = getattr(self.config, field_name)
+        if hotkey:
+            handler = getattr(self, self.HOTKEY_ACTIONS[field_name][1])
             self.hotkey_listener.register(
-                "hotkey_pause",
-                self.config.hotkey_pause,
-                lambda: QTimer.singleShot(0, self._hotkey_pause),
+                field_name,
+                hotkey,
+                lambda: QTimer.singleShot(0, handler),
             )
 
     def _hotkey_toggle_recording(self):
@@ -1567,10 +1579,9 @@ class MainWindow(QMainWindow):
 
     def update_word_count(self):
         """Update the word count display."""
-        text = self.text_output.toPlainText()
-        if text:
-            words = len(text.split())
-            chars = len(text)
+        if not self.text_output.isEmpty():
+            words = self.text_output.wordCount()
+            chars = self.text_output.characterCount()
             self.word_count_label.setText(f"{words} words, {chars} characters")
         else:
             self.word_count_label.setText("")
@@ -1579,10 +1590,7 @@ class MainWindow(QMainWindow):
         """Save transcription to a file."""
         text = self.text_output.toPlainText()
         if not text:
-            self.status_label.setText("Nothing to save")
-            self.status_label.setStyleSheet("color: rgba(255, 193, 7, 0.8); font-size: 11px;")
-            self.status_label.show()
-            QTimer.singleShot(2000, lambda: self.status_label.hide())
+            self._flash_status("Nothing to save", "color: rgba(255, 193, 7, 0.8); font-size: 11px;")
             return
 
         file_path, _ = QFileDialog.getSaveFileName(
@@ -1596,20 +1604,28 @@ class MainWindow(QMainWindow):
             try:
                 with open(file_path, "w", encoding="utf-8") as f:
                     f.write(text)
-                self.status_label.setText("Saved!")
-                self.status_label.setStyleSheet("color: rgba(40, 167, 69, 0.7); font-size: 11px;")
-                self.status_label.show()
+                self._flash_status("Saved!", "color: rgba(40, 167, 69, 0.7); font-size: 11px;")
             except Exception as e:
                 QMessageBox.critical(self, "Save Error", str(e))
-            finally:
-                QTimer.singleShot(2000, lambda: self.status_label.hide())
+                self._status_hide_timer.start()
+
+    def _flash_status(self, text: str, style: str):
+        """Show a transient status message that hides itself after 2s."""
+        self.status_label.setText(text)
+        self.status_label.setStyleSheet(style)
+        self.status_label.show()
+        self._status_hide_timer.start()
 
     def _open_prompt_editor(self):
         """Open the unified Prompt Editor window."""
         if self.prompt_editor_window is None:
+            from .prompt_editor_window import PromptEditorWindow
             self.prompt_editor_window = PromptEditorWindow(self.config, CONFIG_DIR, self)
             self.prompt_editor_window.prompts_changed.connect(self._on_prompts_changed)
 
+        if self.prompt_editor_window.headless:
+            return
+
         self.prompt_editor_window.show()
         self.prompt_editor_window.raise_()
         self.prompt_editor_window.activateWindow()
@@ -1633,7 +1649,7 @@ class MainWindow(QMainWindow):
         else:
             enabled = False
 
-        save_config(self.config)
+        self._queue_config_save()
         self._update_mode_button_styles()
 
         # Audio feedback for mode toggle
@@ -1673,9 +1689,17 @@ class MainWindow(QMainWindow):
             self.config.output_to_clipboard = enabled
         elif mode == "inject":
             self.config.output_to_inject = enabled
-        save_config(self.config)
+        self._queue_config_save()
         self._update_mode_button_styles()
 
+    def _queue_config_save(self):
+        """Persist config on the background writer thread.
+
+        Toolbar toggles and menu picks only mutate self.config here; the
+        database write happens off the GUI thread so the click returns at once.
+        """
+        get_config_writer().request_save(self.config)
+
     def _update_mode_button_styles(self):
         """Update mode button styles based on current enabled states."""
         mode_states = {
@@ -1704,13 +1728,13 @@ class MainWindow(QMainWindow):
         elif old_mode != "tts" and mode == "tts":
             # Entering TTS mode - announce after setting mode
             self.config.audio_feedback_mode = mode
-            save_config(self.config)
+            self._queue_config_save()
             self._update_feedback_buttons()
             get_announcer().announce_tts_activated()
             return
 
         self.config.audio_feedback_mode = mode
-        save_config(self.config)
+        self._queue_config_save()
         self._update_feedback_buttons()
 
     def _update_feedback_buttons(self):
@@ -1725,7 +1749,7 @@ class MainWindow(QMainWindow):
         When enabled, adds a TLDR/summary section to the output.
         """
         self.config.tldr_enabled = checked
-        save_config(self.config)
+        self._queue_config_save()
 
     def _on_tldr_position_changed(self, position: str):
         """Handle TLDR position dropdown change.
@@ -1733,7 +1757,7 @@ class MainWindow(QMainWindow):
         Sets where the TLDR section appears: top or bottom.
         """
         self.config.tldr_position = position.lower()
-        save_config(self.config)
+        self._queue_config_save()
 
     def _on_vad_checkbox_changed(self, state: int):
         """Handle VAD checkbox toggle.
@@ -1742,7 +1766,7 @@ class MainWindow(QMainWindow):
         """
         enabled = state == Qt.CheckState.Checked.value
         self.config.vad_enabled = enabled
-        save_config(self.config)
+        self._queue_config_save()
 
         # Audio feedback for VAD toggle
         if self.config.audio_feedback_mode == "beeps":
@@ -1771,7 +1795,7 @@ class MainWindow(QMainWindow):
             self.config.prompt_remove_unintentional_dialogue = False
             self.config.prompt_enhancement_enabled = False
 
-        save_config(self.config)
+        self._queue_config_save()
 
     def _on_prompts_changed(self):
         """Handle changes to prompts in the prompt library or editor."""
@@ -1787,7 +1811,7 @@ class MainWindow(QMainWindow):
         The stack builder has already updated self.config with the new values.
         We just need to save and update any dependent UI elements.
         """
-        save_config(self.config)
+        self._queue_config_save()
 
     def get_selected_microphone_index(self):
         """Get the index of the configured microphone.
@@ -1860,15 +1884,17 @@ class MainWindow(QMainWindow):
                 get_announcer().announce_recording()
 
             self.recorder.start_recording()
-            self.record_btn.setText("●")
-            self.pause_btn.setEnabled(True)
-            self.append_btn.setEnabled(False)  # Disable append while recording
-            self.stop_btn.setEnabled(True)  # Can stop recording to cache
-            self.transcribe_btn.setEnabled(True)  # Can stop and transcribe immediately
-            self.delete_btn.setEnabled(True)  # Can delete current recording
-            self.status_label.setText("Recording...")
-            self.status_label.setStyleSheet("color: rgba(220, 53, 69, 0.7); font-size: 11px;")
-            self.timer.start(100)
+            self._warm_transcription_client()
+            with self._batched_control_updates():
+                self.record_btn.setText("●")
+                self.pause_btn.setEnabled(True)
+                self.append_btn.setEnabled(False)  # Disable append while recording
+                self.stop_btn.setEnabled(True)  # Can stop recording to cache
+                self.transcribe_btn.setEnabled(True)  # Can stop and transcribe immediately
+                self.delete_btn.setEnabled(True)  # Can delete current recording
+                self.status_label.setText("Recording...")
+                self.status_label.setStyleSheet("color: rgba(220, 53, 69, 0.7); font-size: 11px;")
+            self.timer.start()
             # Start visual effects (pulsating record button, grayscale other controls)
             self._start_recording_visual_effects()
             # Update tray to recording state
@@ -1927,7 +1953,7 @@ class MainWindow(QMainWindow):
 
         # Update UI to "stopped with cached audio" state
         self.record_btn.setText("●")
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)
+        self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)
         self.record_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.pause_btn.setText("⏸")
@@ -2116,7 +2142,7 @@ class MainWindow(QMainWindow):
         # Stop visual effects if somehow still running
         self._stop_recording_visual_effects()
         self.record_btn.setText("●")
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)
+        self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)
         self.record_btn.setEnabled(True)
         self.pause_btn.setEnabled(False)
         self.append_btn.setEnabled(False)
@@ -2190,16 +2216,17 @@ class MainWindow(QMainWindow):
         # Clear state flags
         self.has_cached_audio = False
 
-        self.record_btn.setText("●")
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)  # Reset to idle color
-        self.record_btn.setEnabled(False)
-        self.pause_btn.setEnabled(False)
-        self.append_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
-        self.transcribe_btn.setEnabled(False)
-        self.delete_btn.setEnabled(False)
-        self.status_label.setText("Transcribing...")
-        self.status_label.setStyleSheet("color: rgba(0, 123, 255, 0.7); font-size: 11px;")
+        with self._batched_control_updates():
+            self.record_btn.setText("●")
+            self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)  # Reset to idle color
+            self.record_btn.setEnabled(False)
+            self.pause_btn.setEnabled(False)
+            self.append_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            self.transcribe_btn.setEnabled(False)
+            self.delete_btn.setEnabled(False)
+            self.status_label.setText("Transcribing...")
+            self.status_label.setStyleSheet("color: rgba(0, 123, 255, 0.7); font-size: 11px;")
 
         # Update tray to transcribing state
         self._set_tray_state("transcribing")
@@ -2288,36 +2315,25 @@ class MainWindow(QMainWindow):
         # Handle app output
         if output_to_app:
             if self.append_mode:
-                existing_text = self.text_output.toPlainText()
-                if existing_text:
+                if not self.text_output.isEmpty():
                     if self.config.append_position == "cursor":
                         # Insert at cursor position
                         cursor = self.text_output.source_view.textCursor()
                         cursor.insertText("\n\n" + result.text)
                         self.text_output.source_view.setTextCursor(cursor)
                     else:
-                        # Append at end (default)
-                        combined_text = existing_text + "\n\n" + result.text
-                        self.text_output.setMarkdown(combined_text)
-                        # Move cursor to end of document after appending
-                        cursor = self.text_output.source_view.textCursor()
-                        cursor.movePosition(cursor.MoveOperation.End)
-                        self.text_output.source_view.setTextCursor(cursor)
+                        # Append at end (default), leaving the cursor there
+                        self.text_output.appendMarkdown(result.text)
                 else:
                     self.text_output.setMarkdown(result.text)
                 # Reset append mode
                 self.append_mode = False
             else:
                 # Normal mode - append to existing text if present
-                existing_text = self.text_output.toPlainText()
-                if existing_text.strip():
+                # (any words at all means it isn't just whitespace)
+                if self.text_output.wordCount():
                     # Append new transcription to existing text
-                    combined_text = existing_text + "\n\n" + result.text
-                    self.text_output.setMarkdown(combined_text)
-                    # Move cursor to end
-                    cursor = self.text_output.source_view.textCursor()
-                    cursor.movePosition(cursor.MoveOperation.End)
-                    self.text_output.source_view.setTextCursor(cursor)
+                    self.text_output.appendMarkdown(result.text)
                 else:
                     self.text_output.setMarkdown(result.text)
         else:
@@ -2654,7 +2670,7 @@ class MainWindow(QMainWindow):
         # Set as preferred microphone
         self.config.preferred_mic_name = name
         self.config.preferred_mic_nickname = None
-        save_config(self.config)
+        self._queue_config_save()
 
         # Update display
         self._update_mic_display()
@@ -2824,7 +2840,7 @@ class MainWindow(QMainWindow):
             return  # No change
 
         self.config.active_model_preset = preset
-        save_config(self.config)
+        self._queue_config_save()
 
         # Update display
         self._update_model_display()
@@ -2868,31 +2884,52 @@ class MainWindow(QMainWindow):
         """
         return get_active_provider_and_model(self.config)
 
+    def _warm_transcription_client(self):
+        """Build the active provider's client while recording is under way."""
+        provider, model = self._get_current_model()
+        if provider == "gemini":
+            api_key = self.config.gemini_api_key
+        else:  # openrouter
+            api_key = self.config.openrouter_api_key
+        if api_key:
+            warm_client(provider, api_key, model)
+
+    @contextmanager
+    def _batched_control_updates(self):
+        """Suspend painting of the recording controls during a run of
+        button/label changes, so they repaint once when it ends."""
+        self.recording_container.setUpdatesEnabled(False)
+        try:
+            yield
+        finally:
+            self.recording_container.setUpdatesEnabled(True)
+
     def reset_ui(self):
         """Reset UI to initial state.
 
         Note: Does not change tray state - caller is responsible for setting
         appropriate tray state (idle, complete, etc.) after calling this.
         """
-        # Stop visual effects (pulsating, grayscale)
-        self._stop_recording_visual_effects()
-        self.record_btn.setText("●")
-        self.record_btn.setStyleSheet(self._record_btn_idle_style)
-        self.record_btn.setEnabled(True)
-        self.pause_btn.setText("⏸")
-        self.pause_btn.setEnabled(False)
-        self.append_btn.setEnabled(False)
-        self.stop_btn.setEnabled(False)
-        self.transcribe_btn.setEnabled(False)
-        self.transcribe_btn.setStyleSheet(self._transcribe_btn_idle_style)  # Reset to green
-        self.delete_btn.setEnabled(False)
-        # Hide duration display and reset minute counter
-        self.duration_label.setText("")
-        self.duration_container.hide()
-        self._last_shown_minute = 0
-        # Hide status label (no longer shows "Ready")
-        self.status_label.setText("")
-        self.status_label.hide()
+        with self._batched_control_updates():
+            # Stop visual effects (pulsating, grayscale)
+            self._stop_recording_visual_effects()
+            self.record_btn.setText("●")
+            self.record_btn.setStyleSheet(_RECORD_BTN_IDLE_QSS)
+            self.record_btn.setEnabled(True)
+            self.pause_btn.setText("⏸")
+            self.pause_btn.setEnabled(False)
+            self.append_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            self.transcribe_btn.setEnabled(False)
+            self.transcribe_btn.setStyleSheet(self._transcribe_btn_idle_style)  # Reset to green
+            self.delete_btn.setEnabled(False)
+            # Hide duration display and reset minute counter
+            self.duration_label.setText("")
+            self._set_duration_visible(False)
+            self._last_shown_minute = 0
+            # Hide status label (no longer shows "Ready")
+            self.status_label.setText("")
+            self.status_label.hide()
 
     def delete_recording(self):
         """Delete current recording and any accumulated segments."""
@@ -2950,18 +2987,23 @@ class MainWindow(QMainWindow):
 
         # Only show duration once we hit 1 minute
         if mins < 1:
-            self.duration_container.hide()
+            self._set_duration_visible(False)
             return
 
-        # Show container if hidden
-        if not self.duration_container.isVisible():
-            self.duration_container.show()
+        self._set_duration_visible(True)
 
         # Update display only when minute changes
         if mins != self._last_shown_minute:
             self._last_shown_minute = mins
             self._animate_duration_change(f"{mins}m")
 
+    def _set_duration_visible(self, visible: bool):
+        """Show or hide the duration box, skipping no-op visibility changes."""
+        if visible == self._duration_visible:
+            return
+        self._duration_visible = visible
+        self.duration_container.setVisible(visible)
+
     def _animate_duration_change(self, new_text: str):
         """Animate duration label with fade out/in effect."""
         # Set up opacity effect if not already present
@@ -3045,10 +3087,7 @@ class MainWindow(QMainWindow):
                 get_announcer().announce_copied_to_clipboard()
 
             # Don't play beep here - only play when transcription first arrives
-            self.status_label.setText("Copied!")
-            self.status_label.setStyleSheet("color: rgba(40, 167, 69, 0.7); font-size: 11px;")
-            self.status_label.show()
-            QTimer.singleShot(2000, lambda: self.status_label.hide())
+            self._flash_status("Copied!", "color: rgba(40, 167, 69, 0.7); font-size: 11px;")
 
     def rewrite_transcript(self):
         """Rewrite the transcript with user instructions."""
@@ -3057,6 +3096,7 @@ class MainWindow(QMainWindow):
             return
 
         # Show dialog to get rewrite instructions
+        from .rewrite_dialog import RewriteDialog
         dialog = RewriteDialog(self)
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
@@ -3151,10 +3191,7 @@ class MainWindow(QMainWindow):
         if self.config.embedding_enabled and self.config.gemini_api_key:
             self._check_embedding_batch()
 
-        self.status_label.setText("Rewrite complete!")
-        self.status_label.setStyleSheet("color: rgba(40, 167, 69, 0.7); font-size: 11px;")
-        self.status_label.show()
-        QTimer.singleShot(2000, lambda: self.status_label.hide())
+        self._flash_status("Rewrite complete!", "color: rgba(40, 167, 69, 0.7); font-size: 11px;")
 
     def on_rewrite_error(self, error: str):
         """Handle rewrite error."""
@@ -3202,10 +3239,7 @@ class MainWindow(QMainWindow):
         filename = f"{title}.md"
         self._save_transcript_to_file(filename, text)
 
-        self.status_label.setText("Downloaded!")
-        self.status_label.setStyleSheet("color: rgba(40, 167, 69, 0.7); font-size: 11px;")
-        self.status_label.show()
-        QTimer.singleShot(2000, lambda: self.status_label.hide())
+        self._flash_status("Downloaded!", "color: rgba(40, 167, 69, 0.7); font-size: 11px;")
 
     def on_title_error(self, error: str):
         """Handle title generation error - fall back to timestamp."""
@@ -3216,10 +3250,7 @@ class MainWindow(QMainWindow):
         filename = f"transcript_{timestamp}.md"
         self._save_transcript_to_file(filename, text)
 
-        self.status_label.setText("Downloaded (timestamp)")
-        self.status_label.setStyleSheet("color: rgba(40, 167, 69, 0.7); font-size: 11px;")
-        self.status_label.show()
-        QTimer.singleShot(2000, lambda: self.status_label.hide())
+        self._flash_status("Downloaded (timestamp)", "color: rgba(40, 167, 69, 0.7); font-size: 11px;")
 
     def _save_transcript_to_file(self, filename: str, text: str):
         """Save transcript to Downloads folder with given filename."""
@@ -3240,8 +3271,11 @@ class MainWindow(QMainWindow):
 
     def show_settings(self):
         """Show settings dialog."""
-        # Create dialog if it doesn't exist
+        # Create dialog if it doesn't exist. It's kept for the life of the
+        # window, so reopening Settings reuses the built tabs instead of
+        # reconstructing the whole settings widget.
         if self.settings_dialog is None:
+            from .settings_widget import SettingsDialog
             self.settings_dialog = SettingsDialog(self.config, self.recorder, self)
             # Connect to settings_closed signal to sync UI state
             self.settings_dialog.settings_closed.connect(self._sync_ui_from_settings)
@@ -3254,12 +3288,21 @@ class MainWindow(QMainWindow):
         self.settings_dialog.raise_()
         self.settings_dialog.activateWindow()
 
-    def _refresh_hotkeys(self):
-        """Re-register global hotkeys after config change."""
-        # Re-register global hotkeys
-        self._register_hotkeys()
-        # Re-setup in-focus shortcuts
-        self._setup_configurable_shortcuts()
+    def _refresh_hotkeys(self, field_name: str, old_value: str, new_value: str):
+        """Re-register hotkeys after a config change.
+
+        Args:
+            field_name: Changed hotkey field, or "*" when all may have changed
+            old_value: Previous key (unused when field_name is "*")
+            new_value: New key (unused when field_name is "*")
+        """
+        if field_name == "*":
+            self._register_hotkeys()
+            self._setup_configurable_shortcuts()
+            return
+        # Only the one binding changed
+        self._register_hotkey(field_name)
+        self._setup_configurable_shortcut(field_name)
 
     def _sync_ui_from_settings(self):
         """Sync UI state with current config after settings dialog closes."""
@@ -3272,6 +3315,7 @@ class MainWindow(QMainWindow):
         """Show the standalone history window."""
         # Create window if it doesn't exist
         if self.history_window is None:
+            from .history_window import HistoryWindow
             self.history_window = HistoryWindow(config=self.config)
 
         # Show (refreshes automatically via showEvent)
@@ -3323,6 +3367,7 @@ class MainWindow(QMainWindow):
         """Show the file transcription window (Beta feature)."""
         # Create window if it doesn't exist
         if self.file_transcription_window is None:
+            from .file_transcription_window import FileTranscriptionWindow
             self.file_transcription_window = FileTranscriptionWindow(config=self.config)
 
         # Show
@@ -3334,6 +3379,8 @@ class MainWindow(QMainWindow):
         """Show analytics dialog."""
         # Create dialog if it doesn't exist
         if self.analytics_dialog is None:
+            # Deferred: pulls in pyqtgraph, which is slow to import
+            from .analytics_widget import AnalyticsDialog
             self.analytics_dialog = AnalyticsDialog(self)
 
         # Show (refreshes automatically via showEvent)
@@ -3345,6 +3392,7 @@ class MainWindow(QMainWindow):
         """Show about dialog."""
         # Create dialog if it doesn't exist
         if self.about_dialog is None:
+            from .about_widget import AboutDialog
             self.about_dialog = AboutDialog(self)
 
         # Show
@@ -3693,7 +3741,8 @@ class MainWindow(QMainWindow):
         # Clean up audio recorder
         self.recorder.cleanup()
 
-        # Save config
+        # Let queued background saves land first, then save the final state
+        get_config_writer().flush()
         save_config(self.config)
 
         # Now quit the application
@@ -1,8 +1,16 @@
 """Text widget for transcription output."""
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QTextEdit
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPlainTextEdit
 from PyQt6.QtGui import QFont
-from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtCore import pyqtSignal, QTimer
+
+
+# Applied once per widget at construction time
+SOURCE_VIEW_STYLE = "QPlainTextEdit { border: 1px solid #ced4da; border-radius: 4px; }"
+
+# Quiet period before textChanged is emitted, so listeners run a few times
+# a second while typing rather than once per keystroke
+TEXT_CHANGED_DEBOUNCE_MS = 150
 
 
 class MarkdownTextWidget(QWidget):
@@ -13,6 +21,20 @@ class MarkdownTextWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._markdown_text = ""
+        self._text_stale = False
+
+        # Word count per document block, kept in step with edits so the
+        # total never needs a full re-split of the document
+        self._block_words = [0]
+        self._word_count = 0
+
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(TEXT_CHANGED_DEBOUNCE_MS)
+        self._emit_timer.timeout.connect(self._emit_text_changed)
+        # Set when a change arrived while hidden; emitted on the next show
+        self._emit_pending = False
+
         self.setup_ui()
 
     def setup_ui(self):
@@ -20,36 +42,141 @@ class MarkdownTextWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
-        # Editable text area that also renders markdown
-        self.source_view = QTextEdit()
+        # Editable plain text area; line-based layout keeps long
+        # transcripts cheap to edit
+        self.source_view = QPlainTextEdit()
         self.source_view.setFont(QFont("Sans", 11))
-        self.source_view.setStyleSheet("QTextEdit { border: 1px solid #ced4da; border-radius: 4px; }")
+        self.source_view.setStyleSheet(SOURCE_VIEW_STYLE)
         self.source_view.textChanged.connect(self._on_source_changed)
+        self.source_view.document().contentsChange.connect(self._on_contents_change)
 
         layout.addWidget(self.source_view, 1)
 
     def _on_source_changed(self):
-        """Handle source text changes."""
-        self._markdown_text = self.source_view.toPlainText()
+        """Handle source text changes.
+
+        The document is only converted to a string when someone asks for it,
+        so typing doesn't copy the whole buffer on every keystroke. The
+        textChanged signal is debounced for the same reason.
+        """
+        self._text_stale = True
+        self._emit_timer.start()
+
+    def _emit_text_changed(self):
+        """Emit textChanged, or hold it until the widget is shown again.
+
+        Listeners only update on-screen counters, so while the window sits
+        in the tray there's nothing worth recomputing.
+        """
+        if not self.isVisible():
+            self._emit_pending = True
+            return
         self.textChanged.emit()
 
+    def showEvent(self, event):
+        """Deliver a change that arrived while the widget was hidden."""
+        super().showEvent(event)
+        if self._emit_pending:
+            self._emit_pending = False
+            self.textChanged.emit()
+
+    def _on_contents_change(self, position: int, removed: int, added: int):
+        """Recount words in the blocks touched by an edit.
+
+        Text before the edit position is untouched, so the changed blocks
+        start at the same block number before and after the edit. The
+        change in block count tells how many old entries they replace.
+        """
+        document = self.source_view.document()
+        first = document.findBlock(position)
+        last = document.findBlock(position + added)
+        if not last.isValid():
+            last = document.lastBlock()
+
+        start = first.blockNumber()
+        end = last.blockNumber()
+        old_end = end - (document.blockCount() - len(self._block_words))
+        if start < 0 or old_end < start - 1:
+            self._recount_words()
+            return
+
+        counts = []
+        block = first
+        for _ in range(end - start + 1):
+            counts.append(len(block.text().split()))
+            block = block.next()
+
+        old_counts = self._block_words[start:old_end + 1]
+        self._block_words[start:old_end + 1] = counts
+        self._word_count += sum(counts) - sum(old_counts)
+
+    def _recount_words(self):
+        """Rebuild the per-block word counts from the whole document."""
+        counts = []
+        block = self.source_view.document().firstBlock()
+        while block.isValid():
+            counts.append(len(block.text().split()))
+            block = block.next()
+        self._block_words = counts
+        self._word_count = sum(counts)
+
+    def wordCount(self) -> int:
+        """Get the number of whitespace-separated words."""
+        return self._word_count
+
+    def characterCount(self) -> int:
+        """Get the number of characters, as len() of the text counts them."""
+        return len(self.toPlainText())
+
+    def isEmpty(self) -> bool:
+        """Whether there is no text, without converting the document."""
+        return self.source_view.document().isEmpty()
+
+    def _utf16_length(self) -> int:
+        """Document length in UTF-16 code units (Qt's cheap count)."""
+        return self.source_view.document().characterCount() - 1
+
     def setMarkdown(self, text: str):
-        """Set the markdown text content."""
-        self._markdown_text = text
+        """Set the markdown text content.
+
+        Setting the text that is already shown is a no-op, so callers that
+        re-apply the same result don't rebuild the document and lose the
+        cursor position. Qt's UTF-16 length is between one and two units per
+        character, so a length outside that range settles it without
+        converting a stale document to a string just to compare.
+        """
+        units = self._utf16_length()
+        if len(text) <= units <= 2 * len(text) and text == self.toPlainText():
+            return
         self.source_view.setPlainText(text)
 
+    def appendMarkdown(self, text: str, separator: str = "\n\n"):
+        """Append text at the end and move the cursor after it.
+
+        Only the new text is inserted, so the existing document is neither
+        copied out nor rebuilt, and the edit stays undoable.
+        """
+        cursor = self.source_view.textCursor()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(text if self.isEmpty() else separator + text)
+        self.source_view.setTextCursor(cursor)
+
     def setPlainText(self, text: str):
         """Alias for setMarkdown for compatibility."""
         self.setMarkdown(text)
 
     def toPlainText(self) -> str:
         """Get the markdown text content."""
-        return self.source_view.toPlainText()
+        if self._text_stale:
+            self._markdown_text = self.source_view.toPlainText()
+            self._text_stale = False
+        return self._markdown_text
 
     def clear(self):
         """Clear the content."""
-        self._markdown_text = ""
         self.source_view.clear()
+        self._markdown_text = ""
+        self._text_stale = False
 
     def setPlaceholderText(self, text: str):
         """Set placeholder text for the source view."""
@@ -10,10 +10,11 @@ from PyQt6.QtWidgets import (
     QTabWidget,
 )
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QIcon
+from PyQt6.QtGui import QIcon
 from pathlib import Path
 
 from .config import GEMINI_MODELS, OPENROUTER_MODELS
+from .ui_utils import get_title_font
 
 
 # Model metadata with additional notes
@@ -101,7 +102,7 @@ class ModelsWidget(QWidget):
 
         # Header
         title = QLabel("Available Models")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title.setFont(get_title_font())
         title.setStyleSheet("color: #333;")
         container_layout.addWidget(title)
 
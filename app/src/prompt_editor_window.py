@@ -16,13 +16,14 @@ from PyQt6.QtWidgets import (
     QDialog, QDialogButtonBox, QToolButton, QTabWidget,
     QListWidget, QListWidgetItem, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from PyQt6.QtGui import QFont
+import os
 from pathlib import Path
 from typing import List, Set, Optional
 
 from .config import (
-    Config, save_config,
+    Config,
     FOUNDATION_PROMPT_SECTIONS,
     FORMAT_TEMPLATES, FORMAT_DISPLAY_NAMES, FORMAT_CATEGORIES,
     TONE_TEMPLATES, STYLE_TEMPLATES,
@@ -30,6 +31,7 @@ from .config import (
     FORMALITY_DISPLAY_NAMES, VERBOSITY_DISPLAY_NAMES,
     TONE_DISPLAY_NAMES, STYLE_DISPLAY_NAMES
 )
+from .config_writer import get_config_writer
 from .prompt_elements import (
     FORMAT_ELEMENTS, STYLE_ELEMENTS, GRAMMAR_ELEMENTS,
     PromptStack, get_all_stacks, save_custom_stack, delete_stack,
@@ -41,6 +43,15 @@ from .prompt_library import (
 )
 
 
+# Skip building the window UI in headless/automated runs
+# (enable with VOICE_NOTEPAD_HEADLESS=1)
+HEADLESS = os.environ.get("VOICE_NOTEPAD_HEADLESS", "").lower() in ("1", "true", "yes")
+
+# Verbosity levels in display order, with a reverse lookup for preselection
+_VERBOSITY_KEYS = ("none", "minimum", "short", "medium", "maximum")
+_VERBOSITY_INDEX = {key: i for i, key in enumerate(_VERBOSITY_KEYS)}
+
+
 class PromptEditDialog(QDialog):
     """Dialog for editing a prompt configuration."""
 
@@ -294,18 +305,34 @@ class PromptEditorWindow(QMainWindow):
         super().__init__(parent)
         self.config = config
         self.config_dir = config_dir
+        self.headless = HEADLESS
+
+        # Track UI elements
+        self.element_checkboxes = {}  # element_key -> QCheckBox
+        self.selected_elements: Set[str] = set()
+
+        # Config changes are coalesced and written once per event-loop idle
+        self._config_dirty = False
+
+        if self.headless:
+            # Nothing will be rendered - no library load, no widgets
+            self.library = None
+            return
+
         self.library = PromptLibrary(config_dir)
 
         self.setWindowTitle("Prompt Manager")
         self.setMinimumSize(880, 720)
         self.resize(950, 820)
 
-        # Track UI elements
-        self.element_checkboxes = {}  # element_key -> QCheckBox
-        self.selected_elements: Set[str] = set()
-
         self._init_ui()
 
+    def setVisible(self, visible: bool):
+        """Never map a headless window (show() routes through here)."""
+        if self.headless:
+            return
+        super().setVisible(visible)
+
     def _init_ui(self):
         """Initialize the UI with a tabbed interface."""
         central = QWidget()
@@ -1166,14 +1193,15 @@ class PromptEditorWindow(QMainWindow):
         formality_row.addWidget(QLabel("Formality:"))
 
         self.formality_group = QButtonGroup(self)
-        for formality_key, display_name in FORMALITY_DISPLAY_NAMES.items():
+        self._id_to_formality = {}
+        for i, (formality_key, display_name) in enumerate(FORMALITY_DISPLAY_NAMES.items()):
             radio = QRadioButton(display_name)
-            radio.setProperty("formality_key", formality_key)
             if formality_key == self.config.formality_level:
                 radio.setChecked(True)
-            self.formality_group.addButton(radio)
+            self.formality_group.addButton(radio, i)
+            self._id_to_formality[i] = formality_key
             formality_row.addWidget(radio)
-        self.formality_group.buttonClicked.connect(self._on_tone_changed)
+        self.formality_group.idClicked.connect(self._on_formality_clicked)
 
         formality_row.addStretch()
         parent_layout.addLayout(formality_row)
@@ -1184,12 +1212,13 @@ class PromptEditorWindow(QMainWindow):
 
         self.verbosity_combo = QComboBox()
         self.verbosity_combo.setMinimumWidth(150)
-        for verbosity_key in ["none", "minimum", "short", "medium", "maximum"]:
-            self.verbosity_combo.addItem(VERBOSITY_DISPLAY_NAMES[verbosity_key], verbosity_key)
-        idx = self.verbosity_combo.findData(self.config.verbosity_reduction)
+        self.verbosity_combo.addItems([VERBOSITY_DISPLAY_NAMES[key] for key in _VERBOSITY_KEYS])
+        for i, verbosity_key in enumerate(_VERBOSITY_KEYS):
+            self.verbosity_combo.setItemData(i, verbosity_key)
+        idx = _VERBOSITY_INDEX.get(self.config.verbosity_reduction, -1)
         if idx >= 0:
             self.verbosity_combo.setCurrentIndex(idx)
-        self.verbosity_combo.currentIndexChanged.connect(self._on_tone_changed)
+        self.verbosity_combo.currentIndexChanged.connect(self._on_verbosity_changed)
 
         verbosity_row.addWidget(self.verbosity_combo)
         verbosity_row.addStretch()
@@ -1226,25 +1255,37 @@ class PromptEditorWindow(QMainWindow):
         self.writing_sample_edit.textChanged.connect(self._on_writing_sample_changed)
         parent_layout.addWidget(self.writing_sample_edit)
 
-    def _on_tone_changed(self):
-        """Handle formality or verbosity change."""
-        # Update formality
-        for button in self.formality_group.buttons():
-            if button.isChecked():
-                self.config.formality_level = button.property("formality_key")
-                break
+    def _on_formality_clicked(self, button_id: int):
+        """Handle formality radio selection."""
+        self.config.formality_level = self._id_to_formality[button_id]
+        self._mark_config_dirty()
 
-        # Update verbosity
+    def _on_verbosity_changed(self):
+        """Handle verbosity change."""
         self.config.verbosity_reduction = self.verbosity_combo.currentData()
-
-        save_config(self.config)
+        self._mark_config_dirty()
 
     def _on_optional_changed(self, field_name: str, state: int):
         """Handle optional checkbox change."""
         setattr(self.config, field_name, state == Qt.CheckState.Checked.value)
-        save_config(self.config)
+        self._mark_config_dirty()
 
     def _on_writing_sample_changed(self):
         """Handle writing sample change."""
         self.config.writing_sample = self.writing_sample_edit.toPlainText()
-        save_config(self.config)
+        self._mark_config_dirty()
+
+    def _mark_config_dirty(self):
+        """Schedule a single config save for the next event-loop idle."""
+        if self._config_dirty:
+            return
+        self._config_dirty = True
+        QTimer.singleShot(0, self._flush_config)
+
+    def _flush_config(self):
+        """Persist pending config changes, if any."""
+        if not self._config_dirty:
+            return
+        self._config_dirty = False
+        # Same single writer as Settings, so saves land in order
+        get_config_writer().request_save(self.config)
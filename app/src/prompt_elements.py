@@ -15,6 +15,11 @@ from dataclasses import dataclass, field
 import json
 from pathlib import Path
 
+try:
+    from .config import write_json_atomic
+except ImportError:
+    from config import write_json_atomic
+
 
 @dataclass
 class PromptElement:
@@ -323,8 +328,7 @@ def save_custom_stack(stack: PromptStack, config_dir: Path):
         data["stacks"].append(stack_dict)
 
     # Save
-    with open(stacks_file, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json_atomic(stacks_file, data)
 
 
 def delete_stack(stack_name: str, config_dir: Path):
@@ -341,8 +345,7 @@ def delete_stack(stack_name: str, config_dir: Path):
     data["stacks"] = [s for s in data["stacks"] if s["name"] != stack_name]
 
     # Save
-    with open(stacks_file, "w") as f:
-        json.dump(data, f, indent=2)
+    write_json_atomic(stacks_file, data)
 
 
 def load_custom_stacks(config_dir: Path) -> List[PromptStack]:
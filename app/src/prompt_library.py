@@ -20,6 +20,11 @@ from pathlib import Path
 import json
 import uuid
 
+try:
+    from .config import write_json_atomic
+except ImportError:
+    from config import write_json_atomic
+
 
 class PromptCategory(str, Enum):
     """Prompt categories for organization."""
@@ -882,13 +887,11 @@ class PromptLibrary:
     def _save_custom(self):
         """Save custom prompts to disk."""
         data = {"prompts": [c.to_dict() for c in self._custom.values()]}
-        with open(self.custom_prompts_file, "w") as f:
-            json.dump(data, f, indent=2)
+        write_json_atomic(self.custom_prompts_file, data)
 
     def _save_modifications(self):
         """Save modifications to disk."""
-        with open(self.modifications_file, "w") as f:
-            json.dump(self._modifications, f, indent=2)
+        write_json_atomic(self.modifications_file, self._modifications)
 
     def get(self, prompt_id: str) -> Optional[PromptConfig]:
         """Get a prompt config by ID, applying any user modifications."""
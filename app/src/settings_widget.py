@@ -1,32 +1,141 @@
 """Unified Settings widget combining all configuration options."""
 
+from contextlib import contextmanager
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Optional
+
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTabWidget,
     QLineEdit, QCheckBox, QComboBox, QGroupBox, QFormLayout,
     QPushButton, QSpinBox, QFrame, QMessageBox, QFileDialog,
-    QTextEdit, QScrollArea, QDialog, QDialogButtonBox,
+    QTextEdit, QScrollArea, QDialog, QDialogButtonBox, QGridLayout,
+    QApplication, QProgressDialog,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QTimer, QThread, QSignalBlocker
+from PyQt6.QtGui import QFont, QStandardItem, QStandardItemModel
 
 from .config import (
-    Config, save_config, load_env_keys,
+    Config, load_env_keys, CONFIG_DIR,
     GEMINI_MODELS, OPENROUTER_MODELS,
+    GEMINI_MODEL_NAMES_TEXT, OPENROUTER_MODEL_NAMES_TEXT,
     MODEL_TIERS,
 )
+from .config_writer import get_config_writer
 from .mic_test_widget import MicTestWidget
-from .ui_utils import get_provider_icon, get_model_icon
+from .ui_utils import get_provider_icon, get_font, get_title_font
 from PyQt6.QtCore import QSize
 from PyQt6.QtGui import QIcon
-from pathlib import Path
+
+
+# Delay after the last settings edit before config is written (ms)
+SAVE_DEBOUNCE_MS = 400
+
+# Database location shown on the Database tab
+_DB_PATH_STR = str(CONFIG_DIR / "mongita")
+
+# Model list labels for the API Keys tab
+_MODELS_HTML = (
+    f"<p><b>Gemini (Direct):</b> {GEMINI_MODEL_NAMES_TEXT}</p>"
+    f"<p><b>OpenRouter:</b> {OPENROUTER_MODEL_NAMES_TEXT}</p>"
+)
+
+
+@contextmanager
+def _blocked(*widgets: QWidget):
+    """Block signals from the given widgets for the duration of the block.
+
+    Signals are restored even if the block raises.
+    """
+    blockers = [QSignalBlocker(w) for w in widgets]
+    try:
+        yield
+    finally:
+        for blocker in blockers:
+            blocker.unblock()
+
+
+def _make_save_timer(parent: QWidget, slot) -> QTimer:
+    """Create a single-shot timer that coalesces bursts of edits into one save."""
+    timer = QTimer(parent)
+    timer.setSingleShot(True)
+    timer.setInterval(SAVE_DEBOUNCE_MS)
+    timer.timeout.connect(slot)
+    return timer
+
+
+def _default_queue_save(parent: QWidget, config: Config) -> Callable[[], None]:
+    """Debounced save for a section used outside SettingsWidget.
+
+    Gives standalone sections the same "save once edits pause" behaviour as
+    the shared SettingsWidget timer, so queue_save means the same thing in
+    every section.
+    """
+    timer = _make_save_timer(parent, lambda: get_config_writer().request_save(config))
+    return timer.start
+
+
+# Main provider dropdown, in display order (Gemini first as recommended):
+# (display name, internal provider name, icon key)
+_PROVIDER_OPTIONS = (
+    ("Google Gemini (Recommended)", "gemini", "google"),
+    ("OpenRouter", "openrouter", "openrouter"),
+)
+_PROVIDER_DISPLAY_TO_INTERNAL = MappingProxyType(
+    {display: internal for display, internal, _ in _PROVIDER_OPTIONS}
+)
+# internal provider name -> row in the provider dropdown
+_PROVIDER_ROW = MappingProxyType(
+    {internal: row for row, (_, internal, _) in enumerate(_PROVIDER_OPTIONS)}
+)
+
+# provider -> {model_id: row} in that provider's model dropdown
+_MODEL_ROW_INDEX = {
+    "gemini": {model_id: row for row, (model_id, _) in enumerate(GEMINI_MODELS)},
+    "openrouter": {model_id: row for row, (model_id, _) in enumerate(OPENROUTER_MODELS)},
+}
+
+
+def _make_title(text: str) -> QLabel:
+    """Create a section title label in the shared title font."""
+    title = QLabel(text)
+    title.setFont(get_title_font())
+    return title
+
+
+def _make_form(parent: Optional[QWidget] = None, expanding: bool = True) -> QFormLayout:
+    """Create a settings form layout with the standard row spacing.
+
+    Args:
+        parent: Widget (usually a QGroupBox) to install the layout on
+        expanding: Let fields grow to fill the available width
+    """
+    form = QFormLayout(parent) if parent is not None else QFormLayout()
+    form.setSpacing(12)
+    if expanding:
+        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+    return form
+
+
+def _add_help_row(form: QFormLayout, label: str, control: QWidget, help_text: str):
+    """Add a form row with a small help line beneath the control.
+
+    The help text goes in its own row of the form rather than a nested
+    layout, keeping the layout tree flat.
+    """
+    form.addRow(label, control)
+    help_label = QLabel(help_text)
+    help_label.setObjectName("HelpSmall")
+    form.addRow("", help_label)
 
 
 class APIKeysWidget(QWidget):
     """API Keys configuration section."""
 
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, config: Config, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
+        self._queue_save = queue_save or _default_queue_save(self, config)
         self._init_ui()
 
     def _init_ui(self):
@@ -35,8 +144,7 @@ class APIKeysWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("API Keys")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("API Keys")
         layout.addWidget(title)
 
         desc = QLabel(
@@ -44,25 +152,22 @@ class APIKeysWidget(QWidget):
             "Gemini direct is recommended for access to the dynamic 'gemini-flash-latest' endpoint."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #666; margin-bottom: 12px;")
+        desc.setObjectName("DescLabel")
         layout.addWidget(desc)
 
         # API Keys form
-        api_form = QFormLayout()
-        api_form.setSpacing(12)
-        api_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        api_form = _make_form()
 
         # Gemini (recommended)
         self.gemini_key = QLineEdit()
         self.gemini_key.setText(self.config.gemini_api_key)
         self.gemini_key.setPlaceholderText("AI...")
         self.gemini_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self.gemini_key.textChanged.connect(lambda: self._save_key("gemini_api_key", self.gemini_key.text()))
 
         gem_layout = QVBoxLayout()
         gem_layout.addWidget(self.gemini_key)
         gem_help = QLabel("⭐ Recommended: Supports dynamic 'gemini-flash-latest' endpoint")
-        gem_help.setStyleSheet("color: #28a745; font-size: 10px; margin-left: 2px;")
+        gem_help.setObjectName("KeyHelpRecommended")
         gem_layout.addWidget(gem_help)
         api_form.addRow("Gemini API Key:", gem_layout)
 
@@ -71,61 +176,63 @@ class APIKeysWidget(QWidget):
         self.openrouter_key.setText(self.config.openrouter_api_key)
         self.openrouter_key.setPlaceholderText("sk-or-v1-...")
         self.openrouter_key.setEchoMode(QLineEdit.EchoMode.Password)
-        self.openrouter_key.textChanged.connect(lambda: self._save_key("openrouter_api_key", self.openrouter_key.text()))
 
         or_layout = QVBoxLayout()
         or_layout.addWidget(self.openrouter_key)
         or_help = QLabel("Alternative: Access Gemini models via OpenAI-compatible API")
-        or_help.setStyleSheet("color: #666; font-size: 10px; margin-left: 2px;")
+        or_help.setObjectName("KeyHelp")
         or_layout.addWidget(or_help)
         api_form.addRow("OpenRouter API Key:", or_layout)
 
         layout.addLayout(api_form)
 
+        # One slot handles every key field, keyed by the emitting widget
+        self._key_field_map = {
+            self.gemini_key: "gemini_api_key",
+            self.openrouter_key: "openrouter_api_key",
+        }
+        for field in self._key_field_map:
+            field.textChanged.connect(self._on_key_changed)
+
         # Available models section
         models_group = QGroupBox("Available Models by Provider")
-        models_group.setStyleSheet("""
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #ced4da;
-                border-radius: 6px;
-                margin-top: 12px;
-                padding-top: 12px;
-            }
-        """)
+        models_group.setObjectName("ModelsGroup")
         models_layout = QVBoxLayout(models_group)
         models_layout.setSpacing(8)
 
-        # Gemini models (primary)
-        gem_models = [name for _, name in GEMINI_MODELS]
-        gem_label = QLabel("<b>Gemini (Direct):</b> " + ", ".join(gem_models))
-        gem_label.setWordWrap(True)
-        gem_label.setStyleSheet("padding: 4px;")
-        models_layout.addWidget(gem_label)
-
-        # OpenRouter models
-        or_models = [name for _, name in OPENROUTER_MODELS]
-        or_label = QLabel("<b>OpenRouter:</b> " + ", ".join(or_models))
-        or_label.setWordWrap(True)
-        or_label.setStyleSheet("padding: 4px;")
-        models_layout.addWidget(or_label)
+        # Gemini (primary) and OpenRouter models in one rich-text label
+        models_label = QLabel(_MODELS_HTML)
+        models_label.setTextFormat(Qt.TextFormat.RichText)
+        models_label.setWordWrap(True)
+        models_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
+        models_label.setObjectName("ModelList")
+        models_layout.addWidget(models_label)
 
         layout.addWidget(models_group)
         layout.addStretch()
 
+    def _on_key_changed(self, text: str):
+        """Handle an edit in any API key field."""
+        self._save_key(self._key_field_map[self.sender()], text)
+
     def _save_key(self, key_name: str, value: str):
-        """Save API key to config."""
+        """Update API key in config; the write is queued until edits pause."""
+        if getattr(self.config, key_name) == value:
+            return
         setattr(self.config, key_name, value)
-        save_config(self.config)
+        self._queue_save()
 
 
 class AudioMicWidget(QWidget):
     """Audio device and microphone testing section."""
 
-    def __init__(self, config: Config, recorder, parent=None):
+    def __init__(self, config: Config, recorder, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
         self.recorder = recorder
+        # Devices currently listed in the combo (after the "Default" entry)
+        self._listed_devices: list[tuple[int, str]] | None = None
+        self._queue_save = queue_save or _default_queue_save(self, config)
         self._init_ui()
 
     def _init_ui(self):
@@ -134,25 +241,24 @@ class AudioMicWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Mic")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Mic")
         layout.addWidget(title)
 
         # Audio device selection
         device_group = QGroupBox("Input Device")
-        device_layout = QFormLayout(device_group)
-        device_layout.setSpacing(12)
+        device_layout = _make_form(device_group, expanding=False)
 
+        # Fill and select before connecting, so building the tab doesn't save
         self.device_combo = QComboBox()
-        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
         self._populate_devices()
+        self.device_combo.currentIndexChanged.connect(self._on_device_changed)
 
         device_row = QHBoxLayout()
         device_row.addWidget(self.device_combo, 1)
 
         refresh_btn = QPushButton("Refresh")
         refresh_btn.setFixedWidth(80)
-        refresh_btn.clicked.connect(self._populate_devices)
+        refresh_btn.clicked.connect(self._force_refresh_devices)
         device_row.addWidget(refresh_btn)
 
         device_layout.addRow("Microphone:", device_row)
@@ -160,8 +266,8 @@ class AudioMicWidget(QWidget):
 
         # Integrated Mic Test
         mic_test_title = QLabel("Microphone Test")
-        mic_test_title.setFont(QFont("Sans", 13, QFont.Weight.Bold))
-        mic_test_title.setStyleSheet("margin-top: 12px;")
+        mic_test_title.setFont(get_font("Sans", 13, QFont.Weight.Bold))
+        mic_test_title.setObjectName("SubsectionTitle")
         layout.addWidget(mic_test_title)
 
         self.mic_test_widget = MicTestWidget()
@@ -169,21 +275,44 @@ class AudioMicWidget(QWidget):
 
         layout.addStretch()
 
-    def _populate_devices(self):
+    def _populate_devices(self, refresh: bool = False):
         """Populate device dropdown."""
-        self.device_combo.clear()
-        self.device_combo.addItem("Default", None)
+        devices = self.recorder.get_input_devices(refresh=refresh)
+
+        # Leave the combo alone if the device list hasn't changed
+        if devices == self._listed_devices:
+            return
+
+        # Rebuilding the list moves the current index several times; block
+        # signals so that doesn't save config on every step
+        with _blocked(self.device_combo):
+            self.device_combo.clear()
+            self.device_combo.addItem("Default", None)
+
+            current_row = 0
+            for row, (idx, name) in enumerate(devices, start=1):
+                self.device_combo.addItem(name, idx)
+                if idx == self.config.audio_device_index:
+                    current_row = row
+            self.device_combo.setCurrentIndex(current_row)
+        self._listed_devices = devices
+
+        # Save once if the configured device is no longer available
+        if self.device_combo.currentData() != self.config.audio_device_index:
+            self._on_device_changed()
+
+    def refresh(self):
+        """Re-sync the device list (cheap while the device cache is fresh)."""
+        self._populate_devices()
 
-        devices = self.recorder.get_input_devices()
-        for idx, name in devices:
-            self.device_combo.addItem(name, idx)
-            if idx == self.config.audio_device_index:
-                self.device_combo.setCurrentIndex(self.device_combo.count() - 1)
+    def _force_refresh_devices(self):
+        """Rescan audio devices, discarding the cached list."""
+        self._populate_devices(refresh=True)
 
     def _on_device_changed(self):
         """Handle device selection change."""
         self.config.audio_device_index = self.device_combo.currentData()
-        save_config(self.config)
+        self._queue_save()
         if self.config.audio_device_index is not None:
             self.recorder.set_device(self.config.audio_device_index)
 
@@ -191,9 +320,23 @@ class AudioMicWidget(QWidget):
 class BehaviorWidget(QWidget):
     """Behavior settings section."""
 
-    def __init__(self, config: Config, parent=None):
+    # (display, value) choices for the combos, with value -> row lookups
+    AUDIO_FEEDBACK_MODES = [
+        ("Beeps", "beeps"),
+        ("Voice (TTS)", "tts"),
+        ("Silent", "silent"),
+    ]
+    APPEND_POSITIONS = [
+        ("End of document", "end"),
+        ("At cursor position", "cursor"),
+    ]
+    _FEEDBACK_INDEX = {value: i for i, (_, value) in enumerate(AUDIO_FEEDBACK_MODES)}
+    _APPEND_INDEX = {value: i for i, (_, value) in enumerate(APPEND_POSITIONS)}
+
+    def __init__(self, config: Config, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
+        self._queue_save = queue_save or _default_queue_save(self, config)
         self._init_ui()
 
     def _init_ui(self):
@@ -202,91 +345,103 @@ class BehaviorWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Behavior Settings")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Behavior Settings")
         layout.addWidget(title)
 
         # Form layout for settings
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        form = _make_form()
 
         # VAD
         self.vad_enabled = QCheckBox()
         self.vad_enabled.setChecked(self.config.vad_enabled)
-        self.vad_enabled.toggled.connect(lambda v: self._save_bool("vad_enabled", v))
-        vad_layout = QVBoxLayout()
-        vad_layout.addWidget(self.vad_enabled)
-        vad_help = QLabel("Removes silence before transcription (reduces cost)")
-        vad_help.setStyleSheet("color: #666; font-size: 10px;")
-        vad_layout.addWidget(vad_help)
-        form.addRow("Enable VAD:", vad_layout)
+        self.vad_enabled.clicked.connect(self._on_vad_clicked)
+        _add_help_row(
+            form, "Enable VAD:", self.vad_enabled,
+            "Removes silence before transcription (reduces cost)",
+        )
 
         # AGC info (always enabled, not configurable)
         agc_info = QLabel("✓ Automatic Gain Control (AGC) is always enabled to normalize audio levels")
         agc_info.setWordWrap(True)
-        agc_info.setStyleSheet("color: #28a745; font-size: 11px; margin: 8px 0;")
+        agc_info.setObjectName("AgcInfo")
         form.addRow("", agc_info)
 
         # Audio archival
         self.store_audio = QCheckBox()
         self.store_audio.setChecked(self.config.store_audio)
-        self.store_audio.toggled.connect(lambda v: self._save_bool("store_audio", v))
-        archive_layout = QVBoxLayout()
-        archive_layout.addWidget(self.store_audio)
-        archive_help = QLabel("Save audio recordings in Opus format (~24kbps)")
-        archive_help.setStyleSheet("color: #666; font-size: 10px;")
-        archive_layout.addWidget(archive_help)
-        form.addRow("Archive Audio:", archive_layout)
+        self.store_audio.clicked.connect(self._on_store_audio_clicked)
+        _add_help_row(
+            form, "Archive Audio:", self.store_audio,
+            "Save audio recordings in Opus format (~24kbps)",
+        )
 
         # Audio feedback mode
-        audio_feedback_layout = QVBoxLayout()
         self.audio_feedback_mode = QComboBox()
-        self.audio_feedback_mode.addItem("Beeps", "beeps")
-        self.audio_feedback_mode.addItem("Voice (TTS)", "tts")
-        self.audio_feedback_mode.addItem("Silent", "silent")
+        for label, value in self.AUDIO_FEEDBACK_MODES:
+            self.audio_feedback_mode.addItem(label, value)
         # Set current value
-        idx = self.audio_feedback_mode.findData(self.config.audio_feedback_mode)
-        if idx >= 0:
+        idx = self._FEEDBACK_INDEX.get(self.config.audio_feedback_mode)
+        if idx is not None:
             self.audio_feedback_mode.setCurrentIndex(idx)
         self.audio_feedback_mode.currentIndexChanged.connect(self._on_audio_feedback_mode_changed)
-        audio_feedback_layout.addWidget(self.audio_feedback_mode)
-        audio_feedback_help = QLabel("Audio notifications for recording start/stop, transcription complete, etc.")
-        audio_feedback_help.setStyleSheet("color: #666; font-size: 10px;")
-        audio_feedback_layout.addWidget(audio_feedback_help)
-        form.addRow("Audio feedback:", audio_feedback_layout)
+        _add_help_row(
+            form, "Audio feedback:", self.audio_feedback_mode,
+            "Audio notifications for recording start/stop, transcription complete, etc.",
+        )
 
         # Note: Output mode (App Only / Clipboard / Inject) is now on the main recording page
 
         # Append position (where to insert text in append mode)
-        append_pos_layout = QVBoxLayout()
         self.append_position = QComboBox()
-        self.append_position.addItem("End of document", "end")
-        self.append_position.addItem("At cursor position", "cursor")
+        for label, value in self.APPEND_POSITIONS:
+            self.append_position.addItem(label, value)
         # Set current value
-        idx = self.append_position.findData(self.config.append_position)
-        if idx >= 0:
+        idx = self._APPEND_INDEX.get(self.config.append_position)
+        if idx is not None:
             self.append_position.setCurrentIndex(idx)
         self.append_position.currentIndexChanged.connect(self._on_append_position_changed)
-        append_pos_layout.addWidget(self.append_position)
-        append_pos_help = QLabel("Where to insert text when using append mode (F16/F19 workflow).")
-        append_pos_help.setStyleSheet("color: #666; font-size: 10px;")
-        append_pos_layout.addWidget(append_pos_help)
-        form.addRow("Append position:", append_pos_layout)
+        _add_help_row(
+            form, "Append position:", self.append_position,
+            "Where to insert text when using append mode (F16/F19 workflow).",
+        )
 
         layout.addLayout(form)
         layout.addStretch()
 
+    def refresh(self):
+        """Re-read values the main window can change while Settings is hidden."""
+        with _blocked(self.vad_enabled, self.store_audio, self.audio_feedback_mode, self.append_position):
+            self.vad_enabled.setChecked(self.config.vad_enabled)
+            self.store_audio.setChecked(self.config.store_audio)
+            idx = self._FEEDBACK_INDEX.get(self.config.audio_feedback_mode)
+            if idx is not None:
+                self.audio_feedback_mode.setCurrentIndex(idx)
+            idx = self._APPEND_INDEX.get(self.config.append_position)
+            if idx is not None:
+                self.append_position.setCurrentIndex(idx)
+
     def _save_bool(self, key: str, value: bool):
         """Save boolean config value."""
+        if getattr(self.config, key) == value:
+            return
         setattr(self.config, key, value)
-        save_config(self.config)
+        self._queue_save()
+
+    @pyqtSlot(bool)
+    def _on_vad_clicked(self, checked: bool):
+        """Save VAD toggle."""
+        self._save_bool("vad_enabled", checked)
+
+    @pyqtSlot(bool)
+    def _on_store_audio_clicked(self, checked: bool):
+        """Save audio archival toggle."""
+        self._save_bool("store_audio", checked)
 
     def _on_append_position_changed(self, index: int):
         """Save append position setting."""
         value = self.append_position.itemData(index)
         self.config.append_position = value
-        save_config(self.config)
+        self._queue_save()
 
     def _on_audio_feedback_mode_changed(self, index: int):
         """Save audio feedback mode setting."""
@@ -300,7 +455,7 @@ class BehaviorWidget(QWidget):
             get_announcer().announce_tts_deactivated()
 
         self.config.audio_feedback_mode = new_value
-        save_config(self.config)
+        self._queue_save()
 
         # Play TTS announcement for mode change (after saving, when TTS is now active)
         if old_value != "tts" and new_value == "tts":
@@ -312,9 +467,10 @@ class BehaviorWidget(QWidget):
 class PersonalizationWidget(QWidget):
     """Personalization settings section."""
 
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, config: Config, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
+        self._queue_save = queue_save or _default_queue_save(self, config)
         self._init_ui()
 
     def _init_ui(self):
@@ -324,43 +480,39 @@ class PersonalizationWidget(QWidget):
         scroll.setFrameShape(QFrame.Shape.NoFrame)
 
         container = QWidget()
+        # Suppress repaints while the email form is assembled; re-enabled below
+        container.setUpdatesEnabled(False)
         layout = QVBoxLayout(container)
         layout.setSpacing(16)
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Personalization")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Personalization")
         layout.addWidget(title)
 
         desc = QLabel("Customize your email signatures for business and personal communications.")
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #666; margin-bottom: 12px;")
+        desc.setObjectName("DescLabel")
         layout.addWidget(desc)
 
         # Form
-        form = QFormLayout()
-        form.setSpacing(12)
-        form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
+        form = _make_form()
 
         # Name
         self.name_edit = QLineEdit()
         self.name_edit.setText(self.config.user_name)
         self.name_edit.setPlaceholderText("Your name")
-        self.name_edit.textChanged.connect(lambda: self._save_str("user_name", self.name_edit.text()))
         form.addRow("Name:", self.name_edit)
 
         layout.addLayout(form)
 
         # Business Email Section
         business_group = QGroupBox("Business Email")
-        business_layout = QFormLayout(business_group)
-        business_layout.setSpacing(12)
+        business_layout = _make_form(business_group, expanding=False)
 
         self.business_email_edit = QLineEdit()
         self.business_email_edit.setText(self.config.business_email)
         self.business_email_edit.setPlaceholderText("work@company.com")
-        self.business_email_edit.textChanged.connect(lambda: self._save_str("business_email", self.business_email_edit.text()))
         business_layout.addRow("Email Address:", self.business_email_edit)
 
         business_sig_label = QLabel("Signature:")
@@ -369,20 +521,17 @@ class PersonalizationWidget(QWidget):
         self.business_signature_edit.setPlainText(self.config.business_signature)
         self.business_signature_edit.setPlaceholderText("Best regards,\nJohn Doe\nSenior Engineer\nCompany Inc.\nwork@company.com\n+1-555-0100")
         self.business_signature_edit.setMaximumHeight(120)
-        self.business_signature_edit.textChanged.connect(lambda: self._save_str("business_signature", self.business_signature_edit.toPlainText()))
         business_layout.addRow(business_sig_label, self.business_signature_edit)
 
         layout.addWidget(business_group)
 
         # Personal Email Section
         personal_group = QGroupBox("Personal Email")
-        personal_layout = QFormLayout(personal_group)
-        personal_layout.setSpacing(12)
+        personal_layout = _make_form(personal_group, expanding=False)
 
         self.personal_email_edit = QLineEdit()
         self.personal_email_edit.setText(self.config.personal_email)
         self.personal_email_edit.setPlaceholderText("personal@example.com")
-        self.personal_email_edit.textChanged.connect(lambda: self._save_str("personal_email", self.personal_email_edit.text()))
         personal_layout.addRow("Email Address:", self.personal_email_edit)
 
         personal_sig_label = QLabel("Signature:")
@@ -391,30 +540,56 @@ class PersonalizationWidget(QWidget):
         self.personal_signature_edit.setPlainText(self.config.personal_signature)
         self.personal_signature_edit.setPlaceholderText("Cheers,\nJohn")
         self.personal_signature_edit.setMaximumHeight(120)
-        self.personal_signature_edit.textChanged.connect(lambda: self._save_str("personal_signature", self.personal_signature_edit.toPlainText()))
         personal_layout.addRow(personal_sig_label, self.personal_signature_edit)
 
         layout.addWidget(personal_group)
 
         layout.addStretch()
 
+        # One slot handles every field, keyed by the emitting widget
+        self._field_map = {
+            self.name_edit: "user_name",
+            self.business_email_edit: "business_email",
+            self.business_signature_edit: "business_signature",
+            self.personal_email_edit: "personal_email",
+            self.personal_signature_edit: "personal_signature",
+        }
+        for field in self._field_map:
+            field.textChanged.connect(self._on_field_changed)
+
+        # Single repaint/polish pass for the whole form
+        container.setUpdatesEnabled(True)
+        container.ensurePolished()
+
         scroll.setWidget(container)
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(0, 0, 0, 0)
         main_layout.addWidget(scroll)
 
+    def _on_field_changed(self):
+        """Handle an edit in any personalization field."""
+        field = self.sender()
+        if isinstance(field, QTextEdit):
+            value = field.toPlainText()
+        else:
+            value = field.text()
+        self._save_str(self._field_map[field], value)
+
     def _save_str(self, key: str, value: str):
-        """Save string config value."""
+        """Update string config value; the write is queued until edits pause."""
+        if getattr(self.config, key) == value:
+            return
         setattr(self.config, key, value)
-        save_config(self.config)
+        self._queue_save()
 
 
 class HotkeysWidget(QWidget):
     """Hotkeys configuration section."""
 
-    # Signal emitted when hotkeys change (so main window can re-register)
-    hotkeys_changed = pyqtSignal()
+    # Signal emitted when hotkeys change (so main window can re-register):
+    # (field_name, old_value, new_value), or ("*", "", "") after a bulk reset
+    hotkeys_changed = pyqtSignal(str, str, str)
 
     # Available F-keys for hotkey mapping (F13-F24)
     AVAILABLE_KEYS = [
@@ -433,6 +608,9 @@ class HotkeysWidget(QWidget):
         ("f24", "F24"),
     ]
 
+    # Key value -> combo row, for selecting a key without findData() scans
+    _KEY_INDEX = {key_value: i for i, (key_value, _) in enumerate(AVAILABLE_KEYS)}
+
     # Hotkey function definitions: (config_field, display_name, description)
     HOTKEY_FUNCTIONS = [
         ("hotkey_toggle", "Toggle", "Start recording / Stop and transcribe"),
@@ -443,10 +621,13 @@ class HotkeysWidget(QWidget):
         ("hotkey_pause", "Pause", "Pause / Resume current recording"),
     ]
 
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, config: Config, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
+        self._queue_save = queue_save or _default_queue_save(self, config)
         self._combos = {}  # Store combo references for updates
+        self._value_to_field = {}  # Assigned key -> config field, for duplicate checks
+        self._bulk_update = False  # Set while combos are changed programmatically
         self._init_ui()
 
     def _init_ui(self):
@@ -455,8 +636,7 @@ class HotkeysWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Global Hotkeys")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Global Hotkeys")
         layout.addWidget(title)
 
         desc = QLabel(
@@ -465,75 +645,75 @@ class HotkeysWidget(QWidget):
             "Changes take effect immediately."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #666; margin-bottom: 12px;")
+        desc.setObjectName("DescLabel")
         layout.addWidget(desc)
 
-        # Hotkey configuration group with two-column layout
+        # Hotkey configuration group: two label/field column pairs in one grid
         config_group = QGroupBox("Hotkey Mappings")
-        columns_layout = QHBoxLayout(config_group)
-        columns_layout.setSpacing(24)
-
-        # Split hotkey functions into two columns
-        left_functions = self.HOTKEY_FUNCTIONS[:3]  # Toggle, Tap Toggle, Transcribe
-        right_functions = self.HOTKEY_FUNCTIONS[3:]  # Clear, Append, Pause
-
-        for column_functions in [left_functions, right_functions]:
-            column_form = QFormLayout()
-            column_form.setSpacing(12)
-            column_form.setFieldGrowthPolicy(QFormLayout.FieldGrowthPolicy.ExpandingFieldsGrow)
-
-            for field_name, display_name, description in column_functions:
-                # Create combo box for key selection
-                combo = QComboBox()
-                combo.setMinimumWidth(100)
-
-                # Add available keys
-                for key_value, key_display in self.AVAILABLE_KEYS:
-                    combo.addItem(key_display, key_value)
-
-                # Set current value from config
-                current_value = getattr(self.config, field_name, "").lower()
-                idx = combo.findData(current_value)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
+        grid = QGridLayout(config_group)
+        grid.setHorizontalSpacing(12)
+        grid.setVerticalSpacing(2)
+        grid.setColumnStretch(1, 1)
+        grid.setColumnStretch(3, 1)
+        grid.setColumnMinimumWidth(2, 80)  # Gap before the second column's labels
+
+        # Toggle, Tap Toggle, Transcribe on the left; Clear, Append, Pause on the right
+        rows_per_column = 3
+
+        # Current assignments, normalised once for all combos
+        config_hotkeys = {
+            field_name: getattr(self.config, field_name, "").lower()
+            for field_name, _, _ in self.HOTKEY_FUNCTIONS
+        }
+
+        for i, (field_name, display_name, description) in enumerate(self.HOTKEY_FUNCTIONS):
+            row = (i % rows_per_column) * 2  # Each hotkey takes a combo row and a description row
+            col = (i // rows_per_column) * 2
 
-                # Connect change handler
-                combo.currentIndexChanged.connect(
-                    lambda _, f=field_name, c=combo: self._on_hotkey_changed(f, c)
-                )
+            # Create combo box for key selection
+            combo = QComboBox()
+            combo.setMinimumWidth(100)
 
-                # Store reference
-                self._combos[field_name] = combo
+            # Add available keys
+            for key_value, key_display in self.AVAILABLE_KEYS:
+                combo.addItem(key_display, key_value)
 
-                # Create row with label and description
-                row_layout = QVBoxLayout()
-                row_layout.setSpacing(2)
-                row_layout.addWidget(combo)
-                desc_label = QLabel(description)
-                desc_label.setStyleSheet("color: #666; font-size: 10px;")
-                row_layout.addWidget(desc_label)
+            # Set current value from config
+            current_value = config_hotkeys[field_name]
+            combo.setCurrentIndex(self._KEY_INDEX.get(current_value, 0))
+            if current_value and current_value in self._KEY_INDEX:
+                self._value_to_field[current_value] = field_name
+
+            # Connect change handler
+            combo.currentIndexChanged.connect(
+                partial(self._on_hotkey_changed, field_name, combo)
+            )
 
-                column_form.addRow(f"{display_name}:", row_layout)
+            # Store reference
+            self._combos[field_name] = combo
 
-            columns_layout.addLayout(column_form)
+            # Combo with its description in the grid row below
+            desc_label = QLabel(description)
+            desc_label.setObjectName("HelpSmall")
+            desc_label.setContentsMargins(0, 0, 0, 10)  # Gap before the next hotkey
+
+            grid.addWidget(QLabel(f"{display_name}:"), row, col)
+            grid.addWidget(combo, row, col + 1)
+            grid.addWidget(desc_label, row + 1, col + 1)
 
         layout.addWidget(config_group)
 
-        # Quick reference for workflow
+        # Quick reference for workflow (static, so a single rich-text label)
         ref_group = QGroupBox("Workflow Reference")
         ref_layout = QVBoxLayout(ref_group)
-        ref_layout.setSpacing(6)
-
-        workflows = [
-            ("<b>Simple Workflow:</b> Toggle → Dictate → Toggle (transcribes automatically)", "#495057"),
-            ("<b>Append Workflow:</b> Tap Toggle → Dictate → Tap Toggle (caches) → Append → Dictate → Transcribe", "#495057"),
-        ]
 
-        for text, color in workflows:
-            label = QLabel(text)
-            label.setWordWrap(True)
-            label.setStyleSheet(f"color: {color}; font-size: 11px; padding: 4px;")
-            ref_layout.addWidget(label)
+        workflow_label = QLabel(
+            "<b>Simple Workflow:</b> Toggle → Dictate → Toggle (transcribes automatically)<br><br>"
+            "<b>Append Workflow:</b> Tap Toggle → Dictate → Tap Toggle (caches) → Append → Dictate → Transcribe"
+        )
+        workflow_label.setWordWrap(True)
+        workflow_label.setObjectName("WorkflowLabel")
+        ref_layout.addWidget(workflow_label)
 
         layout.addWidget(ref_group)
 
@@ -548,26 +728,40 @@ class HotkeysWidget(QWidget):
 
         layout.addStretch()
 
-    def _on_hotkey_changed(self, field_name: str, combo: QComboBox):
+    def _on_hotkey_changed(self, field_name: str, combo: QComboBox, _index: int = -1):
         """Handle hotkey selection change."""
+        if self._bulk_update:
+            return
+
         new_value = combo.currentData()
+        old_value = getattr(self.config, field_name, "").lower()
+
+        # Nothing to save or re-register if the key didn't actually change
+        if new_value == old_value:
+            return
+
+        # Release the key this field held before
+        if self._value_to_field.get(old_value) == field_name:
+            del self._value_to_field[old_value]
 
         # Check for duplicate key assignment
         if new_value:  # Only check if not disabled
-            for other_field, other_combo in self._combos.items():
-                if other_field != field_name and other_combo.currentData() == new_value:
-                    # Duplicate found - show warning and clear the other one
-                    other_combo.blockSignals(True)
+            other_field = self._value_to_field.get(new_value)
+            if other_field is not None and other_field != field_name:
+                # Duplicate found - clear the other one
+                other_combo = self._combos[other_field]
+                with _blocked(other_combo):
                     other_combo.setCurrentIndex(0)  # Set to "Disabled"
-                    other_combo.blockSignals(False)
-                    setattr(self.config, other_field, "")
+                setattr(self.config, other_field, "")
+                self.hotkeys_changed.emit(other_field, new_value, "")
+            self._value_to_field[new_value] = field_name
 
         # Save the new value
         setattr(self.config, field_name, new_value)
-        save_config(self.config)
+        self._queue_save()
 
-        # Emit signal so main window can re-register hotkeys
-        self.hotkeys_changed.emit()
+        # Emit signal so main window can re-register this hotkey
+        self.hotkeys_changed.emit(field_name, old_value, new_value)
 
     def _reset_to_defaults(self):
         """Reset all hotkeys to default values."""
@@ -580,18 +774,64 @@ class HotkeysWidget(QWidget):
             "hotkey_pause": "f20",
         }
 
-        for field_name, default_value in defaults.items():
-            setattr(self.config, field_name, default_value)
-            combo = self._combos.get(field_name)
-            if combo:
-                combo.blockSignals(True)
-                idx = combo.findData(default_value)
-                if idx >= 0:
-                    combo.setCurrentIndex(idx)
-                combo.blockSignals(False)
+        # Apply all defaults, then save and notify once
+        self._bulk_update = True
+        try:
+            for field_name, default_value in defaults.items():
+                setattr(self.config, field_name, default_value)
+                combo = self._combos.get(field_name)
+                if combo:
+                    combo.setCurrentIndex(self._KEY_INDEX[default_value])
+        finally:
+            self._bulk_update = False
+        self._value_to_field = {value: field for field, value in defaults.items()}
+
+        self._queue_save()
+        self.hotkeys_changed.emit("*", "", "")
+
+
+class DatabaseExportWorker(QThread):
+    """Background thread that streams the transcription history to JSON."""
 
-        save_config(self.config)
-        self.hotkeys_changed.emit()
+    finished = pyqtSignal(int)  # Number of exported transcriptions
+    progress = pyqtSignal(int)  # Transcriptions written so far
+    error = pyqtSignal(str)
+
+    def __init__(self, file_path: str, pretty: bool = False):
+        super().__init__()
+        self.file_path = file_path
+        self.pretty = pretty
+
+    def run(self):
+        from .database_mongo import get_db
+
+        try:
+            count = get_db().export_to_json(
+                self.file_path,
+                pretty=self.pretty,
+                progress_callback=self.progress.emit,
+            )
+            self.finished.emit(count)
+        except Exception as e:
+            self.error.emit(str(e))
+
+
+class ClearHistoryWorker(QThread):
+    """Background thread that deletes all history and compacts the database."""
+
+    finished = pyqtSignal(int)  # Number of deleted transcriptions
+    error = pyqtSignal(str)
+
+    def run(self):
+        from .database_mongo import get_db
+
+        try:
+            db = get_db()
+            deleted_count = db.delete_all()
+            db.vacuum()
+            self.finished.emit(deleted_count)
+        except Exception as e:
+            self.error.emit(str(e))
 
 
 class DatabaseWidget(QWidget):
@@ -600,6 +840,14 @@ class DatabaseWidget(QWidget):
     def __init__(self, config: Config, parent=None):
         super().__init__(parent)
         self.config = config
+        self._export_worker = None
+        self._export_progress = None
+        self._clear_worker = None
+        self._clear_progress = None
+        self._db = None
+        # Message boxes are built on first use and reused afterwards
+        self._notice_box = None
+        self._confirm_clear_box = None
         self._init_ui()
 
     def _init_ui(self):
@@ -608,24 +856,20 @@ class DatabaseWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Database Management")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Database Management")
         layout.addWidget(title)
 
         desc = QLabel("Manage your transcription history and local data.")
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #666; margin-bottom: 12px;")
+        desc.setObjectName("DescLabel")
         layout.addWidget(desc)
 
         # Database info
         info_group = QGroupBox("Database Location")
         info_layout = QVBoxLayout(info_group)
 
-        from pathlib import Path
-        config_dir = Path.home() / ".config" / "voice-notepad-v3"
-
-        path_label = QLabel(str(config_dir / "mongita"))
-        path_label.setStyleSheet("font-family: monospace; color: #495057; padding: 8px;")
+        path_label = QLabel(_DB_PATH_STR)
+        path_label.setObjectName("MonoPath")
         path_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         info_layout.addWidget(path_label)
 
@@ -637,101 +881,255 @@ class DatabaseWidget(QWidget):
         actions_layout.setSpacing(8)
 
         # Export button
-        export_btn = QPushButton("Export Database")
-        export_btn.setToolTip("Export all transcriptions to JSON")
-        export_btn.clicked.connect(self._export_database)
-        actions_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export Database")
+        self.export_btn.setToolTip("Export all transcriptions to JSON")
+        self.export_btn.clicked.connect(self._export_database)
+        actions_layout.addWidget(self.export_btn)
 
         # Clear history button
-        clear_btn = QPushButton("Clear All History")
-        clear_btn.setToolTip("Delete all transcription history")
-        clear_btn.setStyleSheet("background-color: #dc3545; color: white;")
-        clear_btn.clicked.connect(self._clear_history)
-        actions_layout.addWidget(clear_btn)
+        self.clear_btn = QPushButton("Clear All History")
+        self.clear_btn.setToolTip("Delete all transcription history")
+        self.clear_btn.setObjectName("DangerButton")
+        self.clear_btn.clicked.connect(self._clear_history)
+        actions_layout.addWidget(self.clear_btn)
 
         layout.addWidget(actions_group)
         layout.addStretch()
 
     def _export_database(self):
         """Export database to JSON."""
-        file_path, _ = QFileDialog.getSaveFileName(
+        pretty_filter = "Pretty JSON (*.json)"
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export Database",
             "voice-notepad-export.json",
-            "JSON Files (*.json)"
+            f"JSON Files (*.json);;{pretty_filter}"
         )
-        if file_path:
-            try:
-                from .database_mongo import get_db
-                import json
-
-                db = get_db()
-                transcriptions = list(db["transcriptions"].find({}))
-
-                # Convert ObjectId to string
-                for t in transcriptions:
-                    if "_id" in t:
-                        t["_id"] = str(t["_id"])
-
-                with open(file_path, "w") as f:
-                    json.dump(transcriptions, f, indent=2, default=str)
-
-                QMessageBox.information(
-                    self,
-                    "Export Complete",
-                    f"Exported {len(transcriptions)} transcriptions to {file_path}"
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Export Failed", f"Error: {e}")
-
-    def _clear_history(self):
-        """Clear all transcription history."""
-        from .database_mongo import get_db
+        if not file_path:
+            return
+        if self._export_worker is not None and self._export_worker.isRunning():
+            return
 
-        db = get_db()
-        total_count = db.get_total_count()
+        self.export_btn.setEnabled(False)
 
-        if total_count == 0:
-            QMessageBox.information(
-                self,
-                "No History",
-                "There are no transcriptions to delete.",
+        # Progress dialog sized from the record count; the export runs in the worker
+        if self._export_progress is None:
+            self._export_progress = QProgressDialog(
+                "Exporting transcriptions...", None, 0, 0, self
             )
-            return
+            self._export_progress.setWindowTitle("Export Database")
+            self._export_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._export_progress.setMinimumDuration(500)
+            self._export_progress.setAutoClose(False)
+            self._export_progress.setAutoReset(False)
+        self._export_progress.setRange(0, self._get_db().get_total_count())
+        self._export_progress.setValue(0)
+
+        self._export_worker = DatabaseExportWorker(
+            file_path, pretty=selected_filter == pretty_filter
+        )
+        self._export_worker.progress.connect(self._export_progress.setValue)
+        self._export_worker.finished.connect(
+            partial(self._on_export_finished, file_path)
+        )
+        self._export_worker.error.connect(self._on_export_error)
+        self._export_worker.start()
+
+    def _on_export_finished(self, file_path: str, count: int):
+        """Report a completed export."""
+        self._export_progress.reset()
+        self.export_btn.setEnabled(True)
+        self._show_notice(
+            "Export Complete",
+            f"Exported {count} transcriptions to {file_path}"
+        )
 
-        reply = QMessageBox.warning(
-            self,
-            "Delete All History",
+    def _on_export_error(self, message: str):
+        """Report a failed export."""
+        self._export_progress.reset()
+        self.export_btn.setEnabled(True)
+        QMessageBox.critical(self, "Export Failed", f"Error: {message}")
+
+    def _show_notice(self, title: str, text: str):
+        """Show a non-modal information box that doesn't block the event loop."""
+        if self._notice_box is None:
+            self._notice_box = QMessageBox(self)
+            self._notice_box.setIcon(QMessageBox.Icon.Information)
+            self._notice_box.setWindowModality(Qt.WindowModality.NonModal)
+        self._notice_box.setWindowTitle(title)
+        self._notice_box.setText(text)
+        self._notice_box.show()
+        self._notice_box.raise_()
+
+    def _confirm_clear(self, total_count: int) -> bool:
+        """Ask for confirmation before deleting all history."""
+        if self._confirm_clear_box is None:
+            box = QMessageBox(self)
+            box.setIcon(QMessageBox.Icon.Warning)
+            box.setWindowTitle("Delete All History")
+            box.setStandardButtons(QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
+            box.setDefaultButton(QMessageBox.StandardButton.No)
+            self._confirm_clear_box = box
+        else:
+            # Reset the default in case the last answer moved focus to Yes
+            self._confirm_clear_box.setDefaultButton(QMessageBox.StandardButton.No)
+
+        self._confirm_clear_box.setText(
             f"Are you sure you want to delete ALL {total_count} transcriptions?\n\n"
             "This will permanently delete:\n"
             "• All transcript text\n"
             "• All archived audio files\n"
             "• All metadata and statistics\n\n"
-            "THIS CANNOT BE UNDONE!",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            "THIS CANNOT BE UNDONE!"
         )
+        return self._confirm_clear_box.exec() == QMessageBox.StandardButton.Yes
 
-        if reply == QMessageBox.StandardButton.Yes:
-            try:
-                deleted_count = db.delete_all()
-                db.vacuum()
-                QMessageBox.information(
-                    self,
-                    "History Cleared",
-                    f"Successfully deleted {deleted_count} transcriptions.\n\n"
-                    "Database has been optimized to reclaim disk space.",
-                )
-            except Exception as e:
-                QMessageBox.critical(self, "Clear Failed", f"Error: {e}")
+    def _get_db(self):
+        """Return the database handle, looked up on first use."""
+        if self._db is None:
+            from .database_mongo import get_db
+            self._db = get_db()
+        return self._db
+
+    def _clear_history(self):
+        """Clear all transcription history."""
+        if self._clear_worker is not None and self._clear_worker.isRunning():
+            return
+
+        db = self._get_db()
+        total_count = db.get_total_count()
+
+        if total_count == 0:
+            self._show_notice("No History", "There are no transcriptions to delete.")
+            return
+
+        if not self._confirm_clear(total_count):
+            return
+
+        # Deleting and vacuuming can take a while; run it off the GUI thread
+        # behind a busy indicator
+        self.clear_btn.setEnabled(False)
+        if self._clear_progress is None:
+            self._clear_progress = QProgressDialog(
+                "Deleting transcriptions...", None, 0, 0, self
+            )
+            self._clear_progress.setWindowTitle("Clear All History")
+            self._clear_progress.setWindowModality(Qt.WindowModality.WindowModal)
+            self._clear_progress.setMinimumDuration(0)
+            self._clear_progress.setAutoClose(False)
+            self._clear_progress.setAutoReset(False)
+        self._clear_progress.show()
+
+        self._clear_worker = ClearHistoryWorker()
+        self._clear_worker.finished.connect(self._on_clear_finished)
+        self._clear_worker.error.connect(self._on_clear_error)
+        self._clear_worker.start()
+
+    def _on_clear_finished(self, deleted_count: int):
+        """Report a completed history wipe."""
+        self._clear_progress.reset()
+        self.clear_btn.setEnabled(True)
+        self._show_notice(
+            "History Cleared",
+            f"Successfully deleted {deleted_count} transcriptions.\n\n"
+            "Database has been optimized to reclaim disk space.",
+        )
+
+    def _on_clear_error(self, message: str):
+        """Report a failed history wipe."""
+        self._clear_progress.reset()
+        self.clear_btn.setEnabled(True)
+        QMessageBox.critical(self, "Clear Failed", f"Error: {message}")
+
+
+# Config attribute names for each preset field, so handlers don't format them per event
+_PRESET_ATTRS = {
+    preset_key: {field: f"{preset_key}_{field}" for field in ("name", "provider", "model")}
+    for preset_key in ("primary", "fallback")
+}
+
+
+class PresetSection(QFrame):
+    """Name, provider and model controls for one preset (primary or fallback).
+
+    The owning widget connects the controls' signals; each control carries a
+    "preset_key" property so one slot can serve both sections.
+    """
+
+    def __init__(self, preset_key: str, config: Config, parent=None):
+        super().__init__(parent)
+        self.preset_key = preset_key
+        attrs = _PRESET_ATTRS[preset_key]
+
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        self.setObjectName("PresetFrame")
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        layout.setContentsMargins(12, 10, 12, 10)
+
+        # Preset header
+        header_text = "Primary Model" if preset_key == "primary" else "Fallback Model"
+        header = QLabel(header_text)
+        header.setObjectName("PresetHeader")
+        layout.addWidget(header)
+
+        # Name field
+        self.name_edit = QLineEdit()
+        self.name_edit.setPlaceholderText("e.g., Flash Latest, Budget, Pro...")
+        self.name_edit.setMaximumWidth(200)
+        self.name_edit.setText(getattr(config, attrs["name"], ""))
+        layout.addLayout(self._make_row("Name:", self.name_edit))
+
+        # Provider dropdown
+        self.provider_combo = QComboBox()
+        self.provider_combo.setIconSize(QSize(16, 16))
+        self.provider_combo.addItem(get_provider_icon("google"), "Google Gemini", "gemini")
+        self.provider_combo.addItem(get_provider_icon("openrouter"), "OpenRouter", "openrouter")
+        current_provider = getattr(config, attrs["provider"], "") or "gemini"
+        idx = self.provider_combo.findData(current_provider)
+        if idx >= 0:
+            self.provider_combo.setCurrentIndex(idx)
+        layout.addLayout(self._make_row("Provider:", self.provider_combo))
+
+        # Model dropdown, filled by the owner from its shared model lists
+        self.model_combo = QComboBox()
+        self.model_combo.setMinimumWidth(200)
+        layout.addLayout(self._make_row("Model:", self.model_combo))
+
+        for control in (self.name_edit, self.provider_combo, self.model_combo):
+            control.setProperty("preset_key", preset_key)
+
+    @staticmethod
+    def _make_row(label_text: str, control: QWidget) -> QHBoxLayout:
+        """Lay out a label and its control, left-aligned."""
+        row = QHBoxLayout()
+        label = QLabel(label_text)
+        label.setObjectName("PresetLabel")
+        row.addWidget(label)
+        row.addWidget(control)
+        row.addStretch()
+        return row
 
 
 class ModelSelectionWidget(QWidget):
     """Model and provider selection section."""
 
-    def __init__(self, config: Config, parent=None):
+    def __init__(self, config: Config, queue_save=None, parent=None):
         super().__init__(parent)
         self.config = config
+        self._queue_save = queue_save or _default_queue_save(self, config)
+        self._saving_blocked = False  # Set while a batch of changes is applied
+        # One item model per provider, shared by every model dropdown; switching
+        # provider swaps the model instead of clearing and refilling the combo
+        self._model_lists = {
+            provider: self._build_model_list(provider)
+            for provider in ("gemini", "openrouter")
+        }
+        # Primary/fallback PresetSections, filled in when the presets group is built
+        self._preset_widgets = {}
+        # Provider whose model list each preset's model dropdown is showing
+        self._preset_last_provider: dict[str, str] = {}
+        self._presets_built = False
         self._init_ui()
 
     def _init_ui(self):
@@ -740,8 +1138,7 @@ class ModelSelectionWidget(QWidget):
         layout.setContentsMargins(16, 16, 16, 16)
 
         # Title
-        title = QLabel("Model")
-        title.setFont(QFont("Sans", 14, QFont.Weight.Bold))
+        title = _make_title("Model")
         layout.addWidget(title)
 
         desc = QLabel(
@@ -749,7 +1146,7 @@ class ModelSelectionWidget(QWidget):
             "Once you find a model that works within your budget, you typically won't need to change it often."
         )
         desc.setWordWrap(True)
-        desc.setStyleSheet("color: #666; margin-bottom: 12px;")
+        desc.setObjectName("DescLabel")
         layout.addWidget(desc)
 
         # Provider and model selection
@@ -764,22 +1161,14 @@ class ModelSelectionWidget(QWidget):
         self.provider_combo = QComboBox()
         self.provider_combo.setIconSize(QSize(16, 16))
 
-        # Add providers with icons (Gemini first as recommended)
-        providers = [
-            ("Google Gemini (Recommended)", "google"),
-            ("OpenRouter", "openrouter"),
-        ]
-        for display_name, provider_key in providers:
-            icon = get_provider_icon(provider_key)
-            self.provider_combo.addItem(icon, display_name)
+        # Add providers with icons
+        for display_name, _, icon_key in _PROVIDER_OPTIONS:
+            self.provider_combo.addItem(get_provider_icon(icon_key), display_name)
 
         # Set current provider
-        provider_map = {
-            "gemini": "Google Gemini (Recommended)",
-            "openrouter": "OpenRouter",
-        }
-        provider_display = provider_map.get(self.config.selected_provider, self.config.selected_provider.title())
-        self.provider_combo.setCurrentText(provider_display)
+        row = _PROVIDER_ROW.get(self.config.selected_provider)
+        if row is not None:
+            self.provider_combo.setCurrentIndex(row)
         self.provider_combo.currentTextChanged.connect(self._on_provider_changed)
         provider_layout.addWidget(self.provider_combo, 1)
 
@@ -790,8 +1179,6 @@ class ModelSelectionWidget(QWidget):
         model_layout.addWidget(QLabel("Model:"))
 
         self.model_combo = QComboBox()
-        self.model_combo.setIconSize(QSize(16, 16))
-        self._update_model_combo()
         self.model_combo.currentIndexChanged.connect(self._on_model_changed)
         model_layout.addWidget(self.model_combo, 1)
 
@@ -804,32 +1191,18 @@ class ModelSelectionWidget(QWidget):
         self.standard_btn = QPushButton("Standard")
         self.standard_btn.setCheckable(True)
         self.standard_btn.setMinimumWidth(80)
-        self.standard_btn.clicked.connect(lambda: self._set_model_tier("standard"))
+        self.standard_btn.setProperty("tier", "standard")
+        self.standard_btn.clicked.connect(self._on_tier_clicked)
 
         self.budget_btn = QPushButton("Budget")
         self.budget_btn.setCheckable(True)
         self.budget_btn.setMinimumWidth(80)
-        self.budget_btn.clicked.connect(lambda: self._set_model_tier("budget"))
-
-        # Style for tier buttons
-        tier_btn_style = """
-            QPushButton {
-                padding: 4px 12px;
-                border: 1px solid #ccc;
-                border-radius: 4px;
-                background-color: #f8f9fa;
-            }
-            QPushButton:hover {
-                background-color: #e9ecef;
-            }
-            QPushButton:checked {
-                background-color: #007bff;
-                color: white;
-                border-color: #0056b3;
-            }
-        """
-        self.standard_btn.setStyleSheet(tier_btn_style)
-        self.budget_btn.setStyleSheet(tier_btn_style)
+        self.budget_btn.setProperty("tier", "budget")
+        self.budget_btn.clicked.connect(self._on_tier_clicked)
+
+        # Styled by the TierButton rules in SettingsWidget.STYLESHEET
+        self.standard_btn.setObjectName("TierButton")
+        self.budget_btn.setObjectName("TierButton")
 
         tier_layout.addWidget(self.standard_btn)
         tier_layout.addWidget(self.budget_btn)
@@ -840,14 +1213,7 @@ class ModelSelectionWidget(QWidget):
         # Model explanation box
         info_frame = QFrame()
         info_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        info_frame.setStyleSheet("""
-            QFrame {
-                background-color: #f8f9fa;
-                border: 1px solid #dee2e6;
-                border-radius: 6px;
-                padding: 8px;
-            }
-        """)
+        info_frame.setObjectName("ModelInfoFrame")
         info_layout = QVBoxLayout(info_frame)
         info_layout.setContentsMargins(12, 10, 12, 10)
         info_layout.setSpacing(6)
@@ -861,7 +1227,7 @@ class ModelSelectionWidget(QWidget):
             "in my experience."
         )
         info_text.setWordWrap(True)
-        info_text.setStyleSheet("color: #495057; font-size: 11px; background: transparent; border: none;")
+        info_text.setObjectName("ModelInfoText")
         info_layout.addWidget(info_text)
 
         selection_layout.addWidget(info_frame)
@@ -876,14 +1242,24 @@ class ModelSelectionWidget(QWidget):
         default_layout.addWidget(self.default_btn)
         selection_layout.addLayout(default_layout)
 
-        # Update tier button states
-        self._update_tier_buttons()
+        # Fill the model dropdown and set the tier button states
+        self._refresh_model_ui()
 
         layout.addWidget(selection_group)
 
-        # ==========================================================================
-        # PRIMARY & FALLBACK SECTION
-        # ==========================================================================
+        # The Primary & Fallback group is built after the tab first paints
+        layout.addStretch()
+        self._layout = layout
+
+    def showEvent(self, event):
+        """Build the presets group once the tab is first shown."""
+        super().showEvent(event)
+        if not self._presets_built:
+            self._presets_built = True
+            QTimer.singleShot(0, self._init_presets_ui)
+
+    def _init_presets_ui(self):
+        """Build the Primary & Fallback group below the provider/model selection."""
         presets_group = QGroupBox("Primary & Fallback Models")
         presets_layout = QVBoxLayout(presets_group)
         presets_layout.setSpacing(12)
@@ -893,30 +1269,24 @@ class ModelSelectionWidget(QWidget):
             "the fallback model is used automatically when the primary fails."
         )
         presets_desc.setWordWrap(True)
-        presets_desc.setStyleSheet("color: #666; font-size: 11px; margin-bottom: 8px;")
+        presets_desc.setObjectName("PresetsDesc")
         presets_layout.addWidget(presets_desc)
 
         # Provider recommendation note
         provider_note_frame = QFrame()
         provider_note_frame.setFrameShape(QFrame.Shape.StyledPanel)
-        provider_note_frame.setStyleSheet("""
-            QFrame {
-                background-color: #fff3cd;
-                border: 1px solid #ffc107;
-                border-radius: 4px;
-            }
-        """)
+        provider_note_frame.setObjectName("ProviderNote")
         provider_note_layout = QHBoxLayout(provider_note_frame)
         provider_note_layout.setContentsMargins(10, 8, 10, 8)
         provider_note_icon = QLabel("💡")
-        provider_note_icon.setStyleSheet("background: transparent; border: none; font-size: 14px;")
+        provider_note_icon.setObjectName("ProviderNoteIcon")
         provider_note_layout.addWidget(provider_note_icon)
         provider_note_text = QLabel(
             "<b>Tip:</b> For maximum resilience, use different providers for primary and fallback. "
             "This protects against provider-level outages."
         )
         provider_note_text.setWordWrap(True)
-        provider_note_text.setStyleSheet("background: transparent; border: none; color: #856404; font-size: 11px;")
+        provider_note_text.setObjectName("ProviderNoteText")
         provider_note_layout.addWidget(provider_note_text, 1)
         presets_layout.addWidget(provider_note_frame)
 
@@ -930,87 +1300,14 @@ class ModelSelectionWidget(QWidget):
         self.failover_checkbox.stateChanged.connect(self._on_failover_changed)
         presets_layout.addWidget(self.failover_checkbox)
 
-        # Store references for preset UI elements
-        self._preset_widgets = {}
-
-        # Style for labels inside presets (explicit font size to avoid scaling issues)
-        preset_label_style = "font-size: 13px; background: transparent; border: none;"
-
         # Create Primary and Fallback sections
         for preset_key in ["primary", "fallback"]:
-            preset_frame = QFrame()
-            preset_frame.setFrameShape(QFrame.Shape.StyledPanel)
-            preset_frame.setStyleSheet("""
-                QFrame {
-                    background-color: #f8f9fa;
-                    border: 1px solid #dee2e6;
-                    border-radius: 4px;
-                }
-            """)
-            preset_inner_layout = QVBoxLayout(preset_frame)
-            preset_inner_layout.setSpacing(10)
-            preset_inner_layout.setContentsMargins(12, 10, 12, 10)
-
-            # Preset header
-            header_text = "Primary Model" if preset_key == "primary" else "Fallback Model"
-            preset_header = QLabel(header_text)
-            preset_header.setStyleSheet("font-size: 14px; font-weight: bold; background: transparent; border: none;")
-            preset_inner_layout.addWidget(preset_header)
-
-            # Name field
-            name_layout = QHBoxLayout()
-            name_label = QLabel("Name:")
-            name_label.setStyleSheet(preset_label_style)
-            name_layout.addWidget(name_label)
-            name_edit = QLineEdit()
-            name_edit.setPlaceholderText(f"e.g., Flash Latest, Budget, Pro...")
-            name_edit.setMaximumWidth(200)
-            current_name = getattr(self.config, f"{preset_key}_name", "")
-            name_edit.setText(current_name)
-            name_edit.textChanged.connect(lambda text, k=preset_key: self._on_preset_name_changed(k, text))
-            name_layout.addWidget(name_edit)
-            name_layout.addStretch()
-            preset_inner_layout.addLayout(name_layout)
-
-            # Provider dropdown
-            provider_layout = QHBoxLayout()
-            provider_label = QLabel("Provider:")
-            provider_label.setStyleSheet(preset_label_style)
-            provider_layout.addWidget(provider_label)
-            provider_combo = QComboBox()
-            provider_combo.setIconSize(QSize(16, 16))
-            provider_combo.addItem(get_provider_icon("google"), "Google Gemini", "gemini")
-            provider_combo.addItem(get_provider_icon("openrouter"), "OpenRouter", "openrouter")
-            current_provider = getattr(self.config, f"{preset_key}_provider", "") or "gemini"
-            idx = provider_combo.findData(current_provider)
-            if idx >= 0:
-                provider_combo.setCurrentIndex(idx)
-            provider_combo.currentIndexChanged.connect(lambda idx, k=preset_key: self._on_preset_provider_changed(k))
-            provider_layout.addWidget(provider_combo)
-            provider_layout.addStretch()
-            preset_inner_layout.addLayout(provider_layout)
-
-            # Model dropdown
-            model_layout = QHBoxLayout()
-            model_label = QLabel("Model:")
-            model_label.setStyleSheet(preset_label_style)
-            model_layout.addWidget(model_label)
-            model_combo = QComboBox()
-            model_combo.setIconSize(QSize(16, 16))
-            model_combo.setMinimumWidth(200)
-            model_combo.currentIndexChanged.connect(lambda idx, k=preset_key: self._on_preset_model_changed(k))
-            model_layout.addWidget(model_combo)
-            model_layout.addStretch()
-            preset_inner_layout.addLayout(model_layout)
-
-            # Store widget references
-            self._preset_widgets[preset_key] = {
-                "name": name_edit,
-                "provider": provider_combo,
-                "model": model_combo,
-            }
-
-            presets_layout.addWidget(preset_frame)
+            section = PresetSection(preset_key, self.config)
+            section.name_edit.textChanged.connect(self._dispatch_preset_name)
+            section.provider_combo.currentIndexChanged.connect(self._dispatch_preset_provider)
+            section.model_combo.currentIndexChanged.connect(self._dispatch_preset_model)
+            self._preset_widgets[preset_key] = section
+            presets_layout.addWidget(section)
 
             # Populate model dropdown based on current provider
             self._update_preset_model_combo(preset_key)
@@ -1025,44 +1322,57 @@ class ModelSelectionWidget(QWidget):
         swap_layout.addStretch()
         presets_layout.addLayout(swap_layout)
 
-        layout.addWidget(presets_group)
-        layout.addStretch()
+        # Insert above the trailing stretch
+        self._layout.insertWidget(self._layout.count() - 1, presets_group)
 
-    def _update_model_combo(self):
-        """Update the model dropdown based on selected provider."""
-        self.model_combo.blockSignals(True)
-        self.model_combo.clear()
+    def _build_model_list(self, provider: str) -> QStandardItemModel:
+        """Create the item model listing a provider's models.
 
+        Model rows are text only: every model shares the provider's icon,
+        which the provider dropdown already shows.
+        """
+        model_list = QStandardItemModel(self)
+        models = GEMINI_MODELS if provider == "gemini" else OPENROUTER_MODELS
+        for model_id, display_name in models:
+            item = QStandardItem(display_name)
+            item.setData(model_id, Qt.ItemDataRole.UserRole)
+            model_list.appendRow(item)
+        return model_list
+
+    def _refresh_model_ui(self):
+        """Show the selected provider's models, select the configured one and
+        sync the tier buttons, in one pass over the provider state."""
         provider = self.config.selected_provider.lower()
         if provider == "gemini":
-            models = GEMINI_MODELS
             current_model = self.config.gemini_model
         else:  # openrouter
-            models = OPENROUTER_MODELS
+            provider = "openrouter"
             current_model = self.config.openrouter_model
 
-        # Add models with model originator icon
-        for model_id, display_name in models:
-            model_icon = get_model_icon(model_id)
-            self.model_combo.addItem(model_icon, display_name, model_id)
+        with _blocked(self.model_combo):
+            self.model_combo.setModel(self._model_lists[provider])
 
-        # Select current model
-        idx = self.model_combo.findData(current_model)
-        if idx >= 0:
-            self.model_combo.setCurrentIndex(idx)
+            # Select current model
+            idx = _MODEL_ROW_INDEX[provider].get(current_model, -1)
+            if idx >= 0:
+                self.model_combo.setCurrentIndex(idx)
+
+        self._update_tier_buttons(provider, self.model_combo.currentData())
 
-        self.model_combo.blockSignals(False)
+    def refresh(self):
+        """Re-read the provider and model, which the main window's preset
+        menu can change while Settings is hidden."""
+        row = _PROVIDER_ROW.get(self.config.selected_provider)
+        if row is not None:
+            with _blocked(self.provider_combo):
+                self.provider_combo.setCurrentIndex(row)
+        self._refresh_model_ui()
 
     def _on_provider_changed(self, provider_display: str):
         """Handle provider change."""
-        display_to_internal = {
-            "Google Gemini (Recommended)": "gemini",
-            "OpenRouter": "openrouter",
-        }
-        self.config.selected_provider = display_to_internal.get(provider_display, "gemini")
-        self._update_model_combo()
-        self._update_tier_buttons()
-        save_config(self.config)
+        self.config.selected_provider = _PROVIDER_DISPLAY_TO_INTERNAL.get(provider_display, "gemini")
+        self._refresh_model_ui()
+        self._save()
 
     def _on_model_changed(self, index: int):
         """Handle model selection change."""
@@ -1076,8 +1386,12 @@ class ModelSelectionWidget(QWidget):
         else:  # openrouter
             self.config.openrouter_model = model_id
 
-        save_config(self.config)
-        self._update_tier_buttons()
+        self._save()
+        self._update_tier_buttons(provider, model_id)
+
+    def _on_tier_clicked(self):
+        """Handle a click on either tier button, keyed by its "tier" property."""
+        self._set_model_tier(self.sender().property("tier"))
 
     def _set_model_tier(self, tier: str):
         """Set the model to the standard or budget tier for the current provider."""
@@ -1086,40 +1400,33 @@ class ModelSelectionWidget(QWidget):
         model_id = tiers.get(tier)
 
         if model_id:
-            idx = self.model_combo.findData(model_id)
+            idx = _MODEL_ROW_INDEX.get(provider, {}).get(model_id, -1)
             if idx >= 0:
                 self.model_combo.setCurrentIndex(idx)
 
-    def _update_tier_buttons(self):
-        """Update tier button checked states based on current model."""
-        provider = self.config.selected_provider.lower()
+    def _update_tier_buttons(self, provider: str, current_model: str):
+        """Update tier button checked states for the given provider and model."""
         tiers = MODEL_TIERS.get(provider, {})
-        current_model = self.model_combo.currentData()
 
-        self.standard_btn.blockSignals(True)
-        self.budget_btn.blockSignals(True)
-
-        self.standard_btn.setChecked(current_model == tiers.get("standard"))
-        self.budget_btn.setChecked(current_model == tiers.get("budget"))
-
-        self.standard_btn.blockSignals(False)
-        self.budget_btn.blockSignals(False)
+        # Only touch buttons whose state flips; each change re-polishes the
+        # button against the :checked stylesheet rule. setChecked doesn't emit
+        # clicked, so no signals need blocking.
+        for button, tier in ((self.standard_btn, "standard"), (self.budget_btn, "budget")):
+            checked = current_model == tiers.get(tier)
+            if button.isChecked() != checked:
+                button.setChecked(checked)
 
     def _set_default(self):
         """Reset to default: Gemini provider with gemini-flash-latest model."""
         # Set provider to Gemini
-        self.provider_combo.setCurrentText("Google Gemini (Recommended)")
+        self.provider_combo.setCurrentIndex(_PROVIDER_ROW["gemini"])
         self.config.selected_provider = "gemini"
 
         # Set model to gemini-flash-latest
-        self._update_model_combo()
-        idx = self.model_combo.findData("gemini-flash-latest")
-        if idx >= 0:
-            self.model_combo.setCurrentIndex(idx)
         self.config.gemini_model = "gemini-flash-latest"
+        self._refresh_model_ui()
 
-        save_config(self.config)
-        self._update_tier_buttons()
+        self._save()
 
     # ==========================================================================
     # PRESET (PRIMARY/FALLBACK) HANDLERS
@@ -1128,116 +1435,266 @@ class ModelSelectionWidget(QWidget):
     def _on_failover_changed(self, state: int):
         """Handle failover checkbox change."""
         self.config.failover_enabled = state == 2  # Qt.CheckState.Checked = 2
-        save_config(self.config)
+        self._save()
+
+    # Preset widgets carry a "preset_key" property, so one slot per signal
+    # serves both presets
+
+    def _dispatch_preset_name(self, text: str):
+        self._on_preset_name_changed(self.sender().property("preset_key"), text)
+
+    def _dispatch_preset_provider(self, _index: int):
+        self._on_preset_provider_changed(self.sender().property("preset_key"))
+
+    def _dispatch_preset_model(self, _index: int):
+        self._on_preset_model_changed(self.sender().property("preset_key"))
 
     def _on_preset_name_changed(self, preset_key: str, text: str):
-        """Handle preset name change."""
-        setattr(self.config, f"{preset_key}_name", text)
-        save_config(self.config)
+        """Handle preset name change; the write waits until typing pauses."""
+        setattr(self.config, _PRESET_ATTRS[preset_key]["name"], text)
+        self._save()
+
+    def _save(self):
+        """Queue a config save, unless a batch of changes is being applied.
+
+        Saves go through the debounced queue and the background writer, so
+        a burst of selections collapses into one write off the GUI thread.
+        """
+        if not self._saving_blocked:
+            self._queue_save()
+
+    @contextmanager
+    def _batched_save(self):
+        """Suppress individual saves inside the block and save once at the end."""
+        previous = self._saving_blocked
+        self._saving_blocked = True
+        try:
+            yield
+        finally:
+            self._saving_blocked = previous
+        self._save()
 
     def _on_preset_provider_changed(self, preset_key: str):
         """Handle preset provider change."""
-        widgets = self._preset_widgets.get(preset_key)
-        if not widgets:
+        section = self._preset_widgets.get(preset_key)
+        if section is None:
             return
-        provider = widgets["provider"].currentData()
-        setattr(self.config, f"{preset_key}_provider", provider)
+        provider = section.provider_combo.currentData()
+        setattr(self.config, _PRESET_ATTRS[preset_key]["provider"], provider)
         self._update_preset_model_combo(preset_key)
-        save_config(self.config)
+        self._save()
 
     def _on_preset_model_changed(self, preset_key: str):
         """Handle preset model change."""
-        widgets = self._preset_widgets.get(preset_key)
-        if not widgets:
+        section = self._preset_widgets.get(preset_key)
+        if section is None:
             return
-        model = widgets["model"].currentData()
+        model = section.model_combo.currentData()
         if model:  # Only save if valid model selected
-            setattr(self.config, f"{preset_key}_model", model)
-            save_config(self.config)
+            setattr(self.config, _PRESET_ATTRS[preset_key]["model"], model)
+            self._save()
 
     def _update_preset_model_combo(self, preset_key: str):
         """Update the model dropdown for a preset based on its provider."""
-        widgets = self._preset_widgets.get(preset_key)
-        if not widgets:
+        section = self._preset_widgets.get(preset_key)
+        if section is None:
             return
 
-        model_combo = widgets["model"]
-        provider_combo = widgets["provider"]
-
-        model_combo.blockSignals(True)
-        model_combo.clear()
+        model_combo = section.model_combo
+        provider_combo = section.provider_combo
 
         provider = provider_combo.currentData() or "gemini"
-        if provider == "gemini":
-            models = GEMINI_MODELS
-        else:
-            models = OPENROUTER_MODELS
-
-        # Add models with icons
-        for model_id, display_name in models:
-            model_icon = get_model_icon(model_id)
-            model_combo.addItem(model_icon, display_name, model_id)
-
-        # Select current model if set
-        current_model = getattr(self.config, f"{preset_key}_model", "")
-        if current_model:
-            idx = model_combo.findData(current_model)
-            if idx >= 0:
-                model_combo.setCurrentIndex(idx)
-
-        model_combo.blockSignals(False)
+        if provider not in self._model_lists:
+            provider = "gemini"
+
+        with _blocked(model_combo):
+            # Re-emitted provider signals (e.g. during a swap) leave the list as is
+            if self._preset_last_provider.get(preset_key) != provider:
+                self._preset_last_provider[preset_key] = provider
+                model_combo.setModel(self._model_lists[provider])
+
+            # Select current model if set
+            current_model = getattr(self.config, _PRESET_ATTRS[preset_key]["model"], "")
+            if current_model:
+                idx = _MODEL_ROW_INDEX[provider].get(current_model, -1)
+                if idx >= 0:
+                    model_combo.setCurrentIndex(idx)
 
     def _swap_presets(self):
         """Swap primary and fallback configurations."""
-        # Store current primary values
-        old_primary_name = self.config.primary_name
-        old_primary_provider = self.config.primary_provider
-        old_primary_model = self.config.primary_model
-
-        # Move fallback to primary
-        self.config.primary_name = self.config.fallback_name
-        self.config.primary_provider = self.config.fallback_provider
-        self.config.primary_model = self.config.fallback_model
-
-        # Move old primary to fallback
-        self.config.fallback_name = old_primary_name
-        self.config.fallback_provider = old_primary_provider
-        self.config.fallback_model = old_primary_model
-
-        # Save config
-        save_config(self.config)
-
-        # Update UI widgets
-        for preset_key in ["primary", "fallback"]:
-            widgets = self._preset_widgets.get(preset_key)
-            if widgets:
-                # Update name field
-                widgets["name"].blockSignals(True)
-                widgets["name"].setText(getattr(self.config, f"{preset_key}_name", ""))
-                widgets["name"].blockSignals(False)
-
-                # Update provider dropdown
-                widgets["provider"].blockSignals(True)
-                provider = getattr(self.config, f"{preset_key}_provider", "gemini")
-                idx = widgets["provider"].findData(provider)
-                if idx >= 0:
-                    widgets["provider"].setCurrentIndex(idx)
-                widgets["provider"].blockSignals(False)
-
-                # Update model dropdown
-                self._update_preset_model_combo(preset_key)
+        # Exchange each primary field with its fallback counterpart
+        primary = _PRESET_ATTRS["primary"]
+        fallback = _PRESET_ATTRS["fallback"]
+        for field, primary_attr in primary.items():
+            fallback_attr = fallback[field]
+            primary_value = getattr(self.config, primary_attr)
+            setattr(self.config, primary_attr, getattr(self.config, fallback_attr))
+            setattr(self.config, fallback_attr, primary_value)
+
+        # Update UI widgets; nothing they emit may save on its own, and the
+        # swap is written once when the batch ends
+        with self._batched_save():
+            for preset_key in ["primary", "fallback"]:
+                section = self._preset_widgets.get(preset_key)
+                if section is not None:
+                    # Update name field
+                    with _blocked(section.name_edit):
+                        section.name_edit.setText(getattr(self.config, _PRESET_ATTRS[preset_key]["name"], ""))
+
+                    # Update provider dropdown
+                    with _blocked(section.provider_combo):
+                        provider = getattr(self.config, _PRESET_ATTRS[preset_key]["provider"], "gemini")
+                        idx = section.provider_combo.findData(provider)
+                        if idx >= 0:
+                            section.provider_combo.setCurrentIndex(idx)
+
+                    # Update model dropdown
+                    self._update_preset_model_combo(preset_key)
+
+
+# Settings tabs in display order: (name, label, factory). Each factory takes
+# the owning SettingsWidget and builds that tab's section widget.
+_SETTINGS_TABS = (
+    ("model", "Model", lambda sw: ModelSelectionWidget(sw.config, sw._queue_save)),
+    ("api_keys", "API Keys", lambda sw: APIKeysWidget(sw.config, sw._queue_save)),
+    ("mic", "Mic", lambda sw: AudioMicWidget(sw.config, sw.recorder, sw._queue_save)),
+    ("behavior", "Behavior", lambda sw: BehaviorWidget(sw.config, sw._queue_save)),
+    ("personalization", "Personalization", lambda sw: PersonalizationWidget(sw.config, sw._queue_save)),
+    ("hotkeys", "Hotkeys", lambda sw: sw._create_hotkeys_widget()),
+    ("database", "Database", lambda sw: DatabaseWidget(sw.config)),
+)
 
 
 class SettingsWidget(QWidget):
     """Unified settings widget with tabbed sections."""
 
-    # Signal emitted when hotkeys are changed
-    hotkeys_changed = pyqtSignal()
+    # Signal emitted when hotkeys are changed (field_name, old_value, new_value)
+    hotkeys_changed = pyqtSignal(str, str, str)
 
-    def __init__(self, config: Config, recorder, parent=None):
+    # Shared styles for all sections, applied once at the root and matched by
+    # object name so child widgets don't each parse their own stylesheet
+    STYLESHEET = """
+        QLabel#DescLabel {
+            color: #666;
+            margin-bottom: 12px;
+        }
+        QLabel#HelpSmall {
+            color: #666;
+            font-size: 10px;
+        }
+        QLabel#KeyHelp {
+            color: #666;
+            font-size: 10px;
+            margin-left: 2px;
+        }
+        QLabel#KeyHelpRecommended {
+            color: #28a745;
+            font-size: 10px;
+            margin-left: 2px;
+        }
+        QLabel#AgcInfo {
+            color: #28a745;
+            font-size: 11px;
+            margin: 8px 0;
+        }
+        QLabel#SubsectionTitle {
+            margin-top: 12px;
+        }
+        QLabel#WorkflowLabel {
+            color: #495057;
+            font-size: 11px;
+            padding: 4px;
+        }
+        QLabel#MonoPath {
+            font-family: monospace;
+            color: #495057;
+            padding: 8px;
+        }
+        QGroupBox#ModelsGroup {
+            font-weight: bold;
+            border: 2px solid #ced4da;
+            border-radius: 6px;
+            margin-top: 12px;
+            padding-top: 12px;
+        }
+        QLabel#ModelList {
+            padding: 4px;
+        }
+        QPushButton#DangerButton {
+            background-color: #dc3545;
+            color: white;
+        }
+        QPushButton#TierButton {
+            padding: 4px 12px;
+            border: 1px solid #ccc;
+            border-radius: 4px;
+            background-color: #f8f9fa;
+        }
+        QPushButton#TierButton:hover {
+            background-color: #e9ecef;
+        }
+        QPushButton#TierButton:checked {
+            background-color: #007bff;
+            color: white;
+            border-color: #0056b3;
+        }
+        QFrame#ModelInfoFrame {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 6px;
+            padding: 8px;
+        }
+        QLabel#ModelInfoText {
+            color: #495057;
+            font-size: 11px;
+        }
+        QLabel#PresetsDesc {
+            color: #666;
+            font-size: 11px;
+            margin-bottom: 8px;
+        }
+        QFrame#ProviderNote {
+            background-color: #fff3cd;
+            border: 1px solid #ffc107;
+            border-radius: 4px;
+        }
+        QLabel#ProviderNoteIcon {
+            font-size: 14px;
+        }
+        QLabel#ProviderNoteText {
+            color: #856404;
+            font-size: 11px;
+        }
+        QFrame#PresetFrame {
+            background-color: #f8f9fa;
+            border: 1px solid #dee2e6;
+            border-radius: 4px;
+        }
+        QLabel#PresetHeader {
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QLabel#PresetLabel {
+            font-size: 13px;  /* Explicit size to avoid scaling issues */
+        }
+        QLabel#AutoSaveNote {
+            color: #666;
+            font-size: 11px;
+            font-style: italic;
+        }
+    """
+
+    def __init__(self, config: Config, recorder, parent=None, apply_stylesheet: bool = True):
         super().__init__(parent)
         self.config = config
         self.recorder = recorder
+        # False when a host (SettingsDialog) already installs STYLESHEET above us
+        self._apply_stylesheet = apply_stylesheet
+        # One timer services saves from every section
+        self._save_timer = _make_save_timer(self, self._flush_save)
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._flush_on_quit)
         self._init_ui()
 
     def _init_ui(self):
@@ -1245,39 +1702,97 @@ class SettingsWidget(QWidget):
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
+        if self._apply_stylesheet:
+            self.setStyleSheet(self.STYLESHEET)
+
         # Create tab widget for settings sections
         self.tabs = QTabWidget()
         self.tabs.setDocumentMode(True)
 
-        # Add sections as tabs
-        self.tabs.addTab(ModelSelectionWidget(self.config), "Model")
-        self.tabs.addTab(APIKeysWidget(self.config), "API Keys")
-        self.tabs.addTab(AudioMicWidget(self.config, self.recorder), "Mic")
-        self.tabs.addTab(BehaviorWidget(self.config), "Behavior")
-        self.tabs.addTab(PersonalizationWidget(self.config), "Personalization")
-
-        # Hotkeys tab - connect signal to propagate changes
-        self.hotkeys_widget = HotkeysWidget(self.config)
-        self.hotkeys_widget.hotkeys_changed.connect(self.hotkeys_changed.emit)
-        self.tabs.addTab(self.hotkeys_widget, "Hotkeys")
+        # Tabs are built on first visit; until then each holds an empty
+        # placeholder so opening Settings doesn't construct every section
+        # (or enumerate audio devices) up front
+        self._tabs_by_name = {}
+        for _, label, _ in _SETTINGS_TABS:
+            placeholder = QWidget()
+            placeholder_layout = QVBoxLayout(placeholder)
+            placeholder_layout.setContentsMargins(0, 0, 0, 0)
+            self.tabs.addTab(placeholder, label)
 
-        self.tabs.addTab(DatabaseWidget(self.config), "Database")
+        # The initial tab is built in showEvent, so constructing the dialog
+        # ahead of time stays cheap
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tabs)
 
+    def _create_hotkeys_widget(self) -> "HotkeysWidget":
+        """Build the Hotkeys tab and propagate its change signal."""
+        self.hotkeys_widget = HotkeysWidget(self.config, self._queue_save)
+        self.hotkeys_widget.hotkeys_changed.connect(self.hotkeys_changed.emit)
+        return self.hotkeys_widget
+
+    def _ensure_tab_built(self, index: int):
+        """Construct the real section widget for a tab on first visit."""
+        if index < 0:
+            return
+        name, _, factory = _SETTINGS_TABS[index]
+        if name in self._tabs_by_name:
+            return
+        widget = factory(self)
+        self._tabs_by_name[name] = widget
+        self.tabs.widget(index).layout().addWidget(widget)
+
+    def _queue_save(self):
+        """Schedule a config write once edits in any section pause."""
+        self._save_timer.start()
+
+    def _flush_save(self):
+        """Write pending config changes."""
+        self._save_timer.stop()
+        get_config_writer().request_save(self.config)
+
+    def _flush_on_quit(self):
+        """Write any debounced edits and wait for them before the app exits."""
+        if self._save_timer.isActive():
+            self._flush_save()
+        get_config_writer().flush()
+
+    def showEvent(self, event):
+        """Build the visible tab the first time the settings are shown."""
+        self._ensure_tab_built(self.tabs.currentIndex())
+        super().showEvent(event)
+
+    def hideEvent(self, event):
+        """Don't leave edits unsaved when the settings are closed."""
+        if self._save_timer.isActive():
+            self._flush_save()
+        super().hideEvent(event)
+
     def refresh(self):
-        """Refresh all sub-widgets."""
-        pass  # No specific refresh needed
+        """Bring already-built sections back in line with the config.
+
+        The dialog is reused between opens, so sections built on an earlier
+        visit may show values the main window has since changed. Tabs not
+        built yet read the config when they are first shown.
+        """
+        for widget in self._tabs_by_name.values():
+            refresh = getattr(widget, "refresh", None)
+            if refresh is not None:
+                refresh()
 
 
 class SettingsDialog(QDialog):
-    """Settings dialog window containing the settings widget."""
+    """Settings dialog window containing the settings widget.
+
+    Meant to be created once and shown again on each open; closing only
+    hides it, so the embedded widget and its built tabs survive between opens.
+    """
 
     # Signal emitted when settings dialog is closed (settings may have changed)
     settings_closed = pyqtSignal()
 
     # Signal emitted when hotkeys are changed (for immediate re-registration)
-    hotkeys_changed = pyqtSignal()
+    hotkeys_changed = pyqtSignal(str, str, str)
 
     def __init__(self, config: Config, recorder, parent=None):
         super().__init__(parent)
@@ -1290,12 +1805,18 @@ class SettingsDialog(QDialog):
         self.setMinimumSize(780, 620)
         self.resize(820, 680)
 
+        # One stylesheet for the whole dialog, covering the embedded settings
+        # widget and the bottom bar
+        self.setStyleSheet(SettingsWidget.STYLESHEET)
+
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
         layout.setSpacing(0)
 
         # Embed the settings widget
-        self.settings_widget = SettingsWidget(self.config, self.recorder, self)
+        self.settings_widget = SettingsWidget(
+            self.config, self.recorder, self, apply_stylesheet=False
+        )
         self.settings_widget.hotkeys_changed.connect(self.hotkeys_changed.emit)
         layout.addWidget(self.settings_widget)
 
@@ -1305,7 +1826,7 @@ class SettingsDialog(QDialog):
 
         # Auto-save indicator
         auto_save_note = QLabel("Changes are saved automatically")
-        auto_save_note.setStyleSheet("color: #666; font-size: 11px; font-style: italic;")
+        auto_save_note.setObjectName("AutoSaveNote")
         bottom_bar.addWidget(auto_save_note)
 
         bottom_bar.addStretch()
@@ -11,7 +11,7 @@ from PyQt6.QtWidgets import (
     QFrame, QComboBox, QPushButton, QScrollArea,
     QSizePolicy, QGridLayout, QCompleter,
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QStringListModel
 from typing import Dict, List
 from pathlib import Path
 
@@ -605,9 +605,14 @@ class StackBuilderWidget(QWidget):
         return combo
 
     def _setup_combo_completer(self, combo: QComboBox):
-        """Set up a completer for case-insensitive substring matching."""
-        items = [combo.itemText(i) for i in range(combo.count())]
-        completer = QCompleter(items)
+        """Set up a completer for case-insensitive substring matching.
+
+        Substring (not prefix) matching keeps "✦ "-prefixed custom entries
+        and stack descriptions searchable; the lists are short enough that
+        the scan is free. Separator rows (empty text) are left out.
+        """
+        items = [text for text in (combo.itemText(i) for i in range(combo.count())) if text]
+        completer = QCompleter(QStringListModel(items), combo)
         completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
         completer.setFilterMode(Qt.MatchFlag.MatchContains)
         combo.setCompleter(completer)
@@ -638,9 +643,11 @@ class StackBuilderWidget(QWidget):
         self.infer_format_checkbox.stateChanged.connect(self._on_infer_format_changed)
         self.base_button_group.buttonClicked.connect(self._on_base_changed)
         # Format/Tone/Style checkboxes are connected in setup methods
-        self.format_combo.currentIndexChanged.connect(self._on_format_combo_changed)
-        self.tone_combo.currentIndexChanged.connect(self._on_tone_combo_changed)
-        self.stacks_combo.currentIndexChanged.connect(self._on_stacks_changed)
+        # activated fires only for user picks (list, completer or Enter), so
+        # programmatic resets of the combos don't re-enter these handlers
+        self.format_combo.activated.connect(self._on_format_combo_changed)
+        self.tone_combo.activated.connect(self._on_tone_combo_changed)
+        self.stacks_combo.activated.connect(self._on_stacks_changed)
         self.reset_btn.clicked.connect(self._on_reset_clicked)
 
     def _is_tts_enabled(self) -> bool:
@@ -702,9 +709,7 @@ class StackBuilderWidget(QWidget):
             if format_key in self.format_checkboxes:
                 self.format_checkboxes[format_key].setChecked(True)
             # Reset combo to "Select..."
-            self.format_combo.blockSignals(True)
             self.format_combo.setCurrentIndex(0)
-            self.format_combo.blockSignals(False)
             self._announce_tts('format')
             self._on_setting_changed()
 
@@ -721,9 +726,7 @@ class StackBuilderWidget(QWidget):
             if tone_key in self.tone_checkboxes:
                 self.tone_checkboxes[tone_key].setChecked(True)
             # Reset combo to "Select..."
-            self.tone_combo.blockSignals(True)
             self.tone_combo.setCurrentIndex(0)
-            self.tone_combo.blockSignals(False)
             self._announce_tts('tone')
             self._on_setting_changed()
 
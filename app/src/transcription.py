@@ -4,9 +4,12 @@ import base64
 import logging
 import tempfile
 import os
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Callable, Mapping, Optional
 
 # Pre-import SDK libraries at module load to avoid first-request latency
 # These imports happen once when the app starts, not on first transcription
@@ -20,15 +23,45 @@ except ImportError:
     GEMINI_SDK_AVAILABLE = False
 
 try:
-    from openai import OpenAI
+    import httpx
+    from openai import OpenAI, DefaultHttpxClient
     OPENAI_SDK_AVAILABLE = True
 except ImportError:
+    httpx = None
     OpenAI = None
+    DefaultHttpxClient = None
     OPENAI_SDK_AVAILABLE = False
 
+# HTTP/2 lets concurrent OpenRouter requests share one TLS connection; httpx
+# only speaks it with the optional h2 package installed
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Optional SIMD base64 encoder; audio uploads fall back to the stdlib
+try:
+    import pybase64
+    PYBASE64_AVAILABLE = True
+except ImportError:
+    pybase64 = None
+    PYBASE64_AVAILABLE = False
+
+from .transcription_cache import transcription_cache_key, get_cached, put_cached
+
 logger = logging.getLogger(__name__)
 
 
+def _b64encode_str(data: bytes) -> str:
+    """Base64-encode audio for a JSON payload, returning a str."""
+    if PYBASE64_AVAILABLE:
+        # Writes straight into a str, with no intermediate bytes or decode
+        return pybase64.b64encode_as_string(data)
+    # Base64 output is pure ASCII, so skip the UTF-8 validator
+    return base64.b64encode(data).decode("ascii")
+
+
 @dataclass
 class TranscriptionResult:
     """Result from transcription API including usage data."""
@@ -37,13 +70,26 @@ class TranscriptionResult:
     output_tokens: int = 0
     actual_cost: Optional[float] = None  # Actual cost from provider (OpenRouter)
     generation_id: Optional[str] = None  # Generation ID for usage lookup
+    cached: bool = False  # Served from transcription_cache, no API call made
 
 
 class TranscriptionClient(ABC):
     """Base class for transcription clients."""
 
+    # Compressed codec (an audio_processor.UPLOAD_CODECS key) transcribe()
+    # accepts alongside WAV, or None to always upload WAV
+    upload_codec: Optional[str] = None
+
+    # Provider name, as used by get_client()
+    provider: str = ""
+
+    # Provider SDK client, built lazily by _get_client()
+    _client = None
+
     @abstractmethod
-    def transcribe(self, audio_data: bytes, prompt: str) -> TranscriptionResult:
+    def transcribe(
+        self, audio_data: bytes, prompt: str, mime_type: str = "audio/wav"
+    ) -> TranscriptionResult:
         """Transcribe audio with cleanup prompt."""
         pass
 
@@ -52,6 +98,45 @@ class TranscriptionClient(ABC):
         """Rewrite text with given instruction (no audio)."""
         pass
 
+    def transcribe_cached(
+        self,
+        audio_data: bytes,
+        prompt: str,
+        run: Callable[[], TranscriptionResult],
+        *key_parts: object,
+    ) -> TranscriptionResult:
+        """Return the cached result for this audio and prompt, or run() it.
+
+        The cache key covers audio_data as given (before whatever VAD or
+        compression run() applies), the prompt, this client's provider and
+        model, and key_parts for any other setting that changes what run()
+        uploads (e.g. VAD on/off). run() does the processing and the
+        transcribe() call, and only happens on a miss.
+
+        Returns:
+            The transcription. A hit comes back with cached=True and zero
+            tokens/cost, since no API call was made
+        """
+        key = transcription_cache_key(
+            audio_data, prompt, self.provider, self.model, *key_parts
+        )
+        text = get_cached(key)
+        if text is not None:
+            return TranscriptionResult(text=text, actual_cost=0.0, cached=True)
+        result = run()
+        put_cached(key, result.text)
+        return result
+
+    @property
+    def is_warm(self) -> bool:
+        """Whether the provider SDK client has been built yet."""
+        return self._client is not None
+
+    def warm(self):
+        """Build the provider SDK client now, so the first transcribe()
+        doesn't pay for it on the critical path."""
+        self._get_client()
+
     @abstractmethod
     def generate_title(self, text: str) -> str:
         """Generate a short title for the given text."""
@@ -61,29 +146,54 @@ class TranscriptionClient(ABC):
 class GeminiClient(TranscriptionClient):
     """Google Gemini API client for audio transcription."""
 
+    provider = "gemini"
+    upload_codec = "opus"
+
+    # Larger clips go up through the Files API as raw bytes rather than
+    # inline, which would base64 them into the JSON body (+33%) and run into
+    # the inline request size limit
+    INLINE_AUDIO_LIMIT = 8 * 1024 * 1024
+
     def __init__(self, api_key: str, model: str = "gemini-2.0-flash-lite"):
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
         if self._client is None:
-            if not GEMINI_SDK_AVAILABLE:
-                raise ImportError("google-genai package not installed")
-            self._client = genai.Client(api_key=self.api_key)
+            with self._client_lock:
+                if self._client is None:
+                    if not GEMINI_SDK_AVAILABLE:
+                        raise ImportError("google-genai package not installed")
+                    self._client = genai.Client(api_key=self.api_key)
         return self._client
 
-    def transcribe(self, audio_data: bytes, prompt: str) -> TranscriptionResult:
+    def transcribe(
+        self, audio_data: bytes, prompt: str, mime_type: str = "audio/wav"
+    ) -> TranscriptionResult:
         """Transcribe audio using Gemini's multimodal capabilities."""
         client = self._get_client()
 
-        response = client.models.generate_content(
-            model=self.model,
-            contents=[
-                prompt,
-                genai_types.Part.from_bytes(data=audio_data, mime_type="audio/wav")
-            ]
-        )
+        uploaded = None
+        if len(audio_data) > self.INLINE_AUDIO_LIMIT:
+            uploaded = self._upload_audio(client, audio_data, mime_type)
+            audio_part = uploaded
+        else:
+            audio_part = genai_types.Part.from_bytes(data=audio_data, mime_type=mime_type)
+
+        try:
+            response = client.models.generate_content(
+                model=self.model,
+                contents=[prompt, audio_part]
+            )
+        finally:
+            if uploaded is not None:
+                try:
+                    client.files.delete(name=uploaded.name)
+                except Exception as e:
+                    # Uploaded files expire on their own after 48 hours
+                    logger.debug(f"Failed to delete uploaded audio: {e}")
 
         # Extract usage metadata
         input_tokens = 0
@@ -98,6 +208,23 @@ class GeminiClient(TranscriptionClient):
             output_tokens=output_tokens
         )
 
+    def _upload_audio(self, client, audio_data: bytes, mime_type: str):
+        """Upload audio through the Files API (binary, no base64).
+
+        Returns:
+            The uploaded File, usable directly as a content part
+        """
+        suffix = ".ogg" if mime_type == "audio/ogg" else ".wav"
+        with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as tmp:
+            tmp.write(audio_data)
+        try:
+            return client.files.upload(
+                file=tmp.name,
+                config=genai_types.UploadFileConfig(mime_type=mime_type),
+            )
+        finally:
+            os.unlink(tmp.name)
+
     def rewrite_text(self, text: str, instruction: str) -> TranscriptionResult:
         """Rewrite text using Gemini (text-only, no audio)."""
         client = self._get_client()
@@ -154,28 +281,50 @@ class OpenRouterClient(TranscriptionClient):
     """OpenRouter API client for audio transcription (OpenAI-compatible)."""
 
     OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
+    provider = "openrouter"
+    upload_codec = "mp3"
+
+    # MIME type -> input_audio "format" value
+    INPUT_AUDIO_FORMATS = {"audio/wav": "wav", "audio/mpeg": "mp3"}
 
     def __init__(self, api_key: str, model: str = "google/gemini-2.5-flash"):
         self.api_key = api_key
         self.model = model
         self._client = None
+        self._client_lock = threading.Lock()
 
     def _get_client(self):
         if self._client is None:
-            if not OPENAI_SDK_AVAILABLE:
-                raise ImportError("openai package not installed")
-            self._client = OpenAI(
-                api_key=self.api_key,
-                base_url=self.OPENROUTER_BASE_URL,
-            )
+            with self._client_lock:
+                if self._client is None:
+                    if not OPENAI_SDK_AVAILABLE:
+                        raise ImportError("openai package not installed")
+                    self._client = OpenAI(
+                        api_key=self.api_key,
+                        base_url=self.OPENROUTER_BASE_URL,
+                        # SDK defaults (timeouts, redirects) plus a larger
+                        # keep-alive pool for concurrent batch requests
+                        http_client=DefaultHttpxClient(
+                            http2=HTTP2_AVAILABLE,
+                            limits=httpx.Limits(
+                                max_connections=100, max_keepalive_connections=32
+                            ),
+                        ),
+                    )
         return self._client
 
-    def transcribe(self, audio_data: bytes, prompt: str) -> TranscriptionResult:
-        """Transcribe audio using OpenRouter's multimodal models."""
+    def transcribe(
+        self, audio_data: bytes, prompt: str, mime_type: str = "audio/wav"
+    ) -> TranscriptionResult:
+        """Transcribe audio using OpenRouter's multimodal models.
+
+        input_audio only takes "wav" or "mp3", so uploads are MP3 with a WAV
+        fallback.
+        """
         client = self._get_client()
 
         # Encode audio as base64
-        audio_b64 = base64.b64encode(audio_data).decode("utf-8")
+        audio_b64 = _b64encode_str(audio_data)
 
         response = client.chat.completions.create(
             model=self.model,
@@ -188,7 +337,9 @@ class OpenRouterClient(TranscriptionClient):
                             "type": "input_audio",
                             "input_audio": {
                                 "data": audio_b64,
-                                "format": "wav"
+                                "format": self.INPUT_AUDIO_FORMATS.get(
+                                    mime_type, "wav"
+                                )
                             }
                         }
                     ]
@@ -197,6 +348,9 @@ class OpenRouterClient(TranscriptionClient):
             # Request usage information including cost
             extra_body={"usage": {"include": True}},
         )
+        # The request body is gone; don't hold the encoded audio through the
+        # follow-up cost lookup below
+        del audio_b64
 
         # Extract usage data
         input_tokens = 0
@@ -313,16 +467,54 @@ class OpenRouterClient(TranscriptionClient):
         return title or "untitled"
 
 
+# Provider name -> client class (read-only; add new providers here)
+_PROVIDERS: Mapping[str, type[TranscriptionClient]] = MappingProxyType({
+    "gemini": GeminiClient,
+    "openrouter": OpenRouterClient,
+})
+
+
+@lru_cache(maxsize=16)
 def get_client(provider: str, api_key: str, model: str) -> TranscriptionClient:
     """Factory function to get appropriate transcription client.
 
+    Clients are cached per (provider, api_key, model), so workers reuse an
+    already initialized client, and the SDK client (with its HTTP pool and
+    TLS sessions) it owns, rather than building one per request. The cache
+    is bounded, so clients for a rotated API key eventually age out.
+
     Supported providers:
     - "gemini": Direct Google Gemini API (recommended for gemini-flash-latest)
     - "openrouter": OpenRouter API (access to Gemini models via OpenAI-compatible API)
     """
-    if provider == "gemini":
-        return GeminiClient(api_key, model)
-    elif provider == "openrouter":
-        return OpenRouterClient(api_key, model)
-    else:
-        raise ValueError(f"Unknown provider: {provider}. Supported: gemini, openrouter")
+    cls = _PROVIDERS.get(provider)
+    if cls is None:
+        raise ValueError(
+            f"Unknown provider: {provider}. Supported: {', '.join(_PROVIDERS)}"
+        )
+    return cls(api_key, model)
+
+
+def warm_client(provider: str, api_key: str, model: str):
+    """Pre-build the client for a provider off the GUI thread.
+
+    Call this when recording starts: the SDK client (and its HTTP pool) is
+    then ready by the time the audio is uploaded. Failures are left for the
+    real transcription to report.
+    """
+    try:
+        client = get_client(provider, api_key, model)
+    except ValueError as e:
+        logger.debug(f"Client warm-up skipped: {e}")
+        return
+    if client.is_warm:
+        # Already built by an earlier recording; nothing to do
+        return
+
+    def _warm():
+        try:
+            client.warm()
+        except Exception as e:
+            logger.debug(f"Client warm-up failed for {provider}: {e}")
+
+    threading.Thread(target=_warm, name="client-warmup", daemon=True).start()
@@ -0,0 +1,120 @@
+"""On-disk cache of file transcription results.
+
+Re-running the same audio file (a retry, or trying a different prompt on
+it) would otherwise re-upload the audio and wait on the model again.
+Results are keyed on a hash of the audio bytes plus everything else that
+shapes the output (prompt, provider, model, VAD), so a repeat returns
+straight from disk. Live recordings aren't cached: microphone audio is
+never byte-identical, so they would only add transcript copies on disk.
+
+The cache holds transcript text, so TranscriptionDB.delete_all()
+clears it together with the history.
+"""
+
+import hashlib
+import json
+import logging
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional
+
+from .config import write_json_atomic
+
+# Optional faster hash; falls back to the stdlib's BLAKE2
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+    BLAKE3_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+CACHE_DIR = Path.home() / ".cache" / "voice-notepad-v3" / "transcriptions"
+
+# Entries are small JSON files; beyond this the oldest are evicted
+MAX_CACHE_ENTRIES = 500
+
+# Writes between eviction scans (the first write of a session always scans)
+EVICT_EVERY_WRITES = 50
+
+_evict_lock = threading.Lock()
+_writes_until_evict = 0
+
+
+def transcription_cache_key(audio_data: bytes, *parts: object) -> str:
+    """Hash audio bytes together with the settings that affect the result.
+
+    Args:
+        audio_data: Audio exactly as handed to the transcription pipeline
+        *parts: Prompt, provider, model, etc. (str() of each is hashed)
+
+    Returns:
+        Hex digest usable as a file name
+    """
+    h = blake3.blake3() if BLAKE3_AVAILABLE else hashlib.blake2b(digest_size=20)
+    h.update(audio_data)
+    for part in parts:
+        # Separator keeps ("ab", "c") and ("a", "bc") distinct
+        h.update(b"\0" + str(part).encode("utf-8"))
+    return h.hexdigest()
+
+
+def get_cached(key: str) -> Optional[str]:
+    """Return the cached transcript text for a key, or None on a miss."""
+    try:
+        with open(CACHE_DIR / f"{key}.json", "rb") as f:
+            return json.load(f)["text"]
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def put_cached(key: str, text: str):
+    """Store transcript text, evicting the oldest entries when due."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        write_json_atomic(CACHE_DIR / f"{key}.json", {"text": text})
+        _maybe_evict_old_entries()
+    except OSError as e:
+        logger.warning(f"Failed to cache transcription: {e}")
+
+
+def clear_cache():
+    """Delete every cached transcript."""
+    global _writes_until_evict
+    with _evict_lock:
+        try:
+            shutil.rmtree(CACHE_DIR)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Failed to clear transcription cache: {e}")
+        _writes_until_evict = 0
+
+
+def _maybe_evict_old_entries():
+    """Trim the cache to MAX_CACHE_ENTRIES, oldest first.
+
+    The directory is only scanned every EVICT_EVERY_WRITES writes, so the
+    cache can briefly run that far over the limit.
+    """
+    global _writes_until_evict
+    with _evict_lock:
+        if _writes_until_evict > 0:
+            _writes_until_evict -= 1
+            return
+        _writes_until_evict = EVICT_EVERY_WRITES
+
+        entries = []
+        for path in CACHE_DIR.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except OSError:
+                continue
+        if len(entries) <= MAX_CACHE_ENTRIES:
+            return
+        entries.sort()
+        for _, path in entries[:len(entries) - MAX_CACHE_ENTRIES]:
+            path.unlink(missing_ok=True)
@@ -7,13 +7,18 @@ Also supports dynamic TTS generation for stats readout.
 """
 
 import asyncio
+import atexit
+import mmap
 import os
+import struct
+import sys
 import tempfile
 import threading
 import time
 from collections import deque
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Optional, Tuple
 
 # Edge TTS for dynamic speech generation
 try:
@@ -29,40 +34,117 @@ try:
 except ImportError:
     HAS_SIMPLEAUDIO = False
 
-# Fallback to PyAudio if available
+# PyAudio (a core dependency) if available
 try:
     import pyaudio
-    import wave
     HAS_PYAUDIO = True
+    _PA_INT16 = pyaudio.paInt16
 except ImportError:
     HAS_PYAUDIO = False
 
-
+# Announcement clips play through one persistent PyAudio stream when PyAudio
+# is available, so back-to-back announcements don't reopen the device the way
+# each simpleaudio play does. simpleaudio is the fallback.
+USE_PYAUDIO_FOR_CLIPS = HAS_PYAUDIO
+
+# Extra time a blocking announcement may wait beyond its clip length (first
+# use loads the clips; another clip may be playing) before giving up, so a
+# stuck audio backend can't hang the GUI thread
+SYNC_WAIT_MARGIN_S = 3.0
+
+
+# Pre-generated announcements, by file name (without .wav). Names are
+# interned so cache lookups from the announce_* literals compare by identity.
+ANNOUNCEMENT_NAMES = tuple(sys.intern(name) for name in (
+    # Recording states
+    "recording", "stopped", "paused", "resumed", "discarded", "appended", "cached",
+    # Transcription states
+    "transcribing", "complete", "error",
+    # Output modes
+    "text_in_app", "text_on_clipboard", "clipboard", "text_injected", "injection_failed",
+    # Prompt stack changes
+    "format_updated", "format_inference", "tone_updated", "style_updated", "verbatim_mode", "general_mode",
+    # Audio feedback mode changes
+    "tts_activated", "tts_deactivated",
+    # Output mode toggles
+    "app_enabled", "app_disabled", "clipboard_enabled", "clipboard_disabled",
+    "inject_enabled", "inject_disabled",
+    # Settings toggles
+    "vad_enabled", "vad_disabled",
+    # Append mode
+    "appending",
+    # Settings/config actions
+    "default_prompt_configured", "copied_to_clipboard",
+    # Legacy (kept for compatibility)
+    "copied", "injected", "cleared",
+))
+
+
+@lru_cache(maxsize=1)
 def _get_assets_dir() -> Path:
     """Get the path to TTS assets directory.
 
     Handles both development (running from source) and installed scenarios.
+    The location is probed once per process.
     """
     # First, check relative to this source file (development)
     src_dir = Path(__file__).parent
     dev_assets = src_dir.parent / "assets" / "tts"
-    if dev_assets.exists():
+    if os.path.exists(dev_assets):
         return dev_assets
 
     # Check in installed location (alongside src)
     installed_assets = src_dir / "assets" / "tts"
-    if installed_assets.exists():
+    if os.path.exists(installed_assets):
         return installed_assets
 
     # Check in system-wide location
     system_assets = Path("/opt/voice-notepad/assets/tts")
-    if system_assets.exists():
+    if os.path.exists(system_assets):
         return system_assets
 
     # Fallback to development path (may not exist)
     return dev_assets
 
 
+def _map_wav(wav_path: Path) -> Tuple[memoryview, int, int, int]:
+    """Memory-map a PCM WAV file and locate its sample data.
+
+    Walks the RIFF chunks (the assets carry a LIST chunk before the data,
+    so the offset isn't a fixed 44 bytes) and returns a read-only view of
+    the data chunk, so the samples can be copied out without first reading
+    the whole file into a bytes object.
+
+    Returns:
+        Tuple of (sample data view, channels, bytes per sample, sample rate)
+    """
+    with open(wav_path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if mm[0:4] != b"RIFF" or mm[8:12] != b"WAVE":
+        mm.close()
+        raise ValueError(f"Not a WAV file: {wav_path}")
+
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(mm):
+        chunk_id = mm[offset:offset + 4]
+        (chunk_size,) = struct.unpack_from("<I", mm, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            # audio format, channels, sample rate, byte rate, block align, bits
+            fmt = struct.unpack_from("<HHIIHH", mm, body)
+        elif chunk_id == b"data" and fmt is not None:
+            _, channels, sample_rate, _, _, bits = fmt
+            size = min(chunk_size, len(mm) - body)
+            return memoryview(mm)[body:body + size], channels, bits // 8, sample_rate
+        # Chunks are word-aligned
+        offset = body + chunk_size + (chunk_size & 1)
+
+    mm.close()
+    raise ValueError(f"No PCM data in WAV file: {wav_path}")
+
+
 class TTSAnnouncer:
     """Manages TTS accessibility announcements.
 
@@ -73,67 +155,81 @@ class TTSAnnouncer:
 
     def __init__(self):
         self._assets_dir = _get_assets_dir()
-        self._audio_cache: dict[str, Optional[bytes]] = {}
+        # Announcement name -> zero-argument playback callable (None if the
+        # clip is missing), bound to the backend chosen at load time
+        self._players: dict[str, Optional[Callable[[], float]]] = {}
+        self._clip_seconds: dict[str, float] = {}  # Clip lengths, for sync waits
         self._sample_rate = 16000  # WAV files are 16kHz
 
-        # Anti-collision queue and worker
-        self._announcement_queue: deque[Tuple[str, bool, Optional[int]]] = deque()
+        # Anti-collision queue and worker. Entries are (name, buffer_ms,
+        # done event); blocking callers wait on their entry's event.
+        self._announcement_queue: deque[Tuple[str, Optional[int], Optional[threading.Event]]] = deque()
         self._queue_lock = threading.Lock()
+        self._queue_ready = threading.Condition(self._queue_lock)
         self._worker_thread: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._last_played_time = 0.0
         self._min_pause_ms = 300  # Minimum pause between announcements (300ms)
         self._is_playing = False
 
-        # Pre-load all audio files
-        self._preload_audio()
+        # Long-lived PyAudio output stream for announcements, opened on first
+        # use so each announcement doesn't renegotiate the audio device
+        self._pa = None
+        self._pa_stream = None
+        self._pa_output_index: Optional[int] = None  # Resolved on first open
+        self._pa_lock = threading.Lock()
+        atexit.register(self._close_output_stream)
 
-        # Start the queue worker thread
+        # Start the queue worker thread; it loads the audio files before
+        # taking the first announcement, so construction does no file IO
         self._start_worker()
 
     def _preload_audio(self) -> None:
-        """Pre-load all TTS audio files into memory."""
-        announcements = [
-            # Recording states
-            "recording", "stopped", "paused", "resumed", "discarded", "appended", "cached",
-            # Transcription states
-            "transcribing", "complete", "error",
-            # Output modes
-            "text_in_app", "text_on_clipboard", "clipboard", "text_injected", "injection_failed",
-            # Prompt stack changes
-            "format_updated", "format_inference", "tone_updated", "style_updated", "verbatim_mode", "general_mode",
-            # Audio feedback mode changes
-            "tts_activated", "tts_deactivated",
-            # Output mode toggles
-            "app_enabled", "app_disabled", "clipboard_enabled", "clipboard_disabled",
-            "inject_enabled", "inject_disabled",
-            # Settings toggles
-            "vad_enabled", "vad_disabled",
-            # Append mode
-            "appending",
-            # Settings/config actions
-            "default_prompt_configured", "copied_to_clipboard",
-            # Legacy (kept for compatibility)
-            "copied", "injected", "cleared",
-        ]
-
-        for name in announcements:
-            wav_path = self._assets_dir / f"{name}.wav"
-            if wav_path.exists():
-                try:
-                    if HAS_SIMPLEAUDIO:
-                        # Load as WaveObject for simpleaudio
-                        self._audio_cache[name] = sa.WaveObject.from_wave_file(str(wav_path))
-                    elif HAS_PYAUDIO:
-                        # Read raw audio data for PyAudio
-                        with wave.open(str(wav_path), 'rb') as wf:
-                            self._audio_cache[name] = wf.readframes(wf.getnframes())
-                    else:
-                        self._audio_cache[name] = None
-                except Exception:
-                    self._audio_cache[name] = None
+        """Load all TTS audio files into one in-memory buffer for playback."""
+
+        # Copy every clip's samples into one contiguous buffer, recording
+        # (offset, length, channels, sample width, rate) per announcement
+        blob = bytearray()
+        index = {}
+
+        # One directory listing instead of a stat per announcement
+        try:
+            with os.scandir(self._assets_dir) as entries:
+                available = {entry.name for entry in entries}
+        except OSError:
+            available = set()
+
+        for name in ANNOUNCEMENT_NAMES:
+            self._players[name] = None
+            if not (HAS_SIMPLEAUDIO or HAS_PYAUDIO):
+                continue
+            filename = f"{name}.wav"
+            if filename not in available:
+                continue
+            wav_path = self._assets_dir / filename
+            try:
+                data, channels, sample_width, sample_rate = _map_wav(wav_path)
+            except Exception:
+                continue
+            index[name] = (len(blob), len(data), channels, sample_width, sample_rate)
+            self._clip_seconds[name] = len(data) / (channels * sample_width * sample_rate)
+            blob += data
+            data.release()  # Unmaps the file once nothing else refers to it
+
+        # Hand out read-only slices of the shared buffer
+        self._audio_blob = memoryview(blob).toreadonly()
+        for name, (offset, length, channels, sample_width, sample_rate) in index.items():
+            data = self._audio_blob[offset:offset + length]
+            if USE_PYAUDIO_FOR_CLIPS:
+                # Raw samples for the shared PyAudio stream
+                self._players[name] = partial(self._play_pcm, data)
             else:
-                self._audio_cache[name] = None
+                # Wrap the samples directly, skipping simpleaudio's own
+                # read of the file
+                self._players[name] = partial(
+                    self._play_wave_object,
+                    sa.WaveObject(data, channels, sample_width, sample_rate),
+                )
 
     def _start_worker(self) -> None:
         """Start the queue worker thread."""
@@ -144,52 +240,65 @@ class TTSAnnouncer:
 
     def _queue_worker(self) -> None:
         """Worker thread that processes the announcement queue."""
-        while not self._stop_event.is_set():
-            # Get next announcement from queue
-            announcement = None
-            with self._queue_lock:
-                if self._announcement_queue:
-                    announcement = self._announcement_queue.popleft()
-
-            if announcement is None:
-                # No announcements, sleep briefly and retry
-                time.sleep(0.05)
-                continue
-
-            name, blocking, buffer_ms = announcement
-
-            # Check if we need a pause before playing
-            current_time = time.time()
-            time_since_last = (current_time - self._last_played_time) * 1000  # Convert to ms
-            if time_since_last < self._min_pause_ms:
-                time.sleep((self._min_pause_ms - time_since_last) / 1000.0)
-
-            # Mark as playing
-            self._is_playing = True
-
-            # Play the announcement
-            audio = self._audio_cache.get(name)
-            if audio is not None:
-                self._play_audio(name, audio)
+        if not self._players:
+            try:
+                self._preload_audio()
+            except Exception as e:
+                # Keep serving the queue (announcements are skipped) so
+                # blocking callers are still released
+                print(f"Failed to load TTS announcements: {e}")
 
-            # Update last played time
-            self._last_played_time = time.time()
-            self._is_playing = False
+        while True:
+            # Sleep until an announcement is queued (or we're stopped)
+            with self._queue_ready:
+                while not self._announcement_queue and not self._stop_event.is_set():
+                    self._queue_ready.wait()
+                if self._stop_event.is_set():
+                    return
+                name, buffer_ms, done = self._announcement_queue.popleft()
 
-            # Apply buffer if specified (for blocking calls)
-            if buffer_ms and buffer_ms > 0:
-                time.sleep(buffer_ms / 1000.0)
+            try:
+                play = self._players.get(name)
+                if play is None:
+                    continue
+
+                # Check if we need a pause before playing
+                current_time = time.time()
+                time_since_last = (current_time - self._last_played_time) * 1000  # Convert to ms
+                if time_since_last < self._min_pause_ms:
+                    time.sleep((self._min_pause_ms - time_since_last) / 1000.0)
+
+                # Mark as playing
+                self._is_playing = True
+
+                # Play the announcement; the backend may still be draining
+                # some of it when this returns
+                pending = play()
+
+                # Update last played time (when the audio actually ends)
+                self._last_played_time = time.time() + pending
+                self._is_playing = False
+
+                # Blocking calls wait for the device to drain, plus any buffer
+                if done is not None:
+                    wait = pending + (buffer_ms or 0) / 1000.0
+                    if wait > 0:
+                        time.sleep(wait)
+            finally:
+                # Release a blocking caller even if playback failed
+                if done is not None:
+                    done.set()
 
     def _play_async(self, name: str) -> None:
-        """Queue an announcement for playback (non-blocking)."""
-        audio = self._audio_cache.get(name)
-        if audio is None:
-            return
+        """Queue an announcement for playback (non-blocking).
 
-        with self._queue_lock:
-            self._announcement_queue.append((name, False, None))
+        Announcements without an audio file are skipped by the worker.
+        """
+        with self._queue_ready:
+            self._announcement_queue.append((name, None, None))
+            self._queue_ready.notify()
 
-    def _play_sync(self, name: str, buffer_ms: int = 100) -> None:
+    def _play_sync(self, name: str, buffer_ms: int = 20) -> None:
         """Queue and play an announcement, blocking until complete.
 
         Used for announce_recording() to ensure the TTS finishes before
@@ -198,61 +307,119 @@ class TTSAnnouncer:
 
         Args:
             name: The announcement name (e.g., "recording")
-            buffer_ms: Extra delay after playback to ensure audio is flushed
+            buffer_ms: Extra delay after the output device reports the
+                audio as played, as a safety margin
         """
-        audio = self._audio_cache.get(name)
-        if audio is None:
-            return
-
-        # Create an event to signal completion
+        # Event the worker sets once this announcement has played
         completion_event = threading.Event()
+        entry = (name, buffer_ms, completion_event)
 
-        # Add to queue with blocking flag
-        with self._queue_lock:
+        # Restart the worker if it died, rather than queue behind nothing
+        self._start_worker()
+        with self._queue_ready:
             # Insert at front of queue for priority
-            self._announcement_queue.appendleft((name, True, buffer_ms))
-
-        # Wait for this announcement to complete
-        while True:
-            with self._queue_lock:
-                # Check if this is the current announcement being played
-                if self._announcement_queue:
-                    # Still in queue or being processed
+            self._announcement_queue.appendleft(entry)
+            self._queue_ready.notify()
+
+        # Wait for this announcement to complete. This runs on the GUI
+        # thread, so the wait is bounded: the clip itself plus time for the
+        # first-use load, the inter-announcement pause and a clip already
+        # playing
+        timeout = self._clip_seconds.get(name, 0.0) + SYNC_WAIT_MARGIN_S
+        if not completion_event.wait(timeout):
+            with self._queue_ready:
+                # Don't let it play late, once the microphone is open
+                try:
+                    self._announcement_queue.remove(entry)
+                except ValueError:
                     pass
-                elif not self._is_playing:
-                    # Queue empty and not playing, must be done
-                    break
+            print(f"TTS announcement '{name}' timed out after {timeout:.1f}s")
 
-            time.sleep(0.01)
+    # Playback callables return the seconds of audio still queued in the
+    # output device on return, and fail silently
+
+    def _play_wave_object(self, wave_obj) -> float:
+        """Play a simpleaudio WaveObject; returns once playback is done."""
+        try:
+            wave_obj.play().wait_done()
+        except Exception:
+            pass
+        return 0.0
+
+    def _play_pcm(self, audio: memoryview) -> float:
+        """Write PCM samples to the shared PyAudio stream.
+
+        Returns:
+            The stream's output latency, i.e. how much is still to be heard
+        """
+        with self._pa_lock:
+            try:
+                if self._pa_stream is None:
+                    self._pa = pyaudio.PyAudio()
+                    if self._pa_output_index is None:
+                        self._pa_output_index = self._resolve_output_device(self._pa)
+                    self._pa_stream = self._pa.open(
+                        format=_PA_INT16,
+                        channels=1,
+                        rate=self._sample_rate,
+                        output=True,
+                        output_device_index=self._pa_output_index,
+                    )
+                self._pa_stream.write(audio)
+                return max(0.0, self._pa_stream.get_output_latency())
+            except Exception:
+                # Drop the stream so the next announcement reopens it
+                self._close_output_stream_locked()
+        return 0.0
+
+    @staticmethod
+    def _resolve_output_device(pa) -> Optional[int]:
+        """Find the output device index for announcements.
+
+        Uses the device named in config.audio_output_device if it has output
+        channels, otherwise the PortAudio default output device. The result
+        is kept for the life of the announcer, so later stream opens don't
+        repeat the lookup.
+        """
+        try:
+            try:
+                from .config import load_config
+            except ImportError:
+                from config import load_config
+            wanted = load_config().audio_output_device
+        except Exception:
+            wanted = ""
 
-    def _play_audio(self, name: str, audio) -> None:
-        """Play audio data."""
-        if HAS_SIMPLEAUDIO and isinstance(audio, sa.WaveObject):
+        try:
+            if wanted:
+                for i in range(pa.get_device_count()):
+                    info = pa.get_device_info_by_index(i)
+                    if info.get("maxOutputChannels", 0) > 0 and info.get("name") == wanted:
+                        return i
+            return pa.get_default_output_device_info()["index"]
+        except Exception:
+            return None
+
+    def _close_output_stream(self) -> None:
+        """Close the shared PyAudio output stream, if open."""
+        with self._pa_lock:
+            self._close_output_stream_locked()
+
+    def _close_output_stream_locked(self) -> None:
+        """Close the shared PyAudio output stream (caller holds _pa_lock)."""
+        if self._pa_stream is not None:
             try:
-                play_obj = audio.play()
-                play_obj.wait_done()
-                return
+                self._pa_stream.stop_stream()
+                self._pa_stream.close()
             except Exception:
                 pass
-
-        if HAS_PYAUDIO and isinstance(audio, bytes):
+            self._pa_stream = None
+        if self._pa is not None:
             try:
-                p = pyaudio.PyAudio()
-                stream = p.open(
-                    format=pyaudio.paInt16,
-                    channels=1,
-                    rate=self._sample_rate,
-                    output=True
-                )
-                stream.write(audio)
-                stream.stop_stream()
-                stream.close()
-                p.terminate()
-                return
+                self._pa.terminate()
             except Exception:
                 pass
-
-        # If no audio backend available, silently fail
+            self._pa = None
 
     # -------------------------------------------------------------------------
     # Recording state announcements
@@ -1,11 +1,13 @@
 """Shared UI utility functions for Voice Notepad V3.
 
-Contains common icon loading functions used across multiple widgets.
+Contains common icon and font helpers used across multiple widgets.
 """
 
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 
-from PyQt6.QtGui import QIcon
+from PyQt6.QtGui import QFont, QIcon
 
 
 def get_icons_dir() -> Path:
@@ -13,6 +15,45 @@ def get_icons_dir() -> Path:
     return Path(__file__).parent / "icons"
 
 
+@lru_cache(maxsize=None)
+def get_font(family: str, point_size: int, weight: Optional[QFont.Weight] = None) -> QFont:
+    """Get a shared QFont for the given family, size and weight.
+
+    Fonts are created on first use (after QApplication exists) and reused,
+    so repeated titles don't each go through the font database.
+    """
+    if weight is None:
+        return QFont(family, point_size)
+    return QFont(family, point_size, weight)
+
+
+def get_title_font() -> QFont:
+    """Get the standard section title font (Sans 14 bold)."""
+    return get_font("Sans", 14, QFont.Weight.Bold)
+
+
+@lru_cache(maxsize=None)
+def _icon_from_file(icon_filename: str) -> QIcon:
+    """Get a shared QIcon for a file in the icons directory.
+
+    QIcon only records the path here; Qt decodes the image the first time
+    it's painted and keeps the pixmap in QPixmapCache. Every caller asking
+    for the same file gets the same QIcon, so it's decoded once.
+    """
+    icon_path = get_icons_dir() / icon_filename
+    if icon_path.exists():
+        return QIcon(str(icon_path))
+    return QIcon()
+
+
+# Provider name -> icon file
+_PROVIDER_ICON_FILES = {
+    "openrouter": "or_icon.png",
+    "gemini": "gemini_icon.png",
+    "google": "gemini_icon.png",
+}
+
+
 def get_provider_icon(provider: str) -> QIcon:
     """Get the icon for a given provider.
 
@@ -22,17 +63,9 @@ def get_provider_icon(provider: str) -> QIcon:
     Returns:
         QIcon for the provider, or empty QIcon if not found
     """
-    icons_dir = get_icons_dir()
-    icon_map = {
-        "openrouter": "or_icon.png",
-        "gemini": "gemini_icon.png",
-        "google": "gemini_icon.png",
-    }
-    icon_filename = icon_map.get(provider.lower(), "")
+    icon_filename = _PROVIDER_ICON_FILES.get(provider.lower())
     if icon_filename:
-        icon_path = icons_dir / icon_filename
-        if icon_path.exists():
-            return QIcon(str(icon_path))
+        return _icon_from_file(icon_filename)
     return QIcon()
 
 
@@ -45,16 +78,9 @@ def get_model_icon(model_id: str) -> QIcon:
     Returns:
         QIcon for the model, or empty QIcon if not found
     """
-    icons_dir = get_icons_dir()
     model_lower = model_id.lower()
 
     # All models are now Gemini-based
     if model_lower.startswith("google/") or model_lower.startswith("gemini"):
-        icon_filename = "gemini_icon.png"
-    else:
-        return QIcon()
-
-    icon_path = icons_dir / icon_filename
-    if icon_path.exists():
-        return QIcon(str(icon_path))
+        return _icon_from_file("gemini_icon.png")
     return QIcon()